@@ -0,0 +1,216 @@
+"""A read-only JSON API over the bot's in-memory poll state, for dashboards and ops scripts.
+
+Served from the bot's own event loop with aiohttp (which discord.py already
+depends on), so readers see exactly what the cog sees instead of racing
+save_polls() for data/polls.json. Off unless HTTP_API_PORT is set, and bound to
+localhost by default.
+
+    GET /api/guilds/{guild_id}/polls      the guild's polls and their pending jobs
+    GET /api/guilds/{guild_id}/upcoming   the guild's next sends, soonest first
+    GET /api/polls/{poll_id}/tally        who has voted so far, for polls tracked live
+    GET /api/scheduler                    scheduler and setup-session counters, next fire time
+
+Every response carries an ETag. Bodies are cached against counters the cog bumps
+as things change (its save count, the scheduler's activity, a tally's vote
+count), so a client polling with If-None-Match gets a 304 without any poll being
+looked at, let alone serialized.
+"""
+from discord.ext import commands
+from aiohttp import web
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import pytz
+
+from cogs.poll_recurrence import describe_recurrence
+
+HTTP_API_HOST = os.getenv("HTTP_API_HOST", "127.0.0.1")
+# 0 leaves the API off
+HTTP_API_PORT = int(os.getenv("HTTP_API_PORT", "0"))
+# When set, requests need "Authorization: Bearer <token>"
+HTTP_API_TOKEN = os.getenv("HTTP_API_TOKEN", "")
+
+UPCOMING_LIMIT = 50
+CACHED_RESPONSES = 1024
+
+
+def _time(dt):
+    return dt.astimezone(pytz.utc).isoformat() if dt else None
+
+
+def _etag_matches(header, etag):
+    if not header:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in header.split(",")]
+    return "*" in tags or etag in tags
+
+
+class HttpApi(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.runner = None
+        self._responses = OrderedDict()  # path -> (state key, ETag, body), least recently used first
+        self._by_guild = (None, {})  # (state key, {guild ID: [polls]}) for the listings
+        self.requests = 0
+        self.not_modified = 0
+
+    async def cog_load(self):
+        if not HTTP_API_PORT:
+            return
+        app = web.Application(middlewares=[self._authorize])
+        app.add_routes([
+            web.get("/api/guilds/{guild_id:\\d+}/polls", self.guild_polls),
+            web.get("/api/guilds/{guild_id:\\d+}/upcoming", self.guild_upcoming),
+            web.get("/api/polls/{poll_id}/tally", self.poll_tally),
+            web.get("/api/scheduler", self.scheduler_status),
+        ])
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, HTTP_API_HOST, HTTP_API_PORT).start()
+        print(f"[HTTP API] Serving on http://{HTTP_API_HOST}:{HTTP_API_PORT}/api/")
+
+    async def cog_unload(self):
+        if self.runner:
+            await self.runner.cleanup()
+            self.runner = None
+
+    @web.middleware
+    async def _authorize(self, request, handler):
+        if HTTP_API_TOKEN and request.headers.get("Authorization") != f"Bearer {HTTP_API_TOKEN}":
+            return web.json_response({"error": "unauthorized"}, status=401)
+        return await handler(request)
+
+    def _polls_cog(self):
+        polls = self.bot.get_cog("Polls")
+        if polls is None:
+            raise web.HTTPServiceUnavailable(text='{"error": "polls are not loaded"}', content_type="application/json")
+        return polls
+
+    def _respond(self, request, key, build):
+        """Answer from the cached body for this path while `key` is unchanged, or
+        rebuild it with build(). A matching If-None-Match gets a 304."""
+        self.requests += 1
+        path = request.path
+        cached = self._responses.get(path)
+        if cached is None or cached[0] != key:
+            body = json.dumps(build(), separators=(",", ":")).encode()
+            etag = f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+            cached = (key, etag, body)
+            self._responses[path] = cached
+            if len(self._responses) > CACHED_RESPONSES:
+                self._responses.popitem(last=False)
+        self._responses.move_to_end(path)
+        _, etag, body = cached
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("If-None-Match"), etag):
+            self.not_modified += 1
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    @staticmethod
+    def _state_key(polls):
+        return id(polls), polls.revision, polls.scheduler.revision
+
+    def _guild_polls(self, polls, guild_id):
+        """The guild's polls, from a grouping of all polls rebuilt at most once per change."""
+        key = self._state_key(polls)
+        if self._by_guild[0] != key:
+            by_guild = {}
+            for poll in polls.polls.values():
+                by_guild.setdefault(poll.guild_id, []).append(poll)
+            self._by_guild = (key, by_guild)
+        return self._by_guild[1].get(guild_id, [])
+
+    async def guild_polls(self, request):
+        polls = self._polls_cog()
+        guild_id = int(request.match_info["guild_id"])
+
+        def build():
+            listing = []
+            for poll in self._guild_polls(polls, guild_id):
+                send = polls.scheduler.entry(poll.id, "send")
+                resolve = polls.scheduler.entry(poll.id, "resolve")
+                listing.append({
+                    "id": poll.id,
+                    "question": poll.question,
+                    "options": [o.label for o in poll.options],
+                    "status": poll.status,
+                    "channel_id": str(poll.target_channel_id),
+                    "message_id": str(poll.active_message_id) if poll.active_message_id else None,
+                    "next_send_time": _time(poll.next_send_time),
+                    "repeats": describe_recurrence(poll.schedule_cron) if poll.recurring and poll.schedule_cron else None,
+                    "tally_method": poll.tally_method,
+                    "early_close": bool(poll.early_close),
+                    "tiebreaker": bool(poll.is_tiebreaker),
+                    "jobs": {"send": _time(send[0]) if send else None,
+                             "resolve": _time(resolve[0]) if resolve else None},
+                })
+            return {"guild_id": str(guild_id), "polls": listing}
+
+        return self._respond(request, self._state_key(polls), build)
+
+    async def guild_upcoming(self, request):
+        polls = self._polls_cog()
+        guild_id = int(request.match_info["guild_id"])
+
+        def build():
+            now = polls.scheduler.clock()
+            sends = [(send, poll) for poll in self._guild_polls(polls, guild_id)
+                     for send in polls._upcoming_sends(poll, now)]
+            sends.sort(key=lambda s: s[0])
+            return {"guild_id": str(guild_id), "sends": [
+                {"time": _time(send), "poll_id": poll.id, "question": poll.question,
+                 "channel_id": str(poll.target_channel_id)}
+                for send, poll in sends[:UPCOMING_LIMIT]]}
+
+        return self._respond(request, self._state_key(polls), build)
+
+    async def poll_tally(self, request):
+        polls = self._polls_cog()
+        poll = polls.polls.get(request.match_info["poll_id"])
+        if poll is None:
+            return web.json_response({"error": "no such poll"}, status=404)
+        tally = polls.tallies.get(poll.id)
+        if tally is None or poll.status != "active":
+            return web.json_response({"error": "this poll isn't being tallied live; only active polls that "
+                                               "close early or count by rank are"}, status=404)
+
+        def build():
+            counts = dict.fromkeys((o.emoji for o in poll.options), 0)
+            for emojis in tally.votes.values():
+                for emoji in emojis:
+                    counts[emoji] += 1
+            return {
+                "poll_id": poll.id,
+                "message_id": str(tally.message_id),
+                "voters": len(tally),
+                "options": [{"label": o.label, "emoji": o.emoji, "votes": counts[o.emoji]} for o in poll.options],
+                "expected": len(tally.expected),
+                "missing": len(tally.missing),
+                "quorum_at": _time(tally.quorum_at),
+            }
+
+        return self._respond(request, (id(tally), tally.version, len(tally.missing), tally.quorum_at), build)
+
+    async def scheduler_status(self, request):
+        polls = self._polls_cog()
+        sessions = polls.active_creations.stats()
+
+        def build():
+            stats = polls.scheduler.stats()
+            pending = {}
+            for _, action in polls.scheduler.keys():
+                pending[action] = pending.get(action, 0) + 1
+            return {**stats, "running": polls.scheduler.running, "pending_by_action": pending,
+                    "next_fire_time": _time(polls.scheduler.next_fire_time()),
+                    "outbox": len(polls.outbox), "polls": len(polls.polls), "tracked_tallies": len(polls.tallies),
+                    "setup_sessions": sessions}
+
+        key = (*self._state_key(polls), len(polls.outbox), len(polls.tallies), *sessions.values())
+        return self._respond(request, key, build)
+
+
+async def setup(bot):
+    await bot.add_cog(HttpApi(bot))
@@ -0,0 +1,98 @@
+"""Per-guild scheduling statistics, kept as running totals.
+
+Every resolved posting adds itself to its guild's aggregates: how it ended, how
+many votes it drew (a histogram over VOTE_BUCKETS plus a running sum), and, when
+it produced a session, the weekday and hour the session starts at, in the
+timezone its option was written in. Tiebreakers count separately, by how they
+ended. Each guild's aggregates are a fixed size, so recording a posting and
+reading the statistics back take the same time however much history there is.
+
+The aggregates are saved inside the poll snapshot, in the same write that
+finishes the posting, so a resolution retried after a crash can't be counted twice.
+"""
+import bisect
+from datetime import datetime
+
+import pytz
+
+# How a regular posting ended
+OUTCOMES = ("winner", "below_threshold", "tie", "lost")
+# How a tiebreaker ended; a tie there means no session
+TIEBREAKER_OUTCOMES = ("winner", "unresolved_tie", "lost")
+# Lower edges of the votes-per-posting histogram buckets
+VOTE_BUCKETS = (0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 30, 50, 100)
+HOURS_PER_WEEK = 7 * 24
+
+
+def _empty(since):
+    return {
+        "since": since,
+        "postings": 0,
+        "outcomes": dict.fromkeys(OUTCOMES, 0),
+        "tiebreakers": dict.fromkeys(TIEBREAKER_OUTCOMES, 0),
+        "votes": [0] * len(VOTE_BUCKETS),
+        "votes_total": 0,
+        "wins": [0] * HOURS_PER_WEEK,  # weekday * 24 + hour, Monday first
+    }
+
+
+def bucket_label(index):
+    low = VOTE_BUCKETS[index]
+    if index + 1 == len(VOTE_BUCKETS):
+        return f"{low}+"
+    high = VOTE_BUCKETS[index + 1] - 1
+    return str(low) if high == low else f"{low}-{high}"
+
+
+class PollAnalytics:
+    """{guild ID: aggregates}, as stored in the snapshot's "analytics" section."""
+
+    def __init__(self, data=None, clock=None):
+        self.clock = clock or (lambda: datetime.now(pytz.utc))
+        self.guilds = {int(g): stats for g, stats in (data or {}).items()}
+
+    def to_dict(self):
+        return {str(g): stats for g, stats in self.guilds.items()}
+
+    def get(self, guild_id):
+        return self.guilds.get(guild_id)
+
+    def _guild(self, guild_id):
+        stats = self.guilds.get(guild_id)
+        if stats is None:
+            stats = self.guilds[guild_id] = _empty(self.clock().isoformat())
+        return stats
+
+    def record(self, guild_id, outcome, votes=0, winner_start=None, winner_timezone=None, tiebreaker=False):
+        """Add one resolved posting (or tiebreaker). `winner_start` is the ISO start
+        time of the winning option, when it parsed as a time."""
+        stats = self._guild(guild_id)
+        if tiebreaker:
+            stats["tiebreakers"][outcome] = stats["tiebreakers"].get(outcome, 0) + 1
+        else:
+            stats["postings"] += 1
+            stats["outcomes"][outcome] = stats["outcomes"].get(outcome, 0) + 1
+            stats["votes"][bisect.bisect_right(VOTE_BUCKETS, votes) - 1] += 1
+            stats["votes_total"] += votes
+        if outcome == "winner" and winner_start:
+            start = datetime.fromisoformat(winner_start)
+            if winner_timezone:
+                start = start.astimezone(pytz.timezone(winner_timezone))
+            stats["wins"][start.weekday() * 24 + start.hour] += 1
+
+    @staticmethod
+    def top_slots(stats, count=5):
+        """[(weekday, hour, wins)] for the slots that won most often, most first."""
+        ranked = sorted(range(HOURS_PER_WEEK), key=lambda i: stats["wins"][i], reverse=True)[:count]
+        return [(i // 24, i % 24, stats["wins"][i]) for i in ranked if stats["wins"][i]]
+
+    @staticmethod
+    def median_votes_bucket(stats):
+        """The histogram bucket holding the median posting's votes, or None."""
+        half = stats["postings"] / 2
+        seen = 0
+        for index, count in enumerate(stats["votes"]):
+            seen += count
+            if count and seen >= half:
+                return index
+        return None
@@ -0,0 +1,102 @@
+import gzip
+import json
+import os
+import zlib
+from itertools import islice
+
+GZIP_MAGIC = b"\x1f\x8b\x08"
+READ_CHUNK = 1 << 16
+
+
+def append_polls(path, polls):
+    """Append polls to the archive as one gzip member of JSON lines.
+
+    Each call adds a new gzip member to the end of the file, so the archive is
+    never rewritten; gzip readers transparently concatenate the members. The member
+    is compressed in memory and written in one go, then synced, so a crash can at
+    worst leave a partial member at the very end, which iter_archive skips."""
+    if not polls:
+        return
+    text = "".join(json.dumps(poll, separators=(",", ":")) + "\n" for poll in polls)
+    member = gzip.compress(text.encode("utf-8"))
+    with open(path, "ab") as f:
+        f.write(member)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _next_header(f, offset):
+    """Offset of the first gzip member header after `offset`, or None."""
+    position = offset + 1
+    tail = b""
+    while True:
+        f.seek(position)
+        chunk = f.read(READ_CHUNK)
+        if not chunk:
+            return None
+        found = (tail + chunk).find(GZIP_MAGIC)
+        if found >= 0:
+            return position - len(tail) + found
+        tail = chunk[-(len(GZIP_MAGIC) - 1):]
+        position += len(chunk)
+
+
+def _members(f, path):
+    """Yield the decompressed bytes of each intact gzip member in turn. A member that's
+    damaged or cut short is logged and skipped, resuming at the next member header."""
+    offset = 0
+    while True:
+        f.seek(offset)
+        decompressor = zlib.decompressobj(wbits=31)
+        parts = []
+        read = 0
+        try:
+            while not decompressor.eof:
+                chunk = f.read(READ_CHUNK)
+                if not chunk:
+                    break
+                read += len(chunk)
+                parts.append(decompressor.decompress(chunk))
+        except zlib.error as e:
+            error = e
+        else:
+            if decompressor.eof:
+                yield b"".join(parts)
+                offset += read - len(decompressor.unused_data)
+                continue
+            if read == 0:
+                return
+            error = "member cut short"
+        resume = _next_header(f, offset)
+        end = resume if resume is not None else f.seek(0, os.SEEK_END)
+        print(f"[Archive] Skipped {end - offset} damaged bytes at offset {offset} of {path} ({error})")
+        if resume is None:
+            return
+        offset = resume
+
+
+def iter_archive(path, guild_id=None):
+    """Yield archived polls oldest-first, optionally for one guild.
+
+    Members are read one at a time and yielded once their checksum is verified; a
+    member left damaged by a crash mid-append is skipped (and logged) rather than
+    hiding everything appended after it."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        for member in _members(f, path):
+            for line in member.decode("utf-8").splitlines():
+                poll = json.loads(line)
+                if guild_id is None or poll.get("guild_id") == guild_id:
+                    yield poll
+
+
+def read_page(path, guild_id, page, page_size):
+    """Return (polls, has_more) for a 1-based page of a guild's archive without loading the rest."""
+    entries = iter_archive(path, guild_id)
+    start = (page - 1) * page_size
+    chunk = list(islice(entries, start, start + page_size + 1))
+    entries.close()
+    return chunk[:page_size], len(chunk) > page_size
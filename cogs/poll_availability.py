@@ -0,0 +1,185 @@
+"""Members' weekly availability, and the session times that suit the most of them.
+
+Each member stores weekly windows in their own timezone as
+(weekday, start minute, end minute), weekday 0 being Monday. A window may end past
+midnight (end > 1440) and then runs into the next day.
+
+Finding slots expands every window into absolute intervals over the horizon (so DST
+is handled per member) and merges each member's. A session starting at a slot
+boundary fits a member's interval (a, b) if it starts in [a, b - length], so each
+interval adds that run of start positions to a difference array. One prefix sum
+then gives how many members are free for the whole of a session starting at every
+slot boundary. With NumPy installed (optional) the difference array and its prefix
+sum are built with bincount and cumsum; without it, in a Python loop with the same
+results. Expanding the windows is Python either way and takes most of the time:
+about 20 ms for 500 members over four weeks, of which NumPy saves around a tenth
+(scripts/bench_poll_availability.py).
+"""
+import itertools
+import json
+import math
+import os
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+import pytz
+
+try:
+    import numpy
+except ImportError:  # optional; the difference array falls back to pure Python
+    numpy = None
+
+SLOT_MINUTES = 30
+DAY_NAMES = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+
+class AvailabilityStore:
+    """Per-guild weekly availability, saved to a JSON file after every change:
+    {guild_id: {user_id: {"timezone": name, "windows": [[weekday, start, end], ...]}}}"""
+
+    def __init__(self, path):
+        self.path = path
+        self.guilds = {}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except json.JSONDecodeError as e:
+            print(f"[Availability] Could not read {self.path} ({e}); starting empty")
+            return
+        self.guilds = {int(g): {int(u): s for u, s in members.items()} for g, members in data.items()}
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(self.guilds, separators=(",", ":")))
+        os.replace(tmp_path, self.path)
+
+    def get(self, guild_id, user_id):
+        return self.guilds.get(guild_id, {}).get(user_id)
+
+    def set(self, guild_id, user_id, timezone, windows):
+        self.guilds.setdefault(guild_id, {})[user_id] = {"timezone": timezone, "windows": [list(w) for w in windows]}
+        self.save()
+
+    def clear(self, guild_id, user_id):
+        """Forget a member's availability. Returns False if there was none."""
+        members = self.guilds.get(guild_id, {})
+        if members.pop(user_id, None) is None:
+            return False
+        if not members:
+            del self.guilds[guild_id]
+        self.save()
+        return True
+
+    def schedules(self, guild_id, user_ids=None):
+        """{user_id: schedule} for the guild, optionally only for the given members."""
+        members = self.guilds.get(guild_id, {})
+        if user_ids is None:
+            return dict(members)
+        return {u: members[u] for u in user_ids if u in members}
+
+
+def describe_windows(schedule):
+    """"Fri 19:00-23:00, Sat 12:00-18:00 (US/Eastern)"."""
+    parts = []
+    for weekday, start, end in sorted(schedule["windows"]):
+        parts.append(f"{DAY_NAMES[weekday]} {start // 60 % 24}:{start % 60:02d}-{end // 60 % 24}:{end % 60:02d}")
+    return f"{', '.join(parts)} ({schedule['timezone']})"
+
+
+@lru_cache(maxsize=65536)
+def _local_timestamp(tz_name, day_ordinal, minute):
+    """Timestamp of a local wall-clock minute past midnight on a given day. Members
+    mostly share a few timezones and start times, so this is nearly always a cache hit."""
+    local = datetime.fromordinal(day_ordinal) + timedelta(minutes=minute)
+    return pytz.timezone(tz_name).localize(local).timestamp()
+
+
+def member_intervals(schedule, start_ts, end_ts):
+    """One member's windows merged into intervals within [start_ts, end_ts), as a flat
+    list of timestamps: start, end, start, end..."""
+    tz_name = schedule["timezone"]
+    tz = pytz.timezone(tz_name)
+    first = datetime.fromtimestamp(start_ts, tz).date().toordinal() - 1  # windows from the day before can run over
+    last = datetime.fromtimestamp(end_ts, tz).date().toordinal()
+    by_weekday = [[] for _ in range(7)]
+    for weekday, start, end in schedule["windows"]:
+        by_weekday[weekday].append((start, end))
+
+    intervals = []
+    for ordinal in range(first, last + 1):
+        for start, end in by_weekday[(ordinal - 1) % 7]:  # ordinal 1 (0001-01-01) was a Monday
+            a = max(_local_timestamp(tz_name, ordinal, start), start_ts)
+            b = min(_local_timestamp(tz_name, ordinal, end), end_ts)
+            if a < b:
+                intervals.append((a, b))
+    intervals.sort()
+    merged = []
+    for a, b in intervals:
+        if merged and a <= merged[-1]:
+            if b > merged[-1]:
+                merged[-1] = b
+        else:
+            merged.append(a)
+            merged.append(b)
+    return merged
+
+
+def session_counts(schedules, start, days, length_minutes, slot_minutes=SLOT_MINUTES):
+    """How many members are free for the whole of a `length_minutes` session starting
+    at each slot boundary from `start`, for sessions that end within `days` days."""
+    slot_seconds = slot_minutes * 60
+    length_seconds = length_minutes * 60
+    start_ts = start.timestamp()
+    end_ts = start_ts + days * 86400
+    positions = math.floor((end_ts - length_seconds - start_ts) / slot_seconds) + 1
+    if positions <= 0:
+        return []
+    bounds = []
+    for schedule in schedules:
+        bounds += member_intervals(schedule, start_ts, end_ts)
+    if numpy is not None:
+        bounds = numpy.array(bounds, dtype=numpy.float64)
+        # Start positions whose whole session fits inside each interval
+        first = numpy.ceil((bounds[0::2] - start_ts) / slot_seconds).astype(numpy.int64)
+        last = numpy.floor((bounds[1::2] - length_seconds - start_ts) / slot_seconds).astype(numpy.int64)
+        fits = first <= last
+        diff = (numpy.bincount(first[fits], minlength=positions + 1)
+                - numpy.bincount(last[fits] + 1, minlength=positions + 1))
+        return numpy.cumsum(diff[:positions]).tolist()
+
+    diff = [0] * (positions + 1)
+    for a, b in zip(bounds[0::2], bounds[1::2]):
+        first = math.ceil((a - start_ts) / slot_seconds)
+        last = math.floor((b - length_seconds - start_ts) / slot_seconds)
+        if first <= last:
+            diff[first] += 1
+            diff[last + 1] -= 1
+    return list(itertools.accumulate(diff[:positions]))
+
+
+def best_slots(schedules, start, days=14, length_minutes=180, count=5, slot_minutes=SLOT_MINUTES):
+    """The `count` session start times from `start` onwards that the most members are
+    free for, for the whole `length_minutes`. Sessions don't overlap one another; ties
+    go to the earliest. Returns [(aware UTC datetime, members free)], soonest first."""
+    schedules = list(schedules)
+    if not schedules:
+        return []
+    # Start on a slot boundary
+    start = start.astimezone(pytz.utc)
+    start += timedelta(minutes=-start.minute % slot_minutes, seconds=-start.second, microseconds=-start.microsecond)
+    width = max(1, math.ceil(length_minutes / slot_minutes))
+    free = session_counts(schedules, start, days, length_minutes, slot_minutes)
+
+    chosen = []
+    for i in sorted(range(len(free)), key=lambda i: (-free[i], i)):
+        if not free[i] or len(chosen) == count:
+            break
+        if all(abs(i - j) >= width for j in chosen):
+            chosen.append(i)
+    return [(start + timedelta(minutes=i * slot_minutes), free[i]) for i in sorted(chosen)]
@@ -0,0 +1,100 @@
+"""The Discord scheduled events the bot has created for winning poll options.
+
+Entries are keyed by "<poll ID>:<cycle>", one per resolved posting of a poll, so
+resolving the same posting again edits or keeps its event instead of creating a
+second one. The cache is saved to a JSON file after every change, and the cog keeps
+it current from guild scheduled-event gateway events: events that are deleted,
+finish or are cancelled are dropped.
+
+Each event's description carries its poll's short ID (EVENT_MARKER), so an event
+whose creation was never recorded (the bot stopped, or the response was lost) can
+still be recognized and adopted instead of duplicated.
+"""
+import json
+import os
+import re
+from datetime import datetime, timedelta
+
+EVENT_MARKER = "Poll ID: {short_id}"
+EVENT_MARKER_RE = re.compile(r"Poll ID: ([0-9a-f]{8})")
+
+# Entries for events that started longer ago than this are dropped at load, in case
+# their end was never seen
+KEEP_DAYS = 30
+
+
+def event_key(poll_id, cycle):
+    return f"{poll_id}:{cycle}"
+
+
+def event_marker(poll_id):
+    return EVENT_MARKER.format(short_id=poll_id[:8])
+
+
+class EventCache:
+    """{"<poll ID>:<cycle>": {"event_id", "guild_id", "start_time"}}, with a reverse
+    index from event ID so gateway events find their entry in O(1)."""
+
+    def __init__(self, path, clock):
+        self.path = path
+        self.clock = clock
+        self.entries = {}
+        self.by_event = {}  # event ID -> key
+        self.load()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except json.JSONDecodeError as e:
+            print(f"[Events] Could not read {self.path} ({e}); starting empty")
+            return
+        cutoff = self.clock() - timedelta(days=KEEP_DAYS)
+        self.entries = {k: e for k, e in data.items() if datetime.fromisoformat(e["start_time"]) >= cutoff}
+        self.by_event = {e["event_id"]: k for k, e in self.entries.items()}
+        if len(self.entries) < len(data):
+            self.save()
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(self.entries, separators=(",", ":")))
+        os.replace(tmp_path, self.path)
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    def key_for(self, event_id):
+        return self.by_event.get(event_id)
+
+    def record(self, key, event, save=True):
+        """Remember (or update) the event created for a poll posting."""
+        old = self.entries.get(key)
+        if old is not None and old["event_id"] != event.id:
+            self.by_event.pop(old["event_id"], None)
+        # An event adopted from an earlier posting moves to this one
+        previous = self.by_event.get(event.id)
+        if previous is not None and previous != key:
+            del self.entries[previous]
+        entry = {"event_id": event.id, "guild_id": event.guild_id, "start_time": event.start_time.isoformat()}
+        if entry == old:
+            return
+        self.entries[key] = entry
+        self.by_event[event.id] = key
+        if save:
+            self.save()
+
+    def forget(self, event_id, save=True):
+        """Drop the entry for an event that's gone or over. Returns False if there was none."""
+        key = self.by_event.pop(event_id, None)
+        if key is None:
+            return False
+        del self.entries[key]
+        if save:
+            self.save()
+        return True
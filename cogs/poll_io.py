@@ -0,0 +1,87 @@
+"""Polls as rows of a JSON or CSV file, for bulk import and export.
+
+Each row holds the answers the setup form and pickers would collect:
+
+    question        required
+    options         a list, or one string split like the form's (one per line or comma-separated)
+    send_time       required; anything the form accepts, or an ISO timestamp
+    repeat          a repeat schedule as typed in the form ("every Monday at 9am EST")
+    schedule_cron   instead of repeat, the stored schedule dict (what export writes)
+    timezone        the poll's timezone, for send_time, repeat and option times that don't name one
+    duration        "24 hours", "2 days", or a number of hours; defaults to 24 hours
+    channel         channel ID, <#mention> or name; defaults to where the import ran
+    ping            "@everyone" (default), "@here", a <@&role> mention, or "" for none
+    threshold       minimum votes per option; defaults to 0
+    early_close     true/false
+    tally_method    "approval", "irv" or "schulze"; empty counts reactions
+
+In CSV, options are one per line within the cell and schedule_cron is JSON.
+"""
+import csv
+import io
+import json
+
+FIELDS = ("question", "options", "send_time", "repeat", "schedule_cron", "timezone", "duration",
+          "channel", "ping", "threshold", "early_close", "tally_method")
+
+
+def read_rows(raw, filename=""):
+    """Rows from an uploaded file's bytes, as dicts. CSV unless the file is named .json
+    or starts like JSON. Raises ValueError describing what's wrong with the file."""
+    try:
+        text = raw.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise ValueError("The file isn't UTF-8 text.")
+    if filename.lower().endswith(".json") or text.lstrip()[:1] in ("[", "{"):
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"The JSON couldn't be read: {e}")
+        rows = data.get("polls") if isinstance(data, dict) else data
+        if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+            raise ValueError('Expected a list of polls, or {"polls": [...]}.')
+        return rows
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames or "question" not in reader.fieldnames:
+        raise ValueError("The CSV needs a header row with at least a `question` column.")
+    return [{k: v for k, v in row.items() if k and v not in (None, "")} for row in reader]
+
+
+def truthy(value):
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "yes", "y", "1", "on")
+    return bool(value)
+
+
+def poll_to_row(poll):
+    """A live poll as an import row that recreates it."""
+    row = {
+        "question": poll.question,
+        "options": [o.label for o in poll.options],
+        "send_time": poll.next_send_time.isoformat(),
+        "schedule_cron": poll.schedule_cron if poll.recurring else None,
+        "timezone": poll.schedule_timezone,
+        "duration": poll.poll_duration_hours,
+        "channel": poll.target_channel_id,
+        "ping": poll.ping_target,
+        "threshold": poll.vote_threshold,
+        "early_close": bool(poll.early_close),
+        "tally_method": poll.tally_method,
+    }
+    return {k: v for k, v in row.items() if v is not None}
+
+
+def write_rows(rows, fmt):
+    """Rows as the text of a .json or .csv file."""
+    if fmt == "json":
+        return json.dumps({"polls": rows}, indent=2, ensure_ascii=False)
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=FIELDS, extrasaction="ignore")
+    writer.writeheader()
+    for row in rows:
+        cells = dict(row)
+        cells["options"] = "\n".join(row.get("options", []))
+        if row.get("schedule_cron"):
+            cells["schedule_cron"] = json.dumps(row["schedule_cron"], separators=(",", ":"))
+        writer.writerow(cells)
+    return out.getvalue()
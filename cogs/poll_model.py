@@ -0,0 +1,158 @@
+import sys
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import datetime
+
+import pytz
+
+DEFAULT_TIMEZONE = "US/Eastern"
+
+
+@dataclass(slots=True)
+class PollOption:
+    label: str
+    emoji: str
+    start_time: datetime = None  # when the option's session starts, if the label parsed as a time
+    timezone: str = None  # the timezone start_time was given in, kept so it rolls forward across DST
+    extra: dict = None  # keys this model doesn't know about, kept for round-tripping
+
+
+@dataclass(slots=True)
+class Poll:
+    """One stored poll. Timestamps are aware datetimes, parsed once at load time.
+
+    A decoded poll remembers which keys its stored dict had (`stored_keys`), and
+    encoding writes those keys plus any whose value has since left its default, so
+    a poll encodes to exactly the keys it was decoded from until the cog changes it.
+    Polls built in code write the usual keys, leaving out optional ones that are None.
+
+    The one migration: legacy naive timestamps are read as times in the poll's
+    schedule timezone and written back with that offset."""
+
+    id: str
+    guild_id: int
+    channel_id: int
+    creator_id: int
+    question: str
+    options: list
+    post_channel_id: int = None
+    ping_target: str = "@everyone"
+    vote_threshold: int = 0
+    schedule_cron: dict = None
+    schedule_timezone: str = DEFAULT_TIMEZONE
+    next_send_time: datetime = None
+    poll_duration_hours: float = 24
+    status: str = "scheduled"
+    active_message_id: int = None
+    recurring: bool = False
+    created_at: datetime = None
+    completed_at: datetime = None
+    is_tiebreaker: bool = None
+    parent_poll_id: str = None
+    early_close: bool = None  # resolve once everyone pinged has voted
+    tally_method: str = None  # "approval", "irv" or "schulze"; None counts reactions
+    extra: dict = None
+    stored_keys: frozenset = field(default=None, compare=False)  # model keys the decoded dict had
+
+    @property
+    def target_channel_id(self):
+        """The channel the poll posts in; older polls only have the setup channel."""
+        return self.post_channel_id or self.channel_id
+
+    @property
+    def tz(self):
+        return pytz.timezone(self.schedule_timezone)
+
+
+# Keys always written, in the order the cog has always written them
+_REQUIRED_KEYS = ("id", "guild_id", "channel_id", "creator_id", "question", "options",
+                  "ping_target", "vote_threshold", "schedule_cron", "schedule_timezone", "next_send_time",
+                  "poll_duration_hours", "status", "active_message_id", "recurring")
+_OPTIONAL_KEYS = ("post_channel_id", "is_tiebreaker", "parent_poll_id", "created_at", "completed_at",
+                  "early_close", "tally_method")
+_DATETIME_KEYS = frozenset(("next_send_time", "created_at", "completed_at"))
+_POLL_KEYS = frozenset(f.name for f in fields(Poll)) - {"extra", "stored_keys"}
+_DEFAULTS = {f.name: f.default for f in fields(Poll) if f.default is not MISSING}
+# Polls mostly share a handful of key sets, so each is kept once
+_KEY_SETS = {}
+_OPTION_KEYS = frozenset(("label", "emoji", "start_time", "timezone"))
+_INTERNED_KEYS = frozenset(("status", "ping_target", "schedule_timezone", "tally_method"))
+
+
+def _intern(text):
+    return sys.intern(text) if isinstance(text, str) else text
+
+
+def _parse_time(value, tz_name):
+    if value is None or isinstance(value, datetime):
+        return value
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        # Legacy naive timestamps are in the poll's schedule timezone; they're
+        # written back with its offset
+        parsed = pytz.timezone(tz_name).localize(parsed)
+    return parsed
+
+
+def option_from_dict(data):
+    if len(data) == 2:
+        # Fast path for the usual {label, emoji} option
+        return PollOption(sys.intern(data["label"]), sys.intern(data["emoji"]))
+    extra = {k: v for k, v in data.items() if k not in _OPTION_KEYS}
+    timezone = data.get("timezone")
+    return PollOption(sys.intern(data["label"]), sys.intern(data["emoji"]),
+                      _parse_time(data.get("start_time"), timezone or DEFAULT_TIMEZONE),
+                      _intern(timezone), extra or None)
+
+
+def option_to_dict(option):
+    data = {"label": option.label, "emoji": option.emoji}
+    if option.start_time is not None:
+        data["start_time"] = option.start_time.isoformat()
+    if option.timezone is not None:
+        data["timezone"] = option.timezone
+    if option.extra:
+        data.update(option.extra)
+    return data
+
+
+def poll_from_dict(data):
+    """Decode a poll from the JSON schema stored in data/polls.json."""
+    tz_name = data.get("schedule_timezone", DEFAULT_TIMEZONE)
+    values = {}
+    extra = None
+    for key, value in data.items():
+        if key not in _POLL_KEYS:
+            if extra is None:
+                extra = {}
+            extra[key] = value
+        elif key in _DATETIME_KEYS:
+            values[key] = _parse_time(value, tz_name)
+        elif key in _INTERNED_KEYS:
+            values[key] = _intern(value)
+        else:
+            values[key] = value
+    values["options"] = [option_from_dict(o) for o in data["options"]]
+    stored_keys = frozenset(values)
+    return Poll(**values, extra=extra, stored_keys=_KEY_SETS.setdefault(stored_keys, stored_keys))
+
+
+def poll_to_dict(poll):
+    """Encode a poll back to the JSON schema. poll_from_dict(poll_to_dict(p)) == p,
+    and poll_to_dict(poll_from_dict(d)) == d for a dict with aware timestamps."""
+    data = {}
+    stored = poll.stored_keys
+    for key in _REQUIRED_KEYS:
+        value = getattr(poll, key)
+        if stored is None or key in stored or value != _DEFAULTS.get(key, MISSING):
+            data[key] = value
+    for key in _OPTIONAL_KEYS:
+        value = getattr(poll, key)
+        if value is not None or (stored is not None and key in stored):
+            data[key] = value
+    for key in _DATETIME_KEYS & data.keys():
+        if data[key] is not None:
+            data[key] = data[key].isoformat()
+    data["options"] = [option_to_dict(o) for o in poll.options]
+    if poll.extra:
+        data.update(poll.extra)
+    return data
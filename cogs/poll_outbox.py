@@ -0,0 +1,157 @@
+import asyncio
+import json
+import os
+import random
+import traceback
+
+# Completed keys are remembered this long so a resolution that runs twice
+# (e.g. after a crash before its poll was saved) doesn't repeat its effects.
+KEEP_DONE_SECONDS = 14 * 24 * 3600
+MAX_FAILED_KEPT = 100
+
+
+class PermanentFailure(Exception):
+    """Raised by a handler when retrying can't help; the entry moves to the failed list."""
+
+
+class Outbox:
+    """Durable queue of side effects (Discord messages, events, state changes) that must
+    eventually happen exactly once.
+
+    Entries are keyed by an idempotency key: adding a key that is pending or already
+    done is a no-op. drain() runs every due entry's handler; an entry whose handler
+    raises is retried with exponential backoff until it succeeds, raises one of the
+    `permanent` exception types (or PermanentFailure), or runs out of attempts.
+    Errors of the `transient` types (an outage, a dropped connection) don't use up
+    attempts: those entries retry every max_delay for as long as it takes. An entry
+    that's given up on is passed to `on_give_up`, so its owner can still move on.
+
+    Drains run one at a time: a drain started while another is still waiting on a
+    handler waits its turn, then sees only what's still pending, so no entry runs twice.
+
+    Everything is written to a JSON file after each change, so pending effects survive
+    a restart."""
+
+    def __init__(self, path, handlers, clock, permanent=(), transient=(), on_give_up=None,
+                 base_delay=5, max_delay=900, max_attempts=10):
+        self.path = path
+        self.handlers = handlers  # kind -> async callable taking the entry dict
+        self.clock = clock
+        self.permanent = (PermanentFailure, *permanent)
+        self.transient = tuple(transient)
+        self.on_give_up = on_give_up  # callable taking the entry dict
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.entries = {}  # key -> entry, in the order they were added
+        self.done = {}  # key -> completion timestamp
+        self.failed = []
+        self.retried = 0
+        self._draining = asyncio.Lock()
+        self.load()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except json.JSONDecodeError as e:
+            print(f"[Outbox] Could not read {self.path} ({e}); starting empty")
+            return
+        self.entries = {e["key"]: e for e in data.get("entries", [])}
+        self.done = data.get("done", {})
+        self.failed = data.get("failed", [])
+        if self.entries:
+            print(f"[Outbox] Loaded {len(self.entries)} pending side effects.")
+
+    def save(self):
+        cutoff = self.clock().timestamp() - KEEP_DONE_SECONDS
+        self.done = {k: t for k, t in self.done.items() if t >= cutoff}
+        self.failed = self.failed[-MAX_FAILED_KEPT:]
+        data = {"entries": list(self.entries.values()), "done": self.done, "failed": self.failed}
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            # dumps() runs the C encoder; dump() streams through the pure-Python one
+            f.write(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp_path, self.path)
+
+    def add(self, key, kind, poll_id, payload=None, save=True):
+        """Queue an effect to run as soon as the outbox is drained. Returns False if the
+        key is already pending or done."""
+        if key in self.entries or key in self.done:
+            return False
+        now = self.clock().timestamp()
+        self.entries[key] = {
+            "key": key,
+            "kind": kind,
+            "poll_id": poll_id,
+            "payload": payload or {},
+            "attempts": 0,
+            "next_attempt": now,
+            "created_at": now,
+            "last_error": None,
+        }
+        if save:
+            self.save()
+        return True
+
+    def next_attempt_time(self):
+        """Timestamp of the soonest pending entry, or None if the outbox is empty."""
+        return min((e["next_attempt"] for e in self.entries.values()), default=None)
+
+    def _backoff(self, attempts):
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+        # Jitter so a burst of failures from one outage doesn't retry in lockstep
+        return delay * random.uniform(0.5, 1.0)
+
+    async def drain(self):
+        """Run every due entry once. Returns (succeeded, retrying, failed) counts."""
+        async with self._draining:
+            return await self._drain()
+
+    async def _drain(self):
+        # Allow a millisecond of slack: the scheduler holds the wake-up time as a datetime,
+        # which can round a timestamp down by a microsecond.
+        now = self.clock().timestamp() + 0.001
+        due = [e for e in self.entries.values() if e["next_attempt"] <= now]
+        succeeded = retrying = failed = 0
+        for entry in due:
+            if entry["key"] not in self.entries:
+                continue
+            try:
+                await self.handlers[entry["kind"]](entry)
+            except Exception as e:
+                entry["attempts"] += 1
+                entry["last_error"] = repr(e)
+                gives_up = isinstance(e, self.permanent) or (
+                    entry["attempts"] >= self.max_attempts and not isinstance(e, self.transient))
+                if gives_up:
+                    self._fail(entry, e)
+                    failed += 1
+                else:
+                    entry["next_attempt"] = self.clock().timestamp() + self._backoff(entry["attempts"])
+                    self.retried += 1
+                    retrying += 1
+                    print(f"[Outbox] {entry['key']} failed (attempt {entry['attempts']}): {e!r}; retrying")
+            else:
+                self.entries.pop(entry["key"], None)
+                self.done[entry["key"]] = self.clock().timestamp()
+                succeeded += 1
+        if due:
+            self.save()
+        return succeeded, retrying, failed
+
+    def _fail(self, entry, error):
+        self.entries.pop(entry["key"], None)
+        self.failed.append(entry)
+        # Count it as done too, so the same effect isn't queued again
+        self.done[entry["key"]] = self.clock().timestamp()
+        print(f"[Outbox] Giving up on {entry['key']} after {entry['attempts']} attempt(s): {error!r}")
+        if not isinstance(error, self.permanent):
+            traceback.print_exception(error)
+        if self.on_give_up is not None:
+            self.on_give_up(entry)
@@ -0,0 +1,65 @@
+import re
+
+ROLE_MENTION_RE = re.compile(r"<@&(\d+)>")
+
+
+def quorum_role(guild, ping_target):
+    """The role whose members are expected to vote on a poll pinging `ping_target`:
+    the mentioned role, or @everyone for @everyone/@here. None if nobody is pinged."""
+    match = ROLE_MENTION_RE.fullmatch(ping_target or "")
+    if match:
+        return guild.get_role(int(match.group(1)))
+    if ping_target in ("@everyone", "@here"):
+        return guild.default_role
+    return None
+
+
+class VoterTally:
+    """Who has voted on one posted poll, and in what order, kept current from raw
+    reaction events. The order is each voter's ranking for polls tallied by rank.
+
+    `missing` starts as the members expected to vote (taken from the pinged role when
+    tracking starts, for polls that close early) and shrinks as they vote, so every
+    event is O(1) and the poll has quorum as soon as it's empty. Adding and removing
+    votes is idempotent, so a tally rebuilt from the message's reactions can absorb
+    events that raced it; the rebuilt order is the options' order, though, as Discord
+    doesn't say when each reaction was added."""
+
+    __slots__ = ("message_id", "emojis", "expected", "missing", "votes", "quorum_at", "version")
+
+    def __init__(self, message_id, emojis, expected):
+        self.message_id = message_id
+        self.emojis = frozenset(emojis)
+        self.expected = frozenset(expected)
+        self.missing = set(self.expected)
+        self.votes = {}  # user ID -> option emojis they've reacted with, in order
+        self.quorum_at = None  # when `missing` last became empty
+        self.version = 0  # bumped by every vote that changes the tally
+
+    def __len__(self):
+        """Distinct voters."""
+        return len(self.votes)
+
+    @property
+    def has_quorum(self):
+        return bool(self.expected) and not self.missing
+
+    def add(self, user_id, emoji):
+        if emoji not in self.emojis:
+            return
+        emojis = self.votes.setdefault(user_id, [])
+        if emoji not in emojis:
+            emojis.append(emoji)
+            self.version += 1
+        self.missing.discard(user_id)
+
+    def remove(self, user_id, emoji):
+        emojis = self.votes.get(user_id)
+        if not emojis or emoji not in emojis:
+            return
+        emojis.remove(emoji)
+        self.version += 1
+        if not emojis:
+            del self.votes[user_id]
+            if user_id in self.expected:
+                self.missing.add(user_id)
@@ -0,0 +1,174 @@
+"""Recurrence rules for recurring polls.
+
+A poll's schedule_cron dict holds cron fields, plus a few rules cron can't express
+on its own. Only hour and minute are required:
+
+    day_of_week     "mon" or "mon,wed,fri"; None means every day
+    day             monthly by weekday: "1st tue", "last fri", "1st mon,3rd mon"
+    hour, minute    local time of day
+    timezone        defaults to US/Eastern
+    interval_weeks  only every Nth week, counting from the week of `anchor`
+    anchor          ISO date in the first week of an every-N-weeks schedule
+    exclude         ["2026-12-25", ...], local dates to skip
+
+compile_recurrence() turns the dict into a Recurrence shared by every poll on the
+same schedule, which keeps the schedule's next few occurrences cached.
+"""
+import bisect
+from datetime import date, timedelta
+from functools import lru_cache
+
+from apscheduler.triggers.cron import CronTrigger
+
+DEFAULT_TIMEZONE = "US/Eastern"
+
+# Occurrences cached per schedule; listing and conflict checks look no further ahead
+UPCOMING_COUNT = 8
+
+# Stop looking after this many consecutive cron fires land on skipped weeks or dates.
+# Only a rule that can never fire again gets this far.
+MAX_SKIPPED = 1000
+
+# Every-N-weeks schedules count weeks from this Monday
+_EPOCH_MONDAY = date(1970, 1, 5)
+
+_DAY_NAMES = {"mon": "Mon", "tue": "Tue", "wed": "Wed", "thu": "Thu", "fri": "Fri", "sat": "Sat", "sun": "Sun"}
+
+
+def _canonical_list(value):
+    if value is None:
+        return None
+    return ",".join(" ".join(part.split()) for part in str(value).lower().split(","))
+
+
+def cron_key(cron):
+    """Canonical, hashable form of a poll's schedule_cron dict, so equivalent schedules
+    written differently land on the same key:
+    (day_of_week, hour, minute, timezone, day, interval_weeks, week_phase, exclude)."""
+    day = _canonical_list(cron.get("day"))
+    # Monthly schedules already pick their weeks
+    interval = 1 if day else int(cron.get("interval_weeks") or 1)
+    phase = 0
+    if interval > 1 and cron.get("anchor"):
+        anchor = date.fromisoformat(str(cron["anchor"])[:10])
+        phase = (anchor - _EPOCH_MONDAY).days // 7 % interval
+    exclude = tuple(sorted({str(d)[:10] for d in cron.get("exclude") or ()}))
+    return (_canonical_list(cron.get("day_of_week")), int(cron["hour"]), int(cron.get("minute", 0)),
+            cron.get("timezone", DEFAULT_TIMEZONE), day, interval, phase, exclude)
+
+
+@lru_cache(maxsize=None)
+def cron_trigger(day_of_week, hour, minute, timezone, day=None):
+    """CronTriggers are immutable, so every schedule with the same cron fields shares one."""
+    return CronTrigger(day_of_week=day_of_week, day=day, hour=hour, minute=minute, timezone=timezone)
+
+
+class Recurrence:
+    """A compiled schedule: the cron trigger plus the week and date filters, with its
+    next UPCOMING_COUNT occurrences cached so repeated lookups are a bisect.
+
+    Instances are shared (recurrence_for_key) and may be used from worker threads,
+    such as /schedule import validating rows off the event loop, so the cache is
+    replaced as one immutable tuple: a reader never pairs one computation's times
+    with another's occurrences.
+
+    Has the APScheduler trigger method get_next_fire_time(), so PollScheduler can
+    repeat on it in place of a CronTrigger."""
+
+    __slots__ = ("key", "trigger", "interval_weeks", "week_phase", "exclude", "_cache")
+
+    def __init__(self, key):
+        day_of_week, hour, minute, timezone, day, interval_weeks, week_phase, exclude = key
+        self.key = key
+        self.trigger = cron_trigger(day_of_week, hour, minute, timezone, day)
+        self.interval_weeks = interval_weeks
+        self.week_phase = week_phase
+        self.exclude = frozenset(date.fromisoformat(d) for d in exclude)
+        # (start timestamp, occurrence timestamps, occurrences): every occurrence from
+        # the start on, up to the last of them
+        self._cache = None
+
+    def _accepts(self, fire_time):
+        # Cron fire times are in the schedule's timezone, so this is the local date
+        local_date = fire_time.date()
+        if local_date in self.exclude:
+            return False
+        if self.interval_weeks > 1:
+            return (local_date - _EPOCH_MONDAY).days // 7 % self.interval_weeks == self.week_phase
+        return True
+
+    def _compute(self, start, count):
+        found = []
+        skipped = 0
+        fire_time = self.trigger.get_next_fire_time(None, start)
+        while fire_time is not None and len(found) < count and skipped < MAX_SKIPPED:
+            if self._accepts(fire_time):
+                found.append(fire_time)
+                skipped = 0
+            else:
+                skipped += 1
+            fire_time = self.trigger.get_next_fire_time(None, fire_time + timedelta(microseconds=1))
+        return found
+
+    def upcoming(self, start, count=UPCOMING_COUNT):
+        """The next `count` occurrences at or after `start`, as aware datetimes in the
+        schedule's timezone. Served from the cache when it covers them."""
+        ts = start.timestamp()
+        cache = self._cache
+        if cache is not None and cache[0] <= ts:
+            _, times, occurrences = cache
+            i = bisect.bisect_left(times, ts)
+            if i + count <= len(times):
+                return list(occurrences[i:i + count])
+        occurrences = tuple(self._compute(start, max(count, UPCOMING_COUNT)))
+        self._cache = (ts, tuple(o.timestamp() for o in occurrences), occurrences)
+        return list(occurrences[:count])
+
+    def next_fire(self, start):
+        """The first occurrence at or after `start`, or None if the rule never fires again."""
+        found = self.upcoming(start, 1)
+        return found[0] if found else None
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        return self.next_fire(now)
+
+
+@lru_cache(maxsize=None)
+def recurrence_for_key(key):
+    """The shared Recurrence for a cron_key()."""
+    return Recurrence(key)
+
+
+def compile_recurrence(cron):
+    """The shared Recurrence for a poll's schedule_cron dict."""
+    return recurrence_for_key(cron_key(cron))
+
+
+def _join(words):
+    return words[0] if len(words) == 1 else f"{', '.join(words[:-1])} and {words[-1]}"
+
+
+def describe_recurrence(cron):
+    """Human-readable schedule, e.g. "Every 2 weeks on Mon and Thu at 19:30 (US/Eastern),
+    except Dec 25"."""
+    day_of_week, hour, minute, timezone, day, interval, _, exclude = cron_key(cron)
+    at = f"at {hour}:{minute:02d} ({timezone})"
+    if day:
+        # "1st mon,3rd mon" -> "The 1st and 3rd Mon"; mixed weekdays are listed in full
+        parts = [p.split() for p in day.split(",")]
+        weekdays = {p[-1] for p in parts}
+        if len(weekdays) == 1:
+            text = f"The {_join([p[0] for p in parts])} {_DAY_NAMES.get(parts[0][-1], parts[0][-1])}"
+        else:
+            text = "The " + _join([f"{p[0]} {_DAY_NAMES.get(p[-1], p[-1])}" for p in parts])
+        text += f" of every month {at}"
+    else:
+        days = _join([_DAY_NAMES.get(d, d) for d in day_of_week.split(",")]) if day_of_week else "day"
+        if interval > 1:
+            text = f"Every {interval} weeks on {days} {at}" if day_of_week else f"Every day, every {interval} weeks, {at}"
+        else:
+            text = f"Every {days} {at}"
+    if exclude:
+        skipped = [date.fromisoformat(d) for d in exclude]
+        text += ", except " + ", ".join(f"{d:%b} {d.day}, {d.year}" for d in skipped)
+    return text
@@ -0,0 +1,300 @@
+import asyncio
+import heapq
+import itertools
+import traceback
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+import pytz
+
+from cogs.poll_recurrence import cron_key, recurrence_for_key
+
+# Seconds an action may start late before it counts as missed; None runs it however late.
+# Sends keep the 300s grace the bot's APScheduler used to apply to every job. A resolve
+# always runs, since skipping it would leave the poll open forever.
+DEFAULT_MISFIRE_GRACE = {"send": 300, "resolve": None, "archive": None}
+
+# Re-check the wall clock at least this often so a suspended host doesn't oversleep
+MAX_SLEEP_SECONDS = 60
+
+
+def _utc_now():
+    return datetime.now(pytz.utc)
+
+
+@dataclass(slots=True, order=True)
+class ScheduledCall:
+    """One heap entry. Ordered by (when, seq); cancelled entries stay in the heap until popped.
+
+    A shared cron entry has poll_id None and fans out to every poll in `members`."""
+
+    when: float
+    seq: int
+    poll_id: str = field(compare=False)
+    action: str = field(compare=False)
+    repeat: object = field(compare=False, default=None)  # Recurrence or timedelta
+    cancelled: bool = field(compare=False, default=False)
+    members: set = field(compare=False, default=None)
+    group: tuple = field(compare=False, default=None)  # (cron_key, action) for shared entries
+
+
+class PollScheduler:
+    """Runs poll actions ("send", "resolve", ...) at their due time from one asyncio task.
+
+    Each (poll_id, action) has at most one pending call; scheduling it again replaces
+    the old one. A repeating call re-arms itself before its handler runs, so a handler
+    that reschedules its own poll isn't overwritten afterwards.
+
+    Polls following the same cron schedule share a single heap entry that fans out to
+    all of them, so the heap grows with distinct schedules rather than with polls.
+
+    The clock is injectable; the simulator drives a stopped scheduler with run_due().
+    """
+
+    def __init__(self, handlers, clock=_utc_now, misfire_grace=None):
+        self.handlers = handlers  # action -> async callable taking the poll ID
+        self.clock = clock
+        self.misfire_grace = {**DEFAULT_MISFIRE_GRACE, **(misfire_grace or {})}
+        self._heap = []
+        self._calls = {}  # (poll_id, action) -> ScheduledCall
+        self._groups = {}  # (cron_key, action) -> shared ScheduledCall
+        self._memberships = {}  # (poll_id, action) -> (cron_key, action)
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._running = set()
+        self.added = 0
+        self.fired = 0
+        self.missed = 0
+        self.cancelled = 0
+
+    def __len__(self):
+        """Live heap entries: one per one-off call plus one per distinct cron schedule."""
+        return len(self._calls) + len(self._groups)
+
+    def __contains__(self, key):
+        return key in self._calls or key in self._memberships
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    def schedule(self, poll_id, action, when=None, repeat=None):
+        """Run `action` for `poll_id` at `when`, replacing any pending call for that pair.
+
+        `repeat` is a Recurrence (or a CronTrigger) or a timedelta; with no `when`, the
+        first run is the repeat's next occurrence. Returns the fire time."""
+        if when is None:
+            now = self.clock()
+            when = self._next_occurrence(repeat, now, now)
+        self._remove(poll_id, action)
+        self._calls[(poll_id, action)] = self._push(poll_id, action, when, repeat)
+        self.added += 1
+        return when
+
+    def schedule_cron(self, poll_id, action, cron):
+        """Run `action` for `poll_id` on its schedule_cron, sharing one heap entry with
+        every other poll on the same schedule. Replaces any pending call for the pair.
+        Returns the next fire time."""
+        key = (cron_key(cron), action)
+        self._remove(poll_id, action)
+        group = self._groups.get(key)
+        if group is None:
+            now = self.clock()
+            rule = recurrence_for_key(key[0])
+            group = self._push(None, action, self._next_occurrence(rule, now, now), rule,
+                               members=set(), group=key)
+            self._groups[key] = group
+        group.members.add(poll_id)
+        self._memberships[(poll_id, action)] = key
+        self.added += 1
+        return self._as_datetime(group.when)
+
+    def _push(self, poll_id, action, when, repeat, members=None, group=None):
+        call = ScheduledCall(when.timestamp(), next(self._seq), poll_id, action, repeat,
+                             members=members, group=group)
+        heapq.heappush(self._heap, call)
+        self._wakeup.set()
+        return call
+
+    def _remove(self, poll_id, action):
+        """Drop the pending call for one poll action, wherever it lives. Returns True if there was one."""
+        call = self._calls.pop((poll_id, action), None)
+        if call:
+            self._cancel_call(call)
+            return True
+        key = self._memberships.pop((poll_id, action), None)
+        if key is None:
+            return False
+        group = self._groups[key]
+        group.members.discard(poll_id)
+        if not group.members:
+            del self._groups[key]
+            self._cancel_call(group)
+        return True
+
+    def cancel(self, poll_id, action=None):
+        """Cancel one action, or every pending action for the poll. Returns how many were cancelled."""
+        actions = [action] if action else list(self.handlers)
+        return sum(self._remove(poll_id, a) for a in actions)
+
+    def _cancel_call(self, call):
+        call.cancelled = True
+        self.cancelled += 1
+        # Cancelled calls are normally dropped as they reach the top of the heap;
+        # rebuild it if they start to outnumber the live ones.
+        if len(self._heap) > 2 * len(self) + 64:
+            self._heap = [c for c in self._heap if not c.cancelled]
+            heapq.heapify(self._heap)
+
+    def _call_for(self, poll_id, action):
+        call = self._calls.get((poll_id, action))
+        if call is None and (poll_id, action) in self._memberships:
+            call = self._groups[self._memberships[(poll_id, action)]]
+        return call
+
+    def entry(self, poll_id, action):
+        """(fire_time, cron_key) for a pending poll action, cron_key being None unless it
+        follows a shared cron schedule. None if nothing is pending."""
+        call = self._call_for(poll_id, action)
+        if call is None:
+            return None
+        return self._as_datetime(call.when), call.group[0] if call.group else None
+
+    def keys(self):
+        """Every pending (poll_id, action), whether scheduled alone or on a shared cron."""
+        return [*self._calls, *self._memberships]
+
+    def next_fire_time(self, poll_id=None, action=None):
+        """When the given poll action (any action, if none given) next fires, or the
+        scheduler's next fire time overall. None if nothing is pending."""
+        if poll_id is None and action is None:
+            while self._heap and self._heap[0].cancelled:
+                heapq.heappop(self._heap)
+            return self._as_datetime(self._heap[0].when) if self._heap else None
+        calls = [self._call_for(poll_id, a) for a in ([action] if action else self.handlers)]
+        times = [c.when for c in calls if c]
+        return self._as_datetime(min(times)) if times else None
+
+    def pending(self):
+        """[(fire_time, poll_id, action)] for every pending poll action, soonest first."""
+        calls = sorted([*self._calls.values(), *self._groups.values()])
+        return [(self._as_datetime(c.when), poll_id, c.action)
+                for c in calls for poll_id in (sorted(c.members) if c.members is not None else [c.poll_id])]
+
+    @property
+    def revision(self):
+        """Changes whenever a call is added, cancelled, run or missed."""
+        return self.added + self.cancelled + self.fired + self.missed
+
+    def stats(self):
+        return {"pending": len(self._calls) + len(self._memberships), "entries": len(self),
+                "cron_groups": len(self._groups), "heap": len(self._heap), "added": self.added,
+                "fired": self.fired, "missed": self.missed, "cancelled": self.cancelled}
+
+    @staticmethod
+    def _as_datetime(ts):
+        return datetime.fromtimestamp(ts, pytz.utc)
+
+    @staticmethod
+    def _next_occurrence(repeat, after, now):
+        if isinstance(repeat, timedelta):
+            when = after + repeat
+            while when <= now:
+                when += repeat
+            return when
+        # Never return `after` itself, or a call due exactly now would fire twice
+        start = max(now, after + timedelta(microseconds=1))
+        return repeat.get_next_fire_time(None, start)
+
+    def pop_due(self):
+        """Remove the calls that are due now and return them as (action, poll_id) pairs,
+        re-arming repeating ones. Calls later than their action's misfire grace are dropped
+        (or skip to their next occurrence) instead of being returned."""
+        now = self.clock()
+        now_ts = now.timestamp()
+        due = []
+        while self._heap and self._heap[0].when <= now_ts:
+            call = heapq.heappop(self._heap)
+            if call.cancelled:
+                continue
+            if call.group is not None:
+                members = sorted(call.members)
+                # The re-armed entry keeps the same member set, so polls joining or
+                # leaving the schedule from inside a handler land on it.
+                self._groups[call.group] = self._push(
+                    None, call.action, self._next_occurrence(call.repeat, self._as_datetime(call.when), now),
+                    call.repeat, members=call.members, group=call.group)
+            else:
+                members = [call.poll_id]
+                del self._calls[(call.poll_id, call.action)]
+                if call.repeat is not None:
+                    self._calls[(call.poll_id, call.action)] = self._push(
+                        call.poll_id, call.action,
+                        self._next_occurrence(call.repeat, self._as_datetime(call.when), now), call.repeat)
+            grace = self.misfire_grace.get(call.action)
+            late = now_ts - call.when
+            if grace is not None and late > grace:
+                self.missed += len(members)
+                print(f"[Scheduler] Skipped {call.action} for {self._label(members)}: "
+                      f"{late:.0f}s late (grace {grace}s)")
+                continue
+            due.extend((call.action, poll_id) for poll_id in members)
+        return due
+
+    async def run_due(self):
+        """Run every due call one after another. Returns how many ran."""
+        due = self.pop_due()
+        for action, poll_id in due:
+            await self._invoke(action, poll_id)
+        return len(due)
+
+    async def _invoke(self, action, poll_id):
+        self.fired += 1
+        handler = self.handlers[action]
+        try:
+            if poll_id is None:
+                await handler()
+            else:
+                await handler(poll_id)
+        except Exception as e:
+            print(f"[Scheduler] {action} for {self._label([poll_id])} raised {e!r}")
+            traceback.print_exc()
+
+    @staticmethod
+    def _label(poll_ids):
+        if poll_ids == [None]:
+            return "maintenance"
+        if len(poll_ids) == 1:
+            return f"poll {poll_ids[0][:8]}"
+        return f"{len(poll_ids)} polls"
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            next_fire = self.next_fire_time()
+            if next_fire is None:
+                await self._wakeup.wait()
+                continue
+            delay = (next_fire - self.clock()).total_seconds()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), min(delay, MAX_SLEEP_SECONDS))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            # Handlers run as their own tasks, as they did under APScheduler, so a slow
+            # Discord call for one poll doesn't hold up the rest.
+            for action, poll_id in self.pop_due():
+                task = asyncio.create_task(self._invoke(action, poll_id))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
@@ -0,0 +1,178 @@
+import gc
+import json
+import os
+from contextlib import contextmanager
+
+from cogs.poll_model import poll_from_dict, poll_to_dict
+
+try:
+    import msgpack
+except ImportError:  # optional: only needed for the compact binary format
+    msgpack = None
+
+# Bump when the snapshot layout changes, and add an upgrade step below.
+#   1: {"polls": {...}} written with indent=2 (no version field)
+#   2: {"schema_version": 2, "polls": {...}}, compact, strictly typed
+#   3: adds "analytics": {guild ID: aggregates} (see poll_analytics)
+SCHEMA_VERSION = 3
+
+FORMATS = {"json": ".json", "msgpack": ".msgpack"}
+POLL_STATUSES = {"scheduled", "active", "completed"}
+
+
+def _upgrade_v1(snapshot):
+    return {"schema_version": 2, "polls": snapshot.get("polls", {})}
+
+
+def _upgrade_v2(snapshot):
+    return {**snapshot, "schema_version": 3, "analytics": {}}
+
+
+UPGRADES = {1: _upgrade_v1, 2: _upgrade_v2}
+
+
+def snapshot_path(base_path, fmt):
+    """data/polls.json -> data/polls.msgpack etc."""
+    return os.path.splitext(base_path)[0] + FORMATS[fmt]
+
+
+def resolve_format(fmt):
+    if fmt == "msgpack" and msgpack is None:
+        print("[Store] POLL_STORE_FORMAT=msgpack but msgpack isn't installed; using JSON")
+        return "json"
+    return fmt if fmt in FORMATS else "json"
+
+
+def _reject_non_json(value):
+    raise TypeError(f"Refusing to store non-JSON value {value!r} of type {type(value).__name__}")
+
+
+def encode_snapshot(snapshot, fmt):
+    if fmt == "msgpack":
+        return msgpack.packb(snapshot, use_bin_type=True, default=_reject_non_json)
+    return json.dumps(snapshot, separators=(",", ":"), ensure_ascii=False, default=_reject_non_json).encode("utf-8")
+
+
+def decode_snapshot(raw, fmt):
+    if fmt == "msgpack":
+        return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    return json.loads(raw)
+
+
+def upgrade_snapshot(snapshot):
+    """Bring an older snapshot up to SCHEMA_VERSION, one step at a time."""
+    version = snapshot.get("schema_version", 1)
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Snapshot schema v{version} is newer than this bot understands (v{SCHEMA_VERSION})")
+    while version < SCHEMA_VERSION:
+        snapshot = UPGRADES[version](snapshot)
+        print(f"[Store] Upgraded poll snapshot from schema v{version} to v{snapshot['schema_version']}")
+        version = snapshot["schema_version"]
+    return snapshot
+
+
+def validate_poll(poll_id, data):
+    """Return a description of what's wrong with a stored poll's shape, or None if it looks usable.
+    Timestamps are checked when poll_from_dict parses them."""
+    if not isinstance(data, dict):
+        return "not an object"
+    if data.get("id") != poll_id:
+        return f"id {data.get('id')!r} doesn't match its key"
+    for key, kind in (("guild_id", int), ("channel_id", int), ("creator_id", int), ("question", str),
+                      ("options", list), ("poll_duration_hours", (int, float)), ("next_send_time", str)):
+        if not isinstance(data.get(key), kind) or isinstance(data.get(key), bool):
+            return f"{key} is missing or not {getattr(kind, '__name__', 'a number')}"
+    if data.get("status") not in POLL_STATUSES:
+        return f"unknown status {data.get('status')!r}"
+    if not data["options"] or not all(
+            isinstance(o, dict) and isinstance(o.get("label"), str) and isinstance(o.get("emoji"), str)
+            for o in data["options"]):
+        return "options must be a non-empty list of {label, emoji}"
+    return None
+
+
+@contextmanager
+def _gc_paused():
+    """Bulk-building hundreds of thousands of objects trips the cyclic GC over and over,
+    and none of them are garbage yet. Pausing it roughly halves decode time."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def load_snapshot(base_path, fmt, analytics=None):
+    """Load polls as {poll_id: Poll} from the newest snapshot on disk, whatever its
+    format, so switching formats upgrades automatically (save_snapshot removes the
+    others, but a snapshot left over from an older version may still be there).
+    If `analytics` is a dict, it's filled with the snapshot's analytics section.
+
+    Polls that fail validation are skipped and written to <name>.rejected.json
+    so one bad entry can't take the whole store down."""
+    def modified(candidate):
+        try:
+            return os.path.getmtime(snapshot_path(base_path, candidate))
+        except OSError:
+            return float("-inf")
+
+    # Newest first; on a tie, the configured format
+    candidates = sorted(FORMATS, key=lambda f: (modified(f), f == fmt), reverse=True)
+    for candidate in candidates:
+        path = snapshot_path(base_path, candidate)
+        if candidate == "msgpack" and msgpack is None:
+            continue
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            continue
+        if not raw:
+            return {}
+        if candidate != fmt:
+            print(f"[Store] Loaded polls from {path}; they'll be saved as {fmt} from now on")
+
+        polls, rejected = {}, {}
+        with _gc_paused():
+            snapshot = upgrade_snapshot(decode_snapshot(raw, candidate))
+            if analytics is not None:
+                analytics.update(snapshot["analytics"])
+            for poll_id, data in snapshot["polls"].items():
+                problem = validate_poll(poll_id, data)
+                if not problem:
+                    try:
+                        polls[poll_id] = poll_from_dict(data)
+                        continue
+                    except (ValueError, TypeError) as e:
+                        problem = str(e)
+                print(f"[Store] Skipping invalid poll {poll_id[:8]}: {problem}")
+                rejected[poll_id] = data
+        if rejected:
+            with open(os.path.splitext(base_path)[0] + ".rejected.json", "w") as f:
+                json.dump(rejected, f, indent=2, default=str)
+        return polls
+    return {}
+
+
+def save_snapshot(base_path, fmt, polls, analytics=None):
+    """Write every poll, and the analytics aggregates, atomically: a crash mid-write
+    leaves the previous snapshot intact."""
+    with _gc_paused():
+        snapshot = {"schema_version": SCHEMA_VERSION, "polls": {pid: poll_to_dict(p) for pid, p in polls.items()},
+                    "analytics": analytics or {}}
+        raw = encode_snapshot(snapshot, fmt)
+    path = snapshot_path(base_path, fmt)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(raw)
+    os.replace(tmp_path, path)
+    # A snapshot in another format is now out of date; left behind, switching back
+    # to that format would load it and lose everything saved since
+    for other in FORMATS:
+        if other != fmt:
+            try:
+                os.remove(snapshot_path(base_path, other))
+            except FileNotFoundError:
+                pass
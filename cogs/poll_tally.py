@@ -0,0 +1,193 @@
+"""Tally methods for polls whose voters rank the options by the order they react in.
+
+Ballots live in a BallotMatrix: one row per voter and one byte per option holding
+the rank the voter gave it (1 = first choice, 0 = not picked), in a flat array.
+Methods work on the distinct rankings and how many voters cast each, since voters
+only pick a handful of options and many of them pick the same ones in the same order.
+
+Every method returns the candidates ranked as tie groups, best first. Only a tie for
+first place that the method itself can't break needs a tiebreaker poll.
+"""
+from array import array
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:  # optional; pairwise counts fall back to pure Python
+    numpy = None
+
+# Above this many voters, pairwise counts use NumPy when it's installed
+NUMPY_MIN_VOTERS = 2000
+
+TALLY_METHODS = ("approval", "irv", "schulze")
+METHOD_NAMES = {
+    None: "Most votes",
+    "approval": "Approval, ties to first choices",
+    "irv": "Instant runoff",
+    "schulze": "Condorcet (Schulze)",
+}
+
+
+class BallotMatrix:
+    """Every voter's ranking of a poll's options, one byte per option."""
+
+    __slots__ = ("n_options", "ranks", "voters")
+
+    def __init__(self, n_options):
+        self.n_options = n_options
+        self.ranks = array("B")
+        self.voters = 0
+
+    @classmethod
+    def from_rankings(cls, n_options, rankings):
+        ballots = cls(n_options)
+        for ranking in rankings:
+            ballots.add(ranking)
+        return ballots
+
+    def add(self, ranking):
+        """Add a ballot: option indexes, most preferred first. Empty ballots are skipped."""
+        if not ranking:
+            return
+        row = [0] * self.n_options
+        for rank, option in enumerate(ranking[:255], 1):
+            if not row[option]:
+                row[option] = rank
+        self.ranks.extend(row)
+        self.voters += 1
+
+    def rankings(self):
+        """Counter of distinct rankings (tuples of option indexes, best first)."""
+        n = self.n_options
+        counts = Counter(bytes(self.ranks[v * n:(v + 1) * n]) for v in range(self.voters))
+        return Counter({tuple(sorted((i for i in range(n) if row[i]), key=row.__getitem__)): count
+                        for row, count in counts.items()})
+
+    def approvals(self, rankings=None):
+        """Voters who picked each option at all."""
+        counts = [0] * self.n_options
+        for ranking, count in (rankings or self.rankings()).items():
+            for option in ranking:
+                counts[option] += count
+        return counts
+
+    def pairwise(self, rankings=None):
+        """d[i][j]: voters preferring option i to option j. Picked options beat unpicked
+        ones; two unpicked options are level."""
+        n = self.n_options
+        if numpy is not None and self.voters >= NUMPY_MIN_VOTERS:
+            ranks = numpy.frombuffer(self.ranks, dtype=numpy.uint8).reshape(self.voters, n).astype(numpy.int16)
+            ranks[ranks == 0] = n + 1
+            return (ranks[:, :, None] < ranks[:, None, :]).sum(axis=0).tolist()
+        d = [[0] * n for _ in range(n)]
+        for ranking, count in (rankings or self.rankings()).items():
+            below = set(range(n))
+            for option in ranking:
+                below.discard(option)
+                row = d[option]
+                for other in below:
+                    row[other] += count
+        return d
+
+
+def _groups(candidates, key):
+    """Candidates ranked by descending key, equal keys grouped together."""
+    ranked = sorted(candidates, key=key, reverse=True)
+    groups = []
+    for option in ranked:
+        if groups and key(groups[-1][0]) == key(option):
+            groups[-1].append(option)
+        else:
+            groups.append([option])
+    return groups
+
+
+def approval(ballots, candidates):
+    """Most voters picking an option wins; ties go to whoever more voters picked first."""
+    rankings = ballots.rankings()
+    approvals = ballots.approvals(rankings)
+    firsts = [0] * ballots.n_options
+    for ranking, count in rankings.items():
+        firsts[ranking[0]] += count
+    groups = _groups(candidates, lambda o: (approvals[o], firsts[o]))
+    detail = ""
+    if len(groups) > 1 and approvals[groups[0][0]] == approvals[groups[1][0]]:
+        detail = f"tie on {approvals[groups[0][0]]} vote(s) broken by first choices"
+    return groups, detail
+
+
+def instant_runoff(ballots, candidates):
+    """Repeatedly drop the option with fewest first choices among those left, until one
+    has a majority of the ballots still in play. Ties for elimination drop the option
+    fewer voters picked at all, then the one listed later."""
+    rankings = ballots.rankings()
+    approvals = ballots.approvals(rankings)
+    active = set(candidates)
+    eliminated = []
+    round_number = 0
+    while active:
+        round_number += 1
+        firsts = dict.fromkeys(active, 0)
+        for ranking, count in rankings.items():
+            for option in ranking:
+                if option in active:
+                    firsts[option] += count
+                    break
+        total = sum(firsts.values())
+        top = max(firsts.values())
+        leaders = [o for o in active if firsts[o] == top]
+        if top * 2 > total or len(leaders) == len(active):
+            groups = [sorted(leaders)]
+            rest = [o for o in active if o not in leaders]
+            groups += _groups(rest, lambda o: (firsts[o], approvals[o]))
+            groups += [[o] for o in reversed(eliminated)]
+            if len(leaders) > 1:
+                return groups, ""
+            return groups, f"decided in round {round_number} with {top} of {total} ballot(s)"
+        lowest = min(firsts.values())
+        loser = min((o for o in active if firsts[o] == lowest), key=lambda o: (approvals[o], -o))
+        active.remove(loser)
+        eliminated.append(loser)
+    return [], ""
+
+
+def schulze(ballots, candidates):
+    """The Schulze method: compare every pair of options head to head and rank by the
+    strongest chain of pairwise wins. Picks the option that beats every other one
+    head to head whenever there is such an option."""
+    d = ballots.pairwise()
+    p = {(i, j): d[i][j] if d[i][j] > d[j][i] else 0 for i in candidates for j in candidates if i != j}
+    for k in candidates:
+        for i in candidates:
+            if i == k:
+                continue
+            p_ik = p[(i, k)]
+            if not p_ik:
+                continue
+            for j in candidates:
+                if j != i and j != k:
+                    via = min(p_ik, p[(k, j)])
+                    if via > p[(i, j)]:
+                        p[(i, j)] = via
+    wins = {i: sum(1 for j in candidates if j != i and p[(i, j)] > p[(j, i)]) for i in candidates}
+    groups = _groups(candidates, wins.__getitem__)
+    detail = ""
+    if groups and len(groups[0]) == 1 and len(candidates) > 1:
+        winner = groups[0][0]
+        beaten = sum(1 for j in candidates if j != winner and d[winner][j] > d[j][winner])
+        if beaten == len(candidates) - 1:
+            detail = "beat every other option head to head"
+        else:
+            detail = "strongest chain of head-to-head wins"
+    return groups, detail
+
+
+_METHODS = {"approval": approval, "irv": instant_runoff, "schulze": schulze}
+
+
+def rank_options(method, ballots, candidates):
+    """Rank `candidates` (option indexes) by `method`. Returns (tie groups, best first;
+    a short note on how the winner was decided, or "")."""
+    if not candidates:
+        return [], ""
+    return _METHODS[method](ballots, list(candidates))
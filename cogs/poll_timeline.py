@@ -0,0 +1,120 @@
+"""When the votes on a poll came in.
+
+While a poll is active, every reaction added or removed on it is appended to its
+VoteTimeline as one entry in two parallel arrays: seconds since the poll posted
+(unsigned 32-bit) and the option's index + 1, negated for a withdrawn vote (signed
+8-bit). That's 5 bytes a vote, and a poll keeps at most MAX_EVENTS of them;
+reactions past that are counted in `dropped` but not kept.
+
+When the poll resolves, its timeline is folded into a record appended to a gzip
+JSON-lines archive (like the poll archive): the raw log, base64-encoded, plus
+`hourly`, the net votes in at the end of each hour of the window. Questions like
+"what share of the votes were in after N hours" read `hourly` alone.
+
+A timeline is in memory only. One started when the bot restarted in the middle of
+a poll's window missed the votes before that, so it's recorded with complete=False,
+as is one that dropped reactions; votes_by_hour() skips them.
+"""
+import base64
+import math
+import sys
+from array import array
+from datetime import datetime
+from itertools import accumulate
+
+from cogs import poll_archive
+
+# Reaction events kept per poll; 5 bytes each
+MAX_EVENTS = 4096
+HOUR_SECONDS = 3600
+
+
+def _encode(values):
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _decode(typecode, text):
+    values = array(typecode)
+    values.frombytes(base64.b64decode(text))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+class VoteTimeline:
+    __slots__ = ("started_at", "options", "offsets", "deltas", "complete", "dropped")
+
+    def __init__(self, started_at, emojis, complete=True):
+        self.started_at = started_at
+        self.options = {emoji: i + 1 for i, emoji in enumerate(emojis)}
+        self.offsets = array("I")  # seconds since the poll posted
+        self.deltas = array("b")  # option index + 1; negative for a vote withdrawn
+        self.complete = complete
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def record(self, when, emoji, added):
+        option = self.options.get(emoji)
+        if option is None:
+            return
+        if len(self.offsets) >= MAX_EVENTS:
+            self.dropped += 1
+            self.complete = False
+            return
+        self.offsets.append(max(0, int((when - self.started_at).total_seconds())))
+        self.deltas.append(option if added else -option)
+
+    def hourly(self, duration_hours):
+        """Net votes in at the end of each hour of a `duration_hours` window (the last
+        hour may be partial). Votes counted after the window land in its last hour."""
+        hours = max(1, math.ceil(duration_hours))
+        added = [0] * hours
+        for offset, delta in zip(self.offsets, self.deltas):
+            added[min(offset // HOUR_SECONDS, hours - 1)] += 1 if delta > 0 else -1
+        return list(accumulate(added))
+
+    def fold(self, duration_hours):
+        """The timeline as an archive record's fields."""
+        return {
+            "started_at": self.started_at.isoformat(),
+            "complete": self.complete,
+            "dropped": self.dropped,
+            "hourly": self.hourly(duration_hours),
+            "offsets": _encode(self.offsets),
+            "deltas": _encode(self.deltas),
+        }
+
+    @classmethod
+    def from_record(cls, record, emojis):
+        """Rebuild an archived timeline, for looking at its raw log again."""
+        timeline = cls(datetime.fromisoformat(record["started_at"]), emojis, record["complete"])
+        timeline.offsets = _decode("I", record["offsets"])
+        timeline.deltas = _decode("b", record["deltas"])
+        timeline.dropped = record["dropped"]
+        return timeline
+
+
+def votes_by_hour(path, hours, guild_id=None):
+    """Across the archived timelines (optionally one guild's), the share of each
+    posting's final votes that were in after each of `hours`, pooled over postings.
+    Returns (postings counted, [share for each of hours]). A posting whose window is
+    shorter than N hours counts as fully in at N. Tiebreakers, which all run
+    for minutes, are left out."""
+    seen = set()
+    final = 0
+    in_by = [0] * len(hours)
+    for record in poll_archive.iter_archive(path, guild_id):
+        key = (record["poll_id"], record["cycle"])
+        if not record["complete"] or record["tiebreaker"] or key in seen:
+            continue
+        seen.add(key)
+        hourly = record["hourly"]
+        final += hourly[-1]
+        for i, n in enumerate(hours):
+            in_by[i] += hourly[min(n, len(hourly)) - 1] if n > 0 else 0
+    return len(seen), [count / final if final else 0.0 for count in in_by]
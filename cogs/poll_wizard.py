@@ -0,0 +1,187 @@
+import discord
+
+from cogs.poll_tally import METHOD_NAMES, TALLY_METHODS
+
+# How long a validation-error retry button stays usable. Live setup sessions
+# are expired by the cog's SessionStore instead of by view timeouts.
+WIZARD_TIMEOUT_SECONDS = 300
+
+PING_CHOICES = [("@everyone", "@everyone"), ("@here", "@here"), ("No ping", "")]
+MAX_THRESHOLD_CHOICE = 10
+
+
+class PollDetailsModal(discord.ui.Modal):
+    """Collects the free-text parts of a poll in one round trip.
+
+    The modal only gathers input — validation and storage happen in
+    Polls.submit_details so create, modify and clone share one code path."""
+
+    def __init__(self, cog, session, title):
+        super().__init__(title=title, timeout=WIZARD_TIMEOUT_SECONDS)
+        self.cog = cog
+        self.session = session
+        data = session["data"]
+
+        self.question = discord.ui.TextInput(
+            label="Poll question",
+            placeholder="When can everyone play D&D this week?",
+            default=data.get("question") or None,
+            max_length=256,
+        )
+        self.options = discord.ui.TextInput(
+            label="Options (comma or one per line)",
+            style=discord.TextStyle.paragraph,
+            placeholder="Friday Night, Saturday Morning, Saturday Night",
+            default=data.get("options_raw") or None,
+        )
+        self.send_time = discord.ui.TextInput(
+            label="When should the poll be sent?",
+            placeholder="Monday at 9am EST, tomorrow at 3pm, in 2 hours",
+            default=data.get("send_time_raw") or None,
+        )
+        self.repeat = discord.ui.TextInput(
+            label="Repeat schedule",
+            placeholder="every Monday at 9am EST (leave blank for none)",
+            default=data.get("repeat_raw") or None,
+            required=False,
+        )
+        self.duration = discord.ui.TextInput(
+            label="How long should voting stay open?",
+            placeholder="24 hours, 2 days, 48 hours",
+            default=data.get("duration_raw") or "24 hours",
+        )
+        for item in (self.question, self.options, self.send_time, self.repeat, self.duration):
+            self.add_item(item)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        await self.cog.submit_details(interaction, self.session, {
+            "question": self.question.value,
+            "options_raw": self.options.value,
+            "send_time_raw": self.send_time.value,
+            "repeat_raw": self.repeat.value,
+            "duration_raw": self.duration.value,
+        })
+
+
+class RetryDetailsView(discord.ui.View):
+    """Shown when the modal input doesn't validate; reopens it with the user's answers."""
+
+    def __init__(self, cog, session, title):
+        super().__init__(timeout=WIZARD_TIMEOUT_SECONDS)
+        self.cog = cog
+        self.session = session
+        self.title = title
+
+    @discord.ui.button(label="Edit details", style=discord.ButtonStyle.primary)
+    async def edit_details(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(PollDetailsModal(self.cog, self.session, self.title))
+
+
+class PollSetupView(discord.ui.View):
+    """Channel, ping and threshold pickers, early-close and counting toggles, and
+    confirm/edit/cancel buttons.
+
+    Replaces wizard steps 3, 4, 8 and 9: every change re-renders the summary
+    in place, and Confirm schedules the poll. The view has no timeout of its
+    own; the cog stops it when the session expires."""
+
+    def __init__(self, cog, session, title):
+        super().__init__(timeout=None)
+        self.cog = cog
+        self.session = session
+        self.title = title
+        self.interaction = None  # the interaction whose response holds this view
+        data = session["data"]
+
+        self.ping_select.options = [
+            discord.SelectOption(label=label, value=value or "none",
+                                 default=data.get("ping_target", "@everyone") == value)
+            for label, value in PING_CHOICES
+        ]
+        self.threshold_select.options = [
+            discord.SelectOption(label=f"Minimum {n} vote(s) per option" if n else "No minimum",
+                                 value=str(n), default=data.get("vote_threshold", 0) == n)
+            for n in range(MAX_THRESHOLD_CHOICE + 1)
+        ]
+        self._label_early_close()
+        self.tally_toggle.label = f"Count: {METHOD_NAMES[data.get('tally_method')]}"
+
+    def _label_early_close(self):
+        on = self.session["data"].get("early_close")
+        self.early_close_toggle.label = f"Close early: {'on' if on else 'off'}"
+        self.early_close_toggle.style = discord.ButtonStyle.success if on else discord.ButtonStyle.secondary
+
+    async def interaction_check(self, interaction: discord.Interaction):
+        if interaction.user.id != self.session["creator_id"]:
+            await interaction.response.send_message("Only the person creating this poll can change it.", ephemeral=True)
+            return False
+        if not self.cog.is_current_session(self.session):
+            await interaction.response.edit_message(
+                content="This poll setup is no longer active. Use `/schedule poll` to start again.",
+                embed=None, view=None,
+            )
+            return False
+        self.cog.touch_session(self.session)
+        return True
+
+    async def refresh(self, interaction):
+        await interaction.response.edit_message(embed=self.cog._build_confirmation_embed(self.session["data"]), view=self)
+
+    @discord.ui.select(cls=discord.ui.ChannelSelect, placeholder="Post in this channel (pick another to change)",
+                       channel_types=[discord.ChannelType.text, discord.ChannelType.news], row=0)
+    async def channel_select(self, interaction: discord.Interaction, select: discord.ui.ChannelSelect):
+        self.session["data"]["post_channel_id"] = select.values[0].id
+        await self.refresh(interaction)
+
+    @discord.ui.select(placeholder="Who should be pinged?", row=1)
+    async def ping_select(self, interaction: discord.Interaction, select: discord.ui.Select):
+        value = "" if select.values[0] == "none" else select.values[0]
+        self.session["data"]["ping_target"] = value
+        for option in select.options:
+            option.default = option.value == select.values[0]
+        await self.refresh(interaction)
+
+    @discord.ui.select(cls=discord.ui.RoleSelect, placeholder="...or ping a role", row=2)
+    async def role_select(self, interaction: discord.Interaction, select: discord.ui.RoleSelect):
+        self.session["data"]["ping_target"] = select.values[0].mention
+        for option in self.ping_select.options:
+            option.default = False
+        await self.refresh(interaction)
+
+    @discord.ui.select(placeholder="Minimum votes for an option to count", row=3)
+    async def threshold_select(self, interaction: discord.Interaction, select: discord.ui.Select):
+        self.session["data"]["vote_threshold"] = int(select.values[0])
+        for option in select.options:
+            option.default = option.value == select.values[0]
+        await self.refresh(interaction)
+
+    @discord.ui.button(label="Close early: off", style=discord.ButtonStyle.secondary, row=4)
+    async def early_close_toggle(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Resolve as soon as everyone pinged has voted, instead of waiting out the duration."""
+        data = self.session["data"]
+        data["early_close"] = not data.get("early_close")
+        self._label_early_close()
+        await self.refresh(interaction)
+
+    @discord.ui.button(label="Count: Most votes", style=discord.ButtonStyle.secondary, row=4)
+    async def tally_toggle(self, interaction: discord.Interaction, button: discord.ui.Button):
+        """Cycle through the ways of counting votes."""
+        data = self.session["data"]
+        methods = (None, *TALLY_METHODS)
+        data["tally_method"] = methods[(methods.index(data.get("tally_method")) + 1) % len(methods)]
+        button.label = f"Count: {METHOD_NAMES[data['tally_method']]}"
+        await self.refresh(interaction)
+
+    @discord.ui.button(label="Confirm", style=discord.ButtonStyle.success, row=4)
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self.cog.confirm_session(interaction, self.session)
+
+    @discord.ui.button(label="Edit details", style=discord.ButtonStyle.primary, row=4)
+    async def edit_details(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(PollDetailsModal(self.cog, self.session, self.title))
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.danger, row=4)
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.stop()
+        self.cog.end_session(self.session)
+        await interaction.response.edit_message(content="Poll creation cancelled.", embed=None, view=None)
@@ -1,18 +1,51 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-import json
+import aiohttp
 import os
 import uuid
 import asyncio
+import io
+import json
 from datetime import datetime, timedelta
 import dateparser
 import pytz
-from apscheduler.triggers.cron import CronTrigger
-from apscheduler.triggers.date import DateTrigger
 import re
+from typing import Literal
+from cogs import poll_archive, poll_io, poll_store
+from cogs.poll_analytics import PollAnalytics, bucket_label
+from cogs.poll_availability import DAY_NAMES, AvailabilityStore, best_slots, describe_windows
+from cogs.poll_events import EVENT_MARKER_RE, EventCache, event_key, event_marker
+from cogs.poll_outbox import Outbox
+from cogs.poll_quorum import ROLE_MENTION_RE, VoterTally, quorum_role
+from cogs.poll_timeline import VoteTimeline
+from cogs.poll_tally import METHOD_NAMES, TALLY_METHODS, BallotMatrix, rank_options
+from cogs.poll_recurrence import UPCOMING_COUNT, compile_recurrence, cron_key, describe_recurrence
+from cogs.poll_scheduler import PollScheduler
+from cogs.poll_model import Poll, PollOption, poll_from_dict, poll_to_dict
+from cogs.poll_wizard import PollDetailsModal, PollSetupView, RetryDetailsView
+from cogs.search_index import SearchIndex, format_results
+from cogs.sessions import SessionStore
 
 DATA_PATH = "data/polls.json"
+# "json", or "msgpack" for a smaller, faster binary snapshot (data/polls.msgpack; needs the msgpack package)
+STORE_FORMAT = os.getenv("POLL_STORE_FORMAT", "json").lower()
+ARCHIVE_PATH = "data/polls_archive.jsonl.gz"
+# Pending side effects of poll resolution (announcements, events, tiebreakers, recurrence)
+OUTBOX_PATH = "data/poll_outbox.json"
+# Members' weekly availability, used to suggest poll options
+AVAILABILITY_PATH = "data/availability.json"
+# Words in poll questions and options, live and archived, for /events search
+SEARCH_INDEX_PATH = "data/polls_index.jsonl"
+# Server events created for winning options, by poll and posting
+EVENTS_PATH = "data/poll_events.json"
+# When each resolved posting's votes came in, appended as it resolves
+TIMELINES_PATH = "data/poll_timelines.jsonl.gz"
+
+# Completed polls are moved to the archive once they've been finished this long
+ARCHIVE_AFTER_DAYS = float(os.getenv("POLL_ARCHIVE_AFTER_DAYS", "7"))
+ARCHIVE_INTERVAL_HOURS = 6
+HISTORY_PAGE_SIZE = 10
 
 NUMBER_EMOJIS = ["1\u20e3", "2\u20e3", "3\u20e3", "4\u20e3", "5\u20e3", "6\u20e3", "7\u20e3", "8\u20e3", "9\u20e3"]
 # Regional-indicator letters extend voting past the 9 keycap-number emojis.
@@ -25,11 +58,53 @@ DAY_MAP = {
     "thursday": "thu", "friday": "fri", "saturday": "sat", "sunday": "sun"
 }
 
+# Every spelling of a weekday parse_recurrence accepts, longest first so "tues" beats "tue"
+DAY_NAME_MAP = {**DAY_MAP, **{day: day for day in DAY_MAP.values()},
+                "tues": "tue", "weds": "wed", "thur": "thu", "thurs": "thu"}
+DAY_NAME_RE = re.compile(r"\b(" + "|".join(sorted(DAY_NAME_MAP, key=len, reverse=True)) + r")s?\b")
+ORDINAL_MAP = {"first": "1st", "second": "2nd", "third": "3rd", "fourth": "4th", "fifth": "5th", "last": "last",
+               "1st": "1st", "2nd": "2nd", "3rd": "3rd", "4th": "4th", "5th": "5th"}
+ORDINAL_RE = re.compile(r"\b(" + "|".join(ORDINAL_MAP) + r")\b")
+NUMBER_WORDS = {"two": 2, "three": 3, "four": 4, "five": 5, "six": 6}
+
 # dateparser doesn't recognize these nonstandard day abbreviations
 DAY_ABBR_FIXES = {"thur": "thu", "thurs": "thu", "tues": "tue", "weds": "wed"}
 
 TIEBREAKER_DURATION_MINUTES = 30
 
+# Abandoned poll setups are evicted after this long without interaction
+WIZARD_TTL_SECONDS = int(os.getenv("POLL_WIZARD_TTL_SECONDS", "300"))
+# Hard cap on concurrent poll setups per guild, so sessions can't grow without bound
+WIZARD_MAX_SESSIONS_PER_GUILD = int(os.getenv("POLL_WIZARD_MAX_SESSIONS_PER_GUILD", "25"))
+
+WIZARD_TITLES = {"create": "Create a scheduled poll", "modify": "Modify poll", "clone": "Clone poll"}
+
+# Limits on one /schedule import
+IMPORT_MAX_ROWS = 500
+IMPORT_MAX_BYTES = 1_000_000
+IMPORT_ERRORS_SHOWN = 10
+
+# A poll set to close early stays open at least this long, even once everyone has voted
+EARLY_CLOSE_MIN_OPEN_MINUTES = float(os.getenv("POLL_EARLY_CLOSE_MIN_OPEN_MINUTES", "60"))
+# How long an early-closing poll waits for its guild's member list without a member cache
+MEMBER_FETCH_TIMEOUT_SECONDS = 30
+
+# Server events created for winning options last this long
+EVENT_DURATION_HOURS = 3
+
+# Suggested options are the best event-length slots this many days ahead
+SUGGEST_DAYS = int(os.getenv("POLL_SUGGEST_DAYS", "14"))
+SUGGEST_COUNT = 5
+
+# Pause between adding reaction emojis so Discord doesn't rate-limit us
+REACTION_DELAY_SECONDS = 0.3
+
+
+def current_time(tz=pytz.utc):
+    """Return the current time in the given timezone.
+    All poll code reads the clock through here so the simulator can swap in a virtual clock."""
+    return datetime.now(tz)
+
 
 def normalize_shorthand_datetime(text):
     """Expand shorthand dateparser chokes on: bare am/pm ('7p' -> '7pm') and
@@ -44,7 +119,13 @@ def normalize_shorthand_datetime(text):
     return result
 
 
-def parse_timezone(text):
+def split_options(text):
+    """Split poll options given one per line, or comma-separated on a single line."""
+    separator = "\n" if "\n" in text else ","
+    return [o.strip() for o in text.split(separator) if o.strip()]
+
+
+def parse_timezone(text, default="US/Eastern"):
     """Extract timezone from text, defaulting to US/Eastern."""
     tz_aliases = {
         "est": "US/Eastern", "edt": "US/Eastern",
@@ -57,46 +138,191 @@ def parse_timezone(text):
     }
     lower = text.lower()
     for abbr, tz in tz_aliases.items():
-        if abbr in lower:
+        # Whole words only, so "CEST" isn't read as "EST" and "sunset" isn't "SET"
+        if re.search(rf"(?:\b|(?<=\d[ap]m)){abbr}\b", lower):
             return tz
-    return "US/Eastern"
+    return default
+
 
+def parse_recurrence(text, anchor=None, default_timezone="US/Eastern"):
+    """Parse a recurrence string like 'every Monday at 9am EST' into a schedule_cron dict,
+    or None if it isn't recurring or can't be understood. Also understands several days
+    ('every Mon, Wed and Fri at 7pm'), every N weeks ('every other Tuesday at 8pm',
+    'every 3 weeks on Friday'), monthly by weekday ('the first Monday of every month
+    at 9am') and skipped dates ('... except Dec 25 and Jan 1').
 
-def parse_recurrence(text):
-    """Parse a recurrence string like 'every Monday at 9am EST' into cron components.
-    Returns dict with cron fields or None if not recurring."""
-    lower = text.lower().strip()
+    An every-N-weeks schedule runs in the week of `anchor` (the first send) and every
+    Nth week after it."""
+    lower = normalize_shorthand_datetime(text.lower().strip())
     if lower == "none" or lower == "no":
         return None
 
-    # Strip leading "every" if present
-    cleaned = lower
-    if cleaned.startswith("every "):
-        cleaned = cleaned[6:]
+    # Skipped dates come last: "every friday at 7pm except dec 25 and jan 1"
+    exclude = []
+    match = re.search(r"\b(?:except|excluding|skipping|skip|but not)\b(.*)$", lower)
+    if match:
+        lower = lower[:match.start()].strip()
+        for part in re.split(r",|;|\band\b", match.group(1)):
+            if not part.strip():
+                continue
+            skipped = dateparser.parse(part.strip(), settings={'PREFER_DATES_FROM': 'future'})
+            if not skipped:
+                return None
+            exclude.append(skipped.date().isoformat())
+
+    hour_minute = _parse_time_of_day(lower)
+    if hour_minute is None:
+        return None
+
+    days = [DAY_NAME_MAP[m] for m in DAY_NAME_RE.findall(lower)]
+    if re.search(r"\bweekdays?\b", lower):
+        days += ["mon", "tue", "wed", "thu", "fri"]
+    if re.search(r"\bweekends?\b", lower):
+        days += ["sat", "sun"]
+    days = sorted(set(days), key=list(DAY_MAP.values()).index)
+
+    cron = {
+        "day_of_week": ",".join(days) or None,
+        "hour": hour_minute[0],
+        "minute": hour_minute[1],
+        "timezone": parse_timezone(text, default_timezone),
+    }
 
-    # Parse the time expression
-    parsed = dateparser.parse(cleaned, settings={
+    if re.search(r"\bmonth(?:ly)?\b", lower):
+        ordinals = [ORDINAL_MAP[m] for m in ORDINAL_RE.findall(lower)]
+        if not ordinals or not days:
+            return None
+        cron["day_of_week"] = None
+        cron["day"] = ",".join(f"{o} {d}" for o in dict.fromkeys(ordinals) for d in days)
+    else:
+        interval = 1
+        match = re.search(r"\bevery\s+(\d+|two|three|four|five|six)\s+weeks?\b", lower)
+        if match:
+            interval = int(NUMBER_WORDS.get(match.group(1), match.group(1)))
+        elif re.search(r"\b(?:every other|bi-?weekly|fortnightly)\b", lower):
+            interval = 2
+        if interval < 1:
+            return None
+        if interval > 1:
+            cron["interval_weeks"] = interval
+            if anchor is not None:
+                cron["anchor"] = anchor.astimezone(pytz.timezone(cron["timezone"])).date().isoformat()
+
+    if exclude:
+        cron["exclude"] = sorted(set(exclude))
+    return cron
+
+
+def _parse_time_of_day(text):
+    """(hour, minute) from the time in a recurrence string, or None."""
+    match = re.search(r"\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)\b", text) \
+        or re.search(r"\b(\d{1,2}):(\d{2})\b()", text) \
+        or re.search(r"\bat\s+(\d{1,2})()()\b(?!\s*(?:st|nd|rd|th)\b)", text)
+    if match:
+        hour, minute = int(match.group(1)), int(match.group(2) or 0)
+        if match.group(3) == "pm" and hour < 12:
+            hour += 12
+        elif match.group(3) == "am" and hour == 12:
+            hour = 0
+        if hour > 23 or minute > 59:
+            return None
+        return hour, minute
+    if re.search(r"\bnoon\b", text):
+        return 12, 0
+    if re.search(r"\bmidnight\b", text):
+        return 0, 0
+    # Anything else dateparser can read, as this parser always accepted
+    parsed = dateparser.parse(text.removeprefix("every "), settings={
         'PREFER_DATES_FROM': 'future',
         'RETURN_AS_TIMEZONE_AWARE': True,
     })
-    if not parsed:
-        return None
+    return (parsed.hour, parsed.minute) if parsed else None
 
-    # Find the day of week from the text
-    day_of_week = None
-    for day_name, cron_day in DAY_MAP.items():
-        if day_name in lower:
-            day_of_week = cron_day
-            break
 
-    tz = parse_timezone(text)
+AVAILABILITY_TIME_RE = re.compile(
+    r"\b(\d{1,2})(?::(\d{2}))?\s*(am|pm)?\s*(?:-|–|to|until|till)\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)?")
+AVAILABILITY_DAY_RANGE_RE = re.compile(
+    DAY_NAME_RE.pattern + r"\s*(?:-|–|to|through|thru)\s*" + DAY_NAME_RE.pattern)
 
-    return {
-        "day_of_week": day_of_week,
-        "hour": parsed.hour,
-        "minute": parsed.minute,
-        "timezone": tz,
-    }
+
+def _minute_of_day(hour, minute, meridiem):
+    if meridiem == "pm" and hour < 12:
+        hour += 12
+    elif meridiem == "am" and hour == 12:
+        hour = 0
+    if hour > 24 or minute > 59:
+        return None
+    return hour * 60 + minute
+
+
+def parse_availability(text):
+    """Parse weekly availability like 'Fri 7pm-11pm, Sat 12-6pm, weekdays after 8pm EST'
+    into (timezone, [(weekday, start minute, end minute)]), weekday 0 being Monday, or
+    None if any part can't be understood. Parts without a day keep the previous part's
+    days ('Sat 12-3pm, 7-11pm'), or mean every day if they come first. Windows ending
+    at or before their start run past midnight ('Fri 10pm-2am')."""
+    lower = normalize_shorthand_datetime(text.lower().strip())
+    order = list(DAY_MAP.values())
+    days = list(range(7))
+    windows = []
+    for part in re.split(r"[,;\n]", lower):
+        part = part.strip()
+        if not part:
+            continue
+        part_days = []
+        for first, last in ((DAY_NAME_MAP[a], DAY_NAME_MAP[b]) for a, b in AVAILABILITY_DAY_RANGE_RE.findall(part)):
+            i, j = order.index(first), order.index(last)
+            part_days += [order[d % 7] for d in range(i, j + 1 if j >= i else j + 8)]
+        part_days += [DAY_NAME_MAP[m] for m in DAY_NAME_RE.findall(part)]
+        if re.search(r"\bweekdays?\b", part):
+            part_days += order[:5]
+        if re.search(r"\bweekends?\b", part):
+            part_days += order[5:]
+        if re.search(r"\b(?:daily|every ?day|any ?day)\b", part):
+            part_days += order
+        if part_days:
+            days = sorted({order.index(d) for d in part_days})
+
+        if re.search(r"\ball day\b", part):
+            start, end = 0, 24 * 60
+        elif match := AVAILABILITY_TIME_RE.search(part):
+            end = _minute_of_day(int(match.group(4)), int(match.group(5) or 0), match.group(6))
+            meridiem = match.group(3)
+            if meridiem is None and match.group(6):
+                # "7-11pm" is 7pm to 11pm, but "11-2pm" is 11am to 2pm
+                meridiem = match.group(6)
+                if (_minute_of_day(int(match.group(1)), 0, meridiem) or 0) >= (end or 0):
+                    meridiem = "am"
+            start = _minute_of_day(int(match.group(1)), int(match.group(2) or 0), meridiem)
+        elif match := re.search(r"\b(?:after|from)\s+(\d{1,2})(?::(\d{2}))?\s*(am|pm)?", part):
+            start, end = _minute_of_day(int(match.group(1)), int(match.group(2) or 0), match.group(3)), 24 * 60
+        else:
+            return None
+        if start is None or end is None:
+            return None
+        if end <= start:
+            end += 24 * 60
+        windows += [(day, start, end) for day in days]
+    if not windows:
+        return None
+    return parse_timezone(text), sorted(set(windows))
+
+
+def parse_option_time(label, base, default_tz):
+    """Parse an option label like "Sat 7pm EST" into (start_time, timezone name), reading
+    relative days against `base` (the poll's send time) so "Saturday" means the Saturday
+    of the week the poll runs. Returns (None, None) for labels that aren't times."""
+    tz_name = parse_timezone(label, default=default_tz)
+    tz = pytz.timezone(tz_name)
+    parsed = dateparser.parse(normalize_shorthand_datetime(label), settings={
+        'PREFER_DATES_FROM': 'future',
+        'RELATIVE_BASE': base.astimezone(tz).replace(tzinfo=None),
+        'TIMEZONE': tz_name,
+        'RETURN_AS_TIMEZONE_AWARE': True,
+    })
+    if not parsed:
+        return None, None
+    return parsed.astimezone(tz), tz_name
 
 
 def to_discord_timestamp(dt, style="F"):
@@ -110,119 +336,255 @@ class Polls(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         self.polls = {}
-        self.active_creations = {}  # (guild_id, user_id) -> creation state
+        # Bumped on every save, so readers of self.polls (the HTTP API) can tell when it changed
+        self.revision = 0
+        self.store_format = poll_store.resolve_format(STORE_FORMAT)
+        self.scheduler = PollScheduler(
+            {"send": self.post_poll, "resolve": self.resolve_poll, "archive": self.archive_job,
+             "outbox": self.drain_outbox},
+            clock=lambda: current_time(pytz.utc),
+        )
+        self.outbox = Outbox(
+            OUTBOX_PATH,
+            {"tally": self._effect_tally, "results": self._effect_results, "notice": self._effect_notice,
+             "tiebreaker": self._effect_tiebreaker, "event": self._effect_event,
+             "recurrence": self._effect_recurrence},
+            clock=lambda: current_time(pytz.utc),
+            # Missing permissions or a deleted channel won't fix themselves
+            permanent=(discord.Forbidden, discord.NotFound),
+            # An outage or a dropped connection will, however long it lasts
+            transient=(discord.DiscordServerError, aiohttp.ClientError, asyncio.TimeoutError, OSError),
+            on_give_up=self._effect_given_up,
+        )
+        # Set once the first on_ready has reconciled the scheduler with the store;
+        # later on_ready events after gateway reconnects leave the schedule alone.
+        self.reconciled = False
+        # (guild_id, user_id) -> creation state, expired proactively after WIZARD_TTL_SECONDS
+        self.active_creations = SessionStore(WIZARD_TTL_SECONDS, WIZARD_MAX_SESSIONS_PER_GUILD,
+                                             on_expire=self._on_session_expired)
+        # Voters on posted polls that close early or are tallied by rank, kept current
+        # from reaction events
+        self.tallies = {}  # poll ID -> VoterTally
+        self.vote_messages = {}  # message ID -> poll ID, for every active poll
+        self.timelines = {}  # poll ID -> VoteTimeline of its current posting
+        self.availability = AvailabilityStore(AVAILABILITY_PATH)
+        self.events = EventCache(EVENTS_PATH, clock=lambda: current_time(pytz.utc))
+        self.analytics = PollAnalytics(clock=lambda: current_time(pytz.utc))
         self.load_polls()
+        self.search_index = SearchIndex(SEARCH_INDEX_PATH, "Polls")
+        if not self.search_index.loaded:
+            self.search_index.rebuild(self._search_documents())
+
+    async def cog_load(self):
+        self.active_creations.start()
+        self.scheduler.start()
+
+    async def cog_unload(self):
+        self.active_creations.stop()
+        self.scheduler.stop()
 
     def save_polls(self):
-        with open(DATA_PATH, "w") as f:
-            json.dump({"polls": self.polls}, f, indent=2, default=str)
+        poll_store.save_snapshot(DATA_PATH, self.store_format, self.polls, self.analytics.to_dict())
+        self.revision += 1
 
     def load_polls(self):
-        try:
-            with open(DATA_PATH, "r") as f:
-                content = f.read()
-                if content:
-                    data = json.loads(content)
-                    self.polls = data.get("polls", {})
-                    print(f"Loaded {len(self.polls)} polls.")
-                else:
-                    self.polls = {}
-        except FileNotFoundError:
-            self.polls = {}
+        analytics = {}
+        self.polls = poll_store.load_snapshot(DATA_PATH, self.store_format, analytics)
+        self.analytics = PollAnalytics(analytics, clock=self.analytics.clock)
+        if self.polls:
+            print(f"Loaded {len(self.polls)} polls.")
+        # Tallies are rebuilt from the message on the first reaction after a restart;
+        # timelines can't be, so those of polls posted before it are incomplete
+        active = {pid: p for pid, p in self.polls.items() if p.status == "active" and p.active_message_id}
+        self.vote_messages = {p.active_message_id: pid for pid, p in active.items()}
+        self.timelines = {pid: VoteTimeline(p.next_send_time, [o.emoji for o in p.options], complete=False)
+                          for pid, p in active.items()}
 
     @commands.Cog.listener()
     async def on_ready(self):
-        """Restore scheduler jobs for existing polls AFTER the scheduler has started.
-
-        Previously this was in cog_load(), which runs before the scheduler starts.
-        Jobs registered before scheduler.start() with near-future trigger times
-        would misfire and be silently skipped by APScheduler's default 1-second
-        misfire_grace_time.
-        """
-        registered = 0
+        """Restore scheduled sends and resolves for existing polls once the bot
+        can see its channels, so nothing fires before post_poll can find them.
+
+        discord.py fires on_ready again after gateway reconnects; the scheduler
+        lives in this process and is already up to date then, so only the first
+        one does any work."""
+        if self.reconciled:
+            print("[Polls] on_ready after reconnect; schedule already reconciled")
+            return
+        self.reconciled = True
+        report = self.reconcile_schedule()
+        print(f"[Polls] Reconciled scheduler with {report['checked']} polls: {self._describe_reconcile(report)}")
+        # Resume side effects left pending by the previous run
+        self._kick_outbox()
+
+        self.archive_completed_polls()
+        self.scheduler.schedule(None, "archive", repeat=timedelta(hours=ARCHIVE_INTERVAL_HOURS))
+        self._forget_missing_events()
+
+    def reconcile_schedule(self, guild_id=None):
+        """Make the scheduler match the poll store, touching only polls whose pending
+        send or resolve is missing, stale, or shouldn't exist. Scheduler entries for
+        polls that are no longer stored are dropped when reconciling every guild.
+
+        Returns {"checked": n, "added": [...], "rescheduled": [...], "removed": [...]}
+        with "<short id> <action>" descriptions of each fix."""
+        now = current_time(pytz.utc)
+        report = {"checked": 0, "added": [], "rescheduled": [], "removed": []}
+        # A parent stays active while its tiebreaker runs; the tiebreaker resolves it.
+        awaiting_tiebreaker = {p.parent_poll_id for p in self.polls.values()
+                               if p.is_tiebreaker and p.status != "completed"}
+        register = {"send": self._register_send_job, "resolve": self._register_resolve_job}
+
         for poll_id, poll in self.polls.items():
-            if poll["status"] == "scheduled":
-                self._register_send_job(poll_id, poll)
-                registered += 1
-            elif poll["status"] == "active":
-                self._register_resolve_job(poll_id, poll)
-                registered += 1
-        print(f"[Polls] Registered {registered} scheduler jobs for {len(self.polls)} polls.")
+            if guild_id is not None and poll.guild_id != guild_id:
+                continue
+            report["checked"] += 1
+            expected = None
+            if poll.status == "scheduled":
+                expected = "send"
+            elif poll.status == "active" and poll_id not in awaiting_tiebreaker:
+                expected = "resolve"
+            for action in ("send", "resolve"):
+                entry = self.scheduler.entry(poll_id, action)
+                label = f"{poll_id[:8]} {action}"
+                if action != expected:
+                    if entry:
+                        self.scheduler.cancel(poll_id, action)
+                        report["removed"].append(label)
+                elif entry is None:
+                    register[action](poll_id, poll)
+                    report["added"].append(label)
+                elif not self._entry_matches(poll, action, entry, now):
+                    register[action](poll_id, poll)
+                    report["rescheduled"].append(label)
+
+        if guild_id is None:
+            for poll_id, action in self.scheduler.keys():
+                if poll_id is not None and poll_id not in self.polls:
+                    self.scheduler.cancel(poll_id, action)
+                    report["removed"].append(f"{poll_id[:8]} {action}")
+        return report
+
+    def _entry_matches(self, poll, action, entry, now):
+        """Whether a pending scheduler entry is what registering the poll now would produce.
+        Past-due work only needs to be queued, not pushed back to "5s from now" again."""
+        fire_time, entry_cron = entry
+        if action == "send":
+            if poll.recurring and poll.schedule_cron and poll.next_send_time <= now:
+                return entry_cron == cron_key(poll.schedule_cron)
+            due = poll.next_send_time
+        else:
+            due = self._resolve_time(poll)
+        if entry_cron is not None:
+            return False
+        return due <= now or abs((fire_time - due).total_seconds()) < 1
+
+    @staticmethod
+    def _describe_reconcile(report):
+        fixes = [f"{len(report[k])} {k}" for k in ("added", "rescheduled", "removed") if report[k]]
+        return ", ".join(fixes) or "nothing to fix"
+
+    # ---- Search ----
+
+    @staticmethod
+    def _search_document(poll):
+        """(doc ID, guild ID, channel ID, result line, text) for the search index."""
+        return (poll.id, poll.guild_id, None, f"`{poll.id[:8]}` {poll.question}",
+                " ".join([poll.question, *(o.label for o in poll.options)]))
+
+    def _search_documents(self):
+        """Every archived and live poll, oldest first, except tiebreakers (their options are the parent's)."""
+        archived = (poll_from_dict(p) for p in poll_archive.iter_archive(ARCHIVE_PATH))
+        for poll in (*archived, *self.polls.values()):
+            if not poll.is_tiebreaker:
+                yield self._search_document(poll)
+
+    def _index_poll(self, poll):
+        if not poll.is_tiebreaker:
+            self.search_index.upsert(*self._search_document(poll))
+
+    async def archive_job(self):
+        self.archive_completed_polls()
+
+    def archive_completed_polls(self):
+        """Move completed polls (including finished tiebreakers) older than ARCHIVE_AFTER_DAYS
+        out of the live store and into the append-only archive. Returns how many moved."""
+        cutoff = current_time(pytz.utc) - timedelta(days=ARCHIVE_AFTER_DAYS)
+        stale = [pid for pid, p in self.polls.items()
+                 if p.status == "completed" and self._completed_at(p) <= cutoff]
+        if not stale:
+            return 0
+
+        # Append before removing: a crash in between duplicates an archive entry
+        # rather than losing the poll.
+        poll_archive.append_polls(ARCHIVE_PATH, [poll_to_dict(self.polls[pid]) for pid in stale])
+        for pid in stale:
+            # A tally whose effect was given up on would otherwise outlive its poll
+            self._stop_tracking(pid)
+            del self.polls[pid]
+        self.save_polls()
+        print(f"[Polls] Archived {len(stale)} completed polls; {len(self.polls)} remain in the live store.")
+        return len(stale)
+
+    def _completed_at(self, poll):
+        """When a poll finished. Polls completed before completed_at was recorded fall back
+        to their scheduled close time."""
+        if poll.completed_at:
+            return poll.completed_at
+        return poll.next_send_time + timedelta(hours=poll.poll_duration_hours)
 
     def _register_send_job(self, poll_id, poll):
-        """Register a scheduler job to post a poll."""
-        scheduler = self.bot.scheduler
+        """Schedule a poll's send, replacing any pending one."""
         short_id = poll_id[:8]
 
-        # Check if next_send_time is in the future — if so, use a DateTrigger
+        # Check if next_send_time is in the future — if so, schedule it once
         # for the initial send regardless of whether the poll is recurring.
-        # After the poll fires, _handle_recurrence will re-register with a
-        # CronTrigger for subsequent recurring sends.
-        send_time = datetime.fromisoformat(poll["next_send_time"])
-        tz = pytz.timezone(poll.get("schedule_timezone", "US/Eastern"))
-        now = datetime.now(tz)
-        if send_time.tzinfo is None:
-            send_time = tz.localize(send_time)
+        # After the poll fires, _handle_recurrence will re-register on its
+        # cron schedule for subsequent recurring sends.
+        send_time = poll.next_send_time
+        now = current_time(poll.tz)
 
-        use_cron = (poll.get("recurring") and poll.get("schedule_cron")
-                    and send_time <= now)
+        use_cron = poll.recurring and poll.schedule_cron and send_time <= now
 
         if use_cron:
             # Recurring poll that has already had its initial send —
-            # use CronTrigger for the next occurrence
-            cron = poll["schedule_cron"]
-            trigger = CronTrigger(
-                day_of_week=cron.get("day_of_week"),
-                hour=cron["hour"],
-                minute=cron["minute"],
-                timezone=cron.get("timezone", "US/Eastern"),
-            )
+            # follow the cron schedule, shared with every poll on the same one
+            fire_time = self.scheduler.schedule_cron(poll_id, "send", poll.schedule_cron)
             print(f"[Polls] Registering recurring send job for poll {short_id} "
-                  f"(cron: day={cron.get('day_of_week')}, {cron['hour']}:{cron.get('minute', 0):02d} "
-                  f"{cron.get('timezone', 'US/Eastern')})")
+                  f"({describe_recurrence(poll.schedule_cron)}), next send {fire_time.isoformat()}")
         else:
             # Initial send (one-shot or first occurrence of recurring poll)
             if send_time <= now:
                 print(f"[Polls] Poll {short_id} send time is in the past ({send_time}), scheduling for 5s from now")
                 send_time = now + timedelta(seconds=5)
-            trigger = DateTrigger(run_date=send_time)
-            recurring_note = " (first occurrence of recurring poll)" if poll.get("recurring") else ""
+            self.scheduler.schedule(poll_id, "send", send_time)
+            recurring_note = " (first occurrence of recurring poll)" if poll.recurring else ""
             print(f"[Polls] Registering one-shot send job for poll {short_id} at {send_time.isoformat()}{recurring_note}")
 
-        scheduler.add_job(
-            self.post_poll,
-            trigger,
-            args=[poll_id],
-            id=f"poll_send_{poll_id}",
-            replace_existing=True,
-        )
-        print(f"[Polls] Job poll_send_{short_id} added to scheduler (scheduler running: {scheduler.running})")
-
     def _register_resolve_job(self, poll_id, poll):
-        """Register a scheduler job to resolve a poll."""
-        scheduler = self.bot.scheduler
+        """Schedule a poll's resolution, replacing any pending one."""
         short_id = poll_id[:8]
-        send_time = datetime.fromisoformat(poll["next_send_time"])
-        tz = pytz.timezone(poll.get("schedule_timezone", "US/Eastern"))
-        if send_time.tzinfo is None:
-            send_time = tz.localize(send_time)
-        resolve_time = send_time + timedelta(hours=poll["poll_duration_hours"])
+        resolve_time = self._resolve_time(poll)
 
-        now = datetime.now(tz)
+        now = current_time(poll.tz)
 
         if resolve_time <= now:
             print(f"[Polls] Poll {short_id} resolve time is in the past ({resolve_time}), scheduling for 5s from now")
             resolve_time = now + timedelta(seconds=5)
 
-        scheduler.add_job(
-            self.resolve_poll,
-            DateTrigger(run_date=resolve_time),
-            args=[poll_id],
-            id=f"poll_resolve_{poll_id}",
-            replace_existing=True,
-        )
+        self.scheduler.schedule(poll_id, "resolve", resolve_time)
         print(f"[Polls] Registered resolve job for poll {short_id} at {resolve_time.isoformat()}")
 
+    def _resolve_time(self, poll):
+        """When a posted poll closes: after its full duration, or once everyone it pinged
+        has voted, if it closes early and has been open EARLY_CLOSE_MIN_OPEN_MINUTES."""
+        close = poll.next_send_time + timedelta(hours=poll.poll_duration_hours)
+        tally = self.tallies.get(poll.id)
+        if tally is not None and tally.quorum_at is not None:
+            earliest = poll.next_send_time + timedelta(minutes=EARLY_CLOSE_MIN_OPEN_MINUTES)
+            return min(close, max(tally.quorum_at, earliest))
+        return close
+
     async def post_poll(self, poll_id):
         """Post a poll message with reaction emojis."""
         short_id = poll_id[:8]
@@ -233,25 +595,32 @@ class Polls(commands.Cog):
             return
 
         # Use the target post channel, not the setup channel
-        post_channel_id = poll.get("post_channel_id", poll["channel_id"])
-        channel = self.bot.get_channel(post_channel_id)
-        if not channel:
-            print(f"[Polls] Could not find channel {post_channel_id} for poll {short_id}")
+        post_channel_id = poll.target_channel_id
+        try:
+            channel = await self._fetch_channel(post_channel_id)
+        except discord.HTTPException as e:
+            print(f"[Polls] Could not find channel {post_channel_id} for poll {short_id}: {e!r}")
             return
 
-        now = datetime.now(pytz.utc)
-        end_time = now + timedelta(hours=poll["poll_duration_hours"])
+        now = current_time(pytz.utc)
+        end_time = now + timedelta(hours=poll.poll_duration_hours)
 
         # Build the poll embed
         embed = discord.Embed(
-            title=poll["question"],
+            title=poll.question,
             color=discord.Color.blue(),
             timestamp=now,
         )
 
+        if poll.recurring:
+            self._roll_option_times(poll, now)
+
         options_text = ""
-        for i, option in enumerate(poll["options"]):
-            options_text += f"{option['emoji']} {option['label']}\n"
+        for option in poll.options:
+            options_text += f"{option.emoji} {option.label}"
+            if option.start_time:
+                options_text += f" — {to_discord_timestamp(option.start_time, 'f')}"
+            options_text += "\n"
         embed.add_field(name="Options", value=options_text, inline=False)
 
         # Use Discord timestamps so everyone sees their own timezone
@@ -260,30 +629,59 @@ class Polls(commands.Cog):
             value=f"{to_discord_timestamp(end_time, 'F')} ({to_discord_timestamp(end_time, 'R')})",
             inline=False,
         )
-        embed.set_footer(text=f"React to vote! Minimum {poll['vote_threshold']} votes needed per option.")
+        if poll.tally_method:
+            embed.add_field(name="Counting", value=METHOD_NAMES[poll.tally_method], inline=False)
+            embed.set_footer(text=f"React in order of preference: your first reaction is your first choice. "
+                                  f"Minimum {poll.vote_threshold} votes needed per option.")
+        else:
+            embed.set_footer(text=f"React to vote! Minimum {poll.vote_threshold} votes needed per option.")
+
+        # Who an early-closing poll waits for, found before posting so no vote can
+        # arrive before the poll is tracked
+        expected = await self._expected_voters(poll, channel)
 
         # Send with ping
-        ping = poll.get("ping_target", "")
-        msg = await channel.send(content=ping, embed=embed)
+        msg = await channel.send(content=poll.ping_target, embed=embed)
 
         # Add reaction emojis
-        for option in poll["options"]:
-            await msg.add_reaction(option["emoji"])
-            await asyncio.sleep(0.3)
+        for option in poll.options:
+            await msg.add_reaction(option.emoji)
+            await asyncio.sleep(REACTION_DELAY_SECONDS)
 
         # Update poll state
-        poll["active_message_id"] = msg.id
-        poll["post_channel_id"] = post_channel_id
-        poll["status"] = "active"
-        poll["next_send_time"] = now.isoformat()
+        poll.active_message_id = msg.id
+        poll.post_channel_id = post_channel_id
+        poll.status = "active"
+        poll.next_send_time = now
         self.save_polls()
         print(f"[Polls] Poll {short_id} state changed: scheduled -> active (message {msg.id})")
+        self.vote_messages[msg.id] = poll_id
+        self.timelines[poll_id] = VoteTimeline(now, [o.emoji for o in poll.options])
+        if self._tracks_votes(poll):
+            self._track_voters(poll, expected)
 
         # Schedule resolution
         self._register_resolve_job(poll_id, poll)
 
+    def _roll_option_times(self, poll, now):
+        """Move option start times forward by as many days as this posting is after the
+        last one, keeping their local wall-clock time in each option's timezone."""
+        tz = poll.tz
+        days = (now.astimezone(tz).date() - poll.next_send_time.astimezone(tz).date()).days
+        if days <= 0:
+            return
+        for option in poll.options:
+            if option.start_time:
+                option_tz = pytz.timezone(option.timezone or poll.schedule_timezone)
+                local = option.start_time.astimezone(option_tz).replace(tzinfo=None) + timedelta(days=days)
+                option.start_time = option_tz.localize(local)
+
     async def resolve_poll(self, poll_id):
-        """Resolve a poll: count votes, announce results, create event."""
+        """Resolve a poll: queue its tally in the outbox, which counts the votes and
+        queues the announcement, event, tiebreaker and recurrence that follow.
+
+        Queuing is idempotent per poll cycle, so resolving the same cycle twice
+        (e.g. after a restart) only ever acts once."""
         short_id = poll_id[:8]
         print(f"[Polls] resolve_poll fired for poll {short_id}")
         poll = self.polls.get(poll_id)
@@ -291,85 +689,409 @@ class Polls(commands.Cog):
             print(f"[Polls] Poll {short_id} not found in self.polls, aborting")
             return
 
-        post_channel_id = poll.get("post_channel_id", poll["channel_id"])
-        channel = self.bot.get_channel(post_channel_id)
-        if not channel:
+        # Later reactions don't count; the tally itself is kept for the "tally" effect
+        self._stop_tracking(poll_id, keep_tally=True)
+        self._fold_timeline(poll)
+        if not self._queue_effect(poll, "tally") and self._stalled(poll):
+            # Counted (or given up on) already, but nothing left will ever move it on:
+            # a poll stuck before failed tallies ended their posting
+            print(f"[Polls] Poll {short_id} was resolved but never moved on; ending this posting")
+            self._queue_effect(poll, "recurrence")
+        self._kick_outbox()
+
+    def _stalled(self, poll):
+        """Whether an active poll's posting has nothing pending in the outbox and no
+        tiebreaker running, so no effect will ever complete or reschedule it."""
+        if poll.status != "active":
+            return False
+        prefix = f"{poll.id}:{self._cycle(poll)}:"
+        if any(key.startswith(prefix) for key in self.outbox.entries):
+            return False
+        return not any(p.is_tiebreaker and p.parent_poll_id == poll.id and p.status != "completed"
+                       for p in self.polls.values())
+
+    def _fold_timeline(self, poll):
+        """Append the posting's vote timeline to the timeline archive and let it go."""
+        timeline = self.timelines.pop(poll.id, None)
+        if timeline is None:
             return
+        poll_archive.append_polls(TIMELINES_PATH, [{
+            "poll_id": poll.id, "guild_id": poll.guild_id, "cycle": self._cycle(poll),
+            "tiebreaker": poll.is_tiebreaker, "duration_hours": poll.poll_duration_hours,
+            **timeline.fold(poll.poll_duration_hours),
+        }])
+
+    # ---- Vote tracking ----
+
+    @staticmethod
+    def _tracks_votes(poll):
+        """Whether the poll needs who voted for what as it happens: to close early, or
+        to rank voters' choices by the order they reacted in."""
+        return bool(poll.early_close or poll.tally_method)
+
+    async def _expected_voters(self, poll, channel):
+        """IDs of the members an early-closing poll waits for: the pinged role's members
+        who can see the poll's channel, bots aside. Without a full member cache (the
+        lean runtime profile) the guild's members are requested once, uncached.
+        Without the Server Members intent nobody can be listed, so the poll runs its
+        full duration."""
+        if not poll.early_close:
+            return set()
+        if not self.bot.intents.members:
+            print(f"[Polls] Poll {poll.id[:8]} closes early, but the Server Members intent is off "
+                  f"(MEMBERS_INTENT); it will stay open its full duration")
+            return set()
+        guild = channel.guild
+        role = quorum_role(guild, poll.ping_target)
+        if role is None:
+            return set()
+        if guild.chunked:
+            members = role.members
+        else:
+            try:
+                members = await asyncio.wait_for(guild.chunk(cache=False), MEMBER_FETCH_TIMEOUT_SECONDS)
+            except (asyncio.TimeoutError, discord.ClientException) as e:
+                print(f"[Polls] Could not fetch the members of guild {guild.id}: {e!r}")
+                return set()
+            members = [m for m in members if role.is_default() or m.get_role(role.id)]
+        return {m.id for m in members if not m.bot and channel.permissions_for(m).read_messages}
+
+    def _new_tally(self, poll, expected):
+        if poll.early_close and not expected and self.bot.intents.members:
+            print(f"[Polls] Poll {poll.id[:8]} closes early, but no members of {poll.ping_target or 'its ping'!r} "
+                  f"can be seen to wait for; it will stay open its full duration")
+        return VoterTally(poll.active_message_id, [o.emoji for o in poll.options], expected)
+
+    def _track_voters(self, poll, expected):
+        """Start an empty tally for a poll that was just posted."""
+        tally = self._new_tally(poll, expected)
+        self.tallies[poll.id] = tally
+        self.vote_messages[poll.active_message_id] = poll.id
+        return tally
+
+    def _stop_tracking(self, poll_id, keep_tally=False):
+        tally = self.tallies.get(poll_id) if keep_tally else self.tallies.pop(poll_id, None)
+        if tally is not None:
+            self.vote_messages.pop(tally.message_id, None)
+        poll = self.polls.get(poll_id)
+        if poll is not None and poll.active_message_id is not None:
+            self.vote_messages.pop(poll.active_message_id, None)
+
+    async def _recount(self, poll, channel, msg):
+        """A tally of the poll's voters rebuilt from its message's reactions."""
+        tally = self._new_tally(poll, await self._expected_voters(poll, channel))
+        for reaction in msg.reactions:
+            emoji = str(reaction.emoji)
+            if emoji in tally.emojis:
+                async for user in reaction.users():
+                    if user.id != self.bot.user.id:
+                        tally.add(user.id, emoji)
+        return tally
+
+    async def _rebuild_tally(self, poll):
+        """Recount a tracked poll's voters from its message after a restart, and resume
+        tracking it."""
+        try:
+            channel = await self._fetch_channel(poll.target_channel_id)
+            msg = await channel.fetch_message(poll.active_message_id)
+        except discord.HTTPException as e:
+            print(f"[Polls] Could not recount voters for poll {poll.id[:8]}: {e!r}")
+            return None
+        tally = await self._recount(poll, channel, msg)
+        self.tallies[poll.id] = tally
+        self.vote_messages[poll.active_message_id] = poll.id
+        print(f"[Polls] Recounted poll {poll.id[:8]}: {len(tally)} voter(s), "
+              f"{len(tally.missing)} of {len(tally.expected)} still to vote")
+        return tally
 
-        # Fetch the poll message to read reactions
+    @commands.Cog.listener()
+    async def on_raw_reaction_add(self, payload):
+        await self._on_vote_changed(payload, added=True)
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, payload):
+        await self._on_vote_changed(payload, added=False)
+
+    async def _on_vote_changed(self, payload, added):
+        """Add one reaction event to an active poll's timeline and, if it's tracked, its
+        tally. Raw events arrive whether or not the message is cached, and anything
+        that isn't an active poll's message is dropped with a single dict lookup."""
+        poll_id = self.vote_messages.get(payload.message_id)
+        if poll_id is None or payload.user_id == self.bot.user.id:
+            return
+        poll = self.polls.get(poll_id)
+        if not poll or poll.status != "active" or poll.active_message_id != payload.message_id:
+            self.vote_messages.pop(payload.message_id, None)
+            if getattr(self.tallies.get(poll_id), "message_id", None) == payload.message_id:
+                del self.tallies[poll_id]
+            return
+
+        timeline = self.timelines.get(poll_id)
+        if timeline is not None:
+            timeline.record(current_time(pytz.utc), str(payload.emoji), added)
+        if not self._tracks_votes(poll):
+            return
+        tally = self.tallies.get(poll_id)
+        if tally is None:
+            # The fetched reactions already include this event
+            tally = await self._rebuild_tally(poll)
+            if tally is None:
+                return
+        elif added:
+            tally.add(payload.user_id, str(payload.emoji))
+        else:
+            tally.remove(payload.user_id, str(payload.emoji))
+        if poll.early_close:
+            self._check_quorum(poll, tally)
+
+    def _check_quorum(self, poll, tally):
+        """Bring the poll's resolve forward when its last expected voter votes, and put
+        it back if one of them withdraws before it fires."""
+        if tally.has_quorum and tally.quorum_at is None:
+            tally.quorum_at = current_time(pytz.utc)
+            resolve_time = self._resolve_time(poll)
+            self.scheduler.schedule(poll.id, "resolve", resolve_time)
+            print(f"[Polls] Poll {poll.id[:8]}: all {len(tally.expected)} expected voters have voted, "
+                  f"closing at {resolve_time.isoformat()}")
+        elif not tally.has_quorum and tally.quorum_at is not None:
+            tally.quorum_at = None
+            print(f"[Polls] Poll {poll.id[:8]}: a vote was withdrawn, so it stays open its full duration")
+            self._register_resolve_job(poll.id, poll)
+
+    def _cycle(self, poll):
+        """Identifies one posting of a poll; recurring polls get a new cycle every time they post."""
+        return int(poll.next_send_time.timestamp())
+
+    def _queue_effect(self, poll, kind, payload=None, save=True):
+        """Add one side effect of resolving the poll's current cycle to the outbox."""
+        cycle = self._cycle(poll)
+        key = f"{poll.id}:{cycle}:{kind}"
+        return self.outbox.add(key, kind, poll.id, {"cycle": cycle, **(payload or {})}, save=save)
+
+    def _kick_outbox(self):
+        """Schedule the next outbox drain for when its soonest entry is due."""
+        next_attempt = self.outbox.next_attempt_time()
+        if next_attempt is None:
+            self.scheduler.cancel(None, "outbox")
+            return
+        when = datetime.fromtimestamp(next_attempt, pytz.utc)
+        self.scheduler.schedule(None, "outbox", max(when, current_time(pytz.utc)))
+
+    async def drain_outbox(self):
+        succeeded, retrying, failed = await self.outbox.drain()
+        if retrying or failed:
+            print(f"[Polls] Outbox: {succeeded} done, {retrying} retrying, {failed} given up, "
+                  f"{len(self.outbox)} pending")
+        self._kick_outbox()
+
+    def _current_cycle_poll(self, entry, status="active"):
+        """The entry's poll, if it's still in the state and cycle the effect was queued for."""
+        poll = self.polls.get(entry["poll_id"])
+        if poll and poll.status == status and self._cycle(poll) == entry["payload"]["cycle"]:
+            return poll
+        return None
+
+    async def _fetch_channel(self, channel_id):
+        """The channel from the cache, or fetched if it isn't there (yet). A deleted or
+        hidden channel raises NotFound or Forbidden, which the outbox doesn't retry."""
+        return self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+
+    async def _effect_tally(self, entry):
+        """Count votes and queue everything resolving the poll involves, in one outbox write."""
+        poll = self._current_cycle_poll(entry)
+        if not poll:
+            return
+        channel = await self._fetch_channel(poll.target_channel_id)
+
+        # Fetch the poll message to read reactions. NotFound means it was deleted;
+        # anything else is probably transient and propagates so the outbox retries.
         try:
-            msg = await channel.fetch_message(poll["active_message_id"])
-        except (discord.NotFound, discord.HTTPException):
-            await channel.send(f"Could not find poll message for **{poll['question']}**. Poll resolution failed.")
+            msg = await channel.fetch_message(poll.active_message_id)
+        except discord.NotFound:
+            self._queue_effect(poll, "notice", {
+                "channel_id": channel.id,
+                "content": f"Could not find poll message for **{poll.question}**. Poll resolution failed.",
+            }, save=False)
+            self._queue_effect(poll, "recurrence", {"stats": {"outcome": "lost", "tiebreaker": poll.is_tiebreaker}})
             return
 
         # Count votes (subtract 1 for the bot's own reaction)
         results = []
-        for i, option in enumerate(poll["options"]):
-            emoji = option["emoji"]
+        for option in poll.options:
+            emoji = option.emoji
             vote_count = 0
             for reaction in msg.reactions:
                 if str(reaction.emoji) == emoji:
                     vote_count = reaction.count - 1
                     break
             results.append({
-                "label": option["label"],
+                "label": option.label,
                 "emoji": emoji,
                 "votes": vote_count,
+                "start_time": option.start_time.isoformat() if option.start_time else None,
+                "timezone": option.timezone,
             })
 
-        # Sort by votes descending
-        results.sort(key=lambda x: x["votes"], reverse=True)
-
-        # Filter by threshold
-        threshold = poll.get("vote_threshold", 0)
-        qualifying = [r for r in results if r["votes"] >= threshold]
-
-        # Check for ties at the top
-        if len(qualifying) >= 2 and qualifying[0]["votes"] == qualifying[1]["votes"]:
-            top_votes = qualifying[0]["votes"]
-            tied = [r for r in qualifying if r["votes"] == top_votes]
+        threshold = poll.vote_threshold
+        decided_by = None
+        if poll.tally_method:
+            results, qualifying, tied, decided_by = await self._rank_results(poll, channel, msg, results)
+        else:
+            # Sort by votes descending
+            results.sort(key=lambda x: x["votes"], reverse=True)
+
+            # Filter by threshold
+            qualifying = [r for r in results if r["votes"] >= threshold]
+
+            # Check for ties at the top
+            tied = []
+            if len(qualifying) >= 2 and qualifying[0]["votes"] == qualifying[1]["votes"]:
+                tied = [r for r in qualifying if r["votes"] == qualifying[0]["votes"]]
+        tally = self.tallies.get(poll.id)
+        if tally is not None and tally.message_id == msg.id:
+            del self.tallies[poll.id]
+
+        stats = {"outcome": "below_threshold", "votes": sum(r["votes"] for r in results),
+                 "tiebreaker": poll.is_tiebreaker}
+        announcement = {
+            "channel_id": channel.id,
+            "question": poll.question,
+            "ping_target": poll.ping_target,
+            "resolved_at": current_time(pytz.utc).isoformat(),
+            "decided_by": decided_by,
+        }
 
+        if tied:
             # Check if this is already a tiebreaker poll
-            if poll.get("is_tiebreaker"):
+            if poll.is_tiebreaker:
                 # Tiebreaker also tied — announce all tied options, no event
-                await self._announce_unresolved_tie(channel, poll, tied)
+                self._queue_effect(poll, "results", {**announcement, "outcome": "unresolved_tie", "tied": tied},
+                                   save=False)
+                stats["outcome"] = "unresolved_tie"
             else:
-                # Run a tiebreaker poll
-                await self._run_tiebreaker(channel, poll, poll_id, tied)
-                return  # Don't do normal recurrence yet; tiebreaker handles it
+                # Run a tiebreaker poll; its resolution handles recurrence
+                how = f"under {decided_by}" if decided_by else f"with {tied[0]['votes']} vote(s) each"
+                self._queue_effect(poll, "notice", {
+                    "channel_id": channel.id,
+                    "content": f"**Tie detected!** {len(tied)} options tied {how}. "
+                               f"Running a {TIEBREAKER_DURATION_MINUTES}-minute tiebreaker poll...",
+                }, save=False)
+                self._queue_effect(poll, "tiebreaker", {"tied": tied, "votes": stats["votes"]})
+                return
 
         elif qualifying:
             # Clear winner
-            await self._announce_results(channel, poll, results, qualifying, threshold)
+            self._queue_effect(poll, "results", {
+                **announcement, "outcome": "winner", "results": results,
+                "qualifying": qualifying, "threshold": threshold,
+            }, save=False)
             # Create event from winner
-            await self._try_create_event(poll, qualifying[0])
+            self._queue_effect(poll, "event", {
+                "guild_id": poll.guild_id, "channel_id": channel.id,
+                "question": poll.question, "winner": qualifying[0],
+            }, save=False)
+            stats.update(outcome="winner", winner_start=qualifying[0]["start_time"],
+                         winner_timezone=qualifying[0]["timezone"])
         else:
             # No qualifying options
+            self._queue_effect(poll, "results", {**announcement, "outcome": "none", "threshold": threshold},
+                               save=False)
+
+        # Handle recurrence, counting the posting towards the guild's statistics
+        self._queue_effect(poll, "recurrence", {"stats": stats})
+
+    async def _rank_results(self, poll, channel, msg, results):
+        """Rank a poll's results (in option order) by its tally method, from the order its
+        voters reacted in, or from its reactions if that wasn't tracked (e.g. across a
+        restart). Returns (results, qualifying, tied, how the winner was decided), the
+        first two best first and `tied` empty unless the method left first place tied."""
+        tally = self.tallies.get(poll.id)
+        if tally is None or tally.message_id != msg.id:
+            tally = await self._recount(poll, channel, msg)
+        index = {option.emoji: i for i, option in enumerate(poll.options)}
+        ballots = BallotMatrix(len(poll.options))
+        for emojis in tally.votes.values():
+            ballots.add([index[emoji] for emoji in emojis])
+        for result, approvals in zip(results, ballots.approvals()):
+            result["votes"] = approvals
+
+        candidates = [i for i, r in enumerate(results) if r["votes"] >= poll.vote_threshold]
+        groups, detail = rank_options(poll.tally_method, ballots, candidates)
+        order = [i for group in groups for i in group]
+        qualifying = [results[i] for i in order]
+        below = sorted((r for i, r in enumerate(results) if i not in order), key=lambda r: r["votes"], reverse=True)
+        tied = [results[i] for i in groups[0]] if groups and len(groups[0]) > 1 else []
+        method = METHOD_NAMES[poll.tally_method]
+        return qualifying + below, qualifying, tied, f"{method}, {detail}" if detail else method
+
+    async def _effect_results(self, entry):
+        data = entry["payload"]
+        channel = await self._fetch_channel(data["channel_id"])
+        if data["outcome"] == "winner":
+            await self._announce_results(channel, data)
+        elif data["outcome"] == "unresolved_tie":
+            await self._announce_unresolved_tie(channel, data)
+        else:
             embed = discord.Embed(
-                title=f"Poll Results: {poll['question']}",
+                title=f"Poll Results: {data['question']}",
                 color=discord.Color.red(),
-                timestamp=datetime.now(pytz.utc),
+                timestamp=datetime.fromisoformat(data["resolved_at"]),
             )
             embed.add_field(
                 name="Results",
-                value=f"No options met the minimum threshold of {threshold} vote(s).",
+                value=f"No options met the minimum threshold of {data['threshold']} vote(s).",
                 inline=False,
             )
-            ping = poll.get("ping_target", "")
-            await channel.send(content=ping, embed=embed)
-
-        # Handle recurrence
-        self._handle_recurrence(poll_id, poll)
-
-    async def _announce_results(self, channel, poll, results, qualifying, threshold):
+            await channel.send(content=data["ping_target"], embed=embed)
+
+    async def _effect_notice(self, entry):
+        data = entry["payload"]
+        channel = await self._fetch_channel(data["channel_id"])
+        await channel.send(data["content"])
+
+    def _effect_given_up(self, entry):
+        """Move a poll on when the effect that would have done so failed for good, so it
+        can't stay active forever: a tally that couldn't count still ends the posting,
+        and a tiebreaker that couldn't be posted hands the posting back to its parent."""
+        if entry["kind"] == "tally":
+            poll = self._current_cycle_poll(entry)
+            if poll:
+                print(f"[Polls] Poll {poll.id[:8]} couldn't be counted; ending this posting without results")
+                self._queue_effect(poll, "recurrence", {"stats": {"outcome": "lost", "tiebreaker": poll.is_tiebreaker}})
+                self._kick_outbox()
+        elif entry["kind"] == "tiebreaker":
+            tiebreaker = self.polls.get(str(uuid.uuid5(uuid.NAMESPACE_URL, entry["key"])))
+            if tiebreaker and tiebreaker.status == "scheduled":
+                # Never posted; finish it so it isn't posted later and doesn't hold its parent
+                tiebreaker.status = "completed"
+                tiebreaker.completed_at = current_time(pytz.utc)
+                self.save_polls()
+            elif tiebreaker:
+                return  # posted after all; its own resolution moves the parent on
+            parent = self._current_cycle_poll(entry)
+            if parent:
+                print(f"[Polls] Tiebreaker for poll {parent.id[:8]} couldn't be posted; ending this posting")
+                self._queue_effect(parent, "recurrence")
+                self._kick_outbox()
+
+    async def _effect_recurrence(self, entry):
+        poll = self._current_cycle_poll(entry)
+        if poll:
+            # Recorded in memory here and saved with the status change below, so the
+            # posting is counted exactly once however often this effect is retried
+            if "stats" in entry["payload"]:
+                self.analytics.record(poll.guild_id, **entry["payload"]["stats"])
+            self._handle_recurrence(poll.id, poll)
+
+    async def _announce_results(self, channel, data):
         """Send the results embed for a poll with a clear winner."""
         embed = discord.Embed(
-            title=f"Poll Results: {poll['question']}",
+            title=f"Poll Results: {data['question']}",
             color=discord.Color.green(),
-            timestamp=datetime.now(pytz.utc),
+            timestamp=datetime.fromisoformat(data["resolved_at"]),
         )
 
+        qualifying, results, threshold = data["qualifying"], data["results"], data["threshold"]
         results_text = ""
         for i, r in enumerate(qualifying):
             medal = ["\U0001f947", "\U0001f948", "\U0001f949"][i] if i < 3 else f"#{i+1}"
@@ -382,6 +1104,8 @@ class Polls(commands.Cog):
             value=f"**{winner['label']}** with {winner['votes']} vote(s)!",
             inline=False,
         )
+        if data.get("decided_by"):
+            embed.add_field(name="Counted by", value=data["decided_by"], inline=False)
 
         # Show options that didn't meet threshold
         disqualified = [r for r in results if r["votes"] < threshold and r["votes"] > 0]
@@ -393,225 +1117,474 @@ class Polls(commands.Cog):
                 inline=False,
             )
 
-        ping = poll.get("ping_target", "")
-        await channel.send(content=ping, embed=embed)
+        await channel.send(content=data["ping_target"], embed=embed)
 
-    async def _announce_unresolved_tie(self, channel, poll, tied):
+    async def _announce_unresolved_tie(self, channel, data):
         """Announce that even the tiebreaker resulted in a tie."""
         embed = discord.Embed(
-            title=f"Tiebreaker Results: {poll['question']}",
+            title=f"Tiebreaker Results: {data['question']}",
             color=discord.Color.orange(),
-            timestamp=datetime.now(pytz.utc),
+            timestamp=datetime.fromisoformat(data["resolved_at"]),
         )
-        tied_text = "\n".join([f"- **{r['label']}** ({r['votes']} votes)" for r in tied])
+        tied_text = "\n".join([f"- **{r['label']}** ({r['votes']} votes)" for r in data["tied"]])
         embed.add_field(
             name="Still tied!",
             value=f"The tiebreaker poll also ended in a tie:\n{tied_text}\n\nYou'll need to decide among yourselves!",
             inline=False,
         )
-        ping = poll.get("ping_target", "")
-        await channel.send(content=ping, embed=embed)
-
-    async def _run_tiebreaker(self, channel, parent_poll, parent_poll_id, tied_options):
-        """Create and post a tiebreaker poll with only the tied options."""
-        await channel.send(
-            f"**Tie detected!** {len(tied_options)} options tied with {tied_options[0]['votes']} vote(s) each. "
-            f"Running a {TIEBREAKER_DURATION_MINUTES}-minute tiebreaker poll..."
-        )
+        await channel.send(content=data["ping_target"], embed=embed)
+
+    async def _effect_tiebreaker(self, entry):
+        """Create and post a tiebreaker poll with only the tied options.
+
+        The tiebreaker's ID derives from the effect's key, so a retry after a failed
+        post reuses the poll created the first time instead of making another."""
+        parent_poll = self._current_cycle_poll(entry)
+        tiebreaker_id = str(uuid.uuid5(uuid.NAMESPACE_URL, entry["key"]))
+        tiebreaker = self.polls.get(tiebreaker_id)
+        if not tiebreaker:
+            if not parent_poll:
+                return
+            tiebreaker = self._build_tiebreaker(tiebreaker_id, parent_poll, entry["poll_id"], entry["payload"]["tied"])
+            self.polls[tiebreaker_id] = tiebreaker
+            # The parent posting ends here as far as statistics go; the tiebreaker counts separately
+            self.analytics.record(parent_poll.guild_id, "tie", entry["payload"].get("votes", 0))
+            self.save_polls()
 
-        # Create a tiebreaker poll
-        tiebreaker_id = str(uuid.uuid4())
+        if tiebreaker.status == "scheduled":
+            # Post the tiebreaker immediately
+            await self.post_poll(tiebreaker_id)
+            if tiebreaker.status == "scheduled":
+                raise LookupError(f"tiebreaker {tiebreaker_id[:8]} could not be posted")
+
+    def _build_tiebreaker(self, tiebreaker_id, parent_poll, parent_poll_id, tied_options):
         options = []
         for i, opt in enumerate(tied_options):
-            options.append({"label": opt["label"], "emoji": OPTION_EMOJIS[i]})
-
-        post_channel_id = parent_poll.get("post_channel_id", parent_poll["channel_id"])
-
-        tiebreaker = {
-            "id": tiebreaker_id,
-            "guild_id": parent_poll["guild_id"],
-            "channel_id": parent_poll["channel_id"],
-            "post_channel_id": post_channel_id,
-            "creator_id": parent_poll["creator_id"],
-            "question": f"Tiebreaker: {parent_poll['question']}",
-            "options": options,
-            "ping_target": parent_poll.get("ping_target", ""),
-            "vote_threshold": 0,
-            "schedule_cron": None,
-            "schedule_timezone": parent_poll.get("schedule_timezone", "US/Eastern"),
-            "next_send_time": datetime.now(pytz.utc).isoformat(),
-            "poll_duration_hours": TIEBREAKER_DURATION_MINUTES / 60,
-            "status": "scheduled",
-            "active_message_id": None,
-            "recurring": False,
-            "is_tiebreaker": True,
-            "parent_poll_id": parent_poll_id,
-            "created_at": datetime.now(pytz.utc).isoformat(),
-        }
-
-        self.polls[tiebreaker_id] = tiebreaker
-        self.save_polls()
+            start_time = datetime.fromisoformat(opt["start_time"]) if opt.get("start_time") else None
+            options.append(PollOption(label=opt["label"], emoji=OPTION_EMOJIS[i],
+                                      start_time=start_time, timezone=opt.get("timezone")))
+
+        return Poll(
+            id=tiebreaker_id,
+            guild_id=parent_poll.guild_id,
+            channel_id=parent_poll.channel_id,
+            post_channel_id=parent_poll.target_channel_id,
+            creator_id=parent_poll.creator_id,
+            question=f"Tiebreaker: {parent_poll.question}",
+            options=options,
+            ping_target=parent_poll.ping_target,
+            vote_threshold=0,
+            schedule_cron=None,
+            schedule_timezone=parent_poll.schedule_timezone,
+            next_send_time=current_time(pytz.utc),
+            poll_duration_hours=TIEBREAKER_DURATION_MINUTES / 60,
+            status="scheduled",
+            active_message_id=None,
+            recurring=False,
+            is_tiebreaker=True,
+            parent_poll_id=parent_poll_id,
+            created_at=current_time(pytz.utc),
+        )
 
-        # Post the tiebreaker immediately
-        await self.post_poll(tiebreaker_id)
+    def _upcoming_sends(self, poll, now, count=UPCOMING_COUNT):
+        """The poll's next `count` send times: its pending first send, if any, then its
+        recurrence, read from the schedule's cached occurrences."""
+        if poll.status == "completed":
+            return []
+        sends = []
+        after = now
+        if poll.status == "scheduled" and not (poll.recurring and poll.next_send_time <= now):
+            sends.append(poll.next_send_time)
+            after = max(now, poll.next_send_time + timedelta(microseconds=1))
+        if poll.recurring and poll.schedule_cron and len(sends) < count:
+            sends += compile_recurrence(poll.schedule_cron).upcoming(after, count - len(sends))
+        return sends
+
+    def _send_conflicts(self, poll):
+        """Other polls posting in the same channel at one of this poll's next
+        UPCOMING_COUNT sends, as [(other poll, first shared send time)]."""
+        now = current_time(pytz.utc)
+        sends = set(self._upcoming_sends(poll, now))
+        conflicts = []
+        if not sends:
+            return conflicts
+        for other in self.polls.values():
+            if other.id == poll.id or other.guild_id != poll.guild_id \
+                    or other.target_channel_id != poll.target_channel_id:
+                continue
+            shared = sends.intersection(self._upcoming_sends(other, now))
+            if shared:
+                conflicts.append((other, min(shared)))
+        return conflicts
 
     def _handle_recurrence(self, poll_id, poll):
         """Handle recurring poll re-scheduling after resolution."""
         short_id = poll_id[:8]
         # If this is a tiebreaker, handle the parent poll's recurrence instead
-        if poll.get("is_tiebreaker"):
-            parent_id = poll.get("parent_poll_id")
+        if poll.is_tiebreaker:
+            parent_id = poll.parent_poll_id
             if parent_id and parent_id in self.polls:
                 parent = self.polls[parent_id]
-                if parent.get("recurring") and parent.get("schedule_cron"):
-                    parent["status"] = "scheduled"
-                    parent["active_message_id"] = None
+                if parent.recurring and parent.schedule_cron:
+                    parent.status = "scheduled"
+                    parent.active_message_id = None
                     self.save_polls()
                     print(f"[Polls] Tiebreaker {short_id} resolved, re-scheduling parent {parent_id[:8]}: active -> scheduled")
                     self._register_send_job(parent_id, parent)
                 else:
-                    parent["status"] = "completed"
+                    parent.status = "completed"
+                    parent.completed_at = current_time(pytz.utc)
                     self.save_polls()
                     print(f"[Polls] Tiebreaker {short_id} resolved, parent {parent_id[:8]}: active -> completed")
             # Mark tiebreaker as completed
-            poll["status"] = "completed"
+            poll.status = "completed"
+            poll.completed_at = current_time(pytz.utc)
             self.save_polls()
             print(f"[Polls] Tiebreaker {short_id}: active -> completed")
             return
 
-        if poll.get("recurring") and poll.get("schedule_cron"):
-            poll["status"] = "scheduled"
-            poll["active_message_id"] = None
+        if poll.recurring and poll.schedule_cron:
+            poll.status = "scheduled"
+            poll.active_message_id = None
             self.save_polls()
             print(f"[Polls] Recurring poll {short_id}: active -> scheduled (re-registering)")
             self._register_send_job(poll_id, poll)
         else:
-            poll["status"] = "completed"
+            poll.status = "completed"
+            poll.completed_at = current_time(pytz.utc)
             self.save_polls()
             print(f"[Polls] Poll {short_id}: active -> completed")
 
-    async def _try_create_event(self, poll, winner):
-        """Attempt to create a Discord scheduled event from the winning poll option."""
-        guild = self.bot.get_guild(poll["guild_id"])
+    async def _effect_event(self, entry):
+        """Create a Discord scheduled event from the winning poll option, or bring the
+        event already made for this posting up to date."""
+        data = entry["payload"]
+        winner = data["winner"]
+        guild = self.bot.get_guild(data["guild_id"])
         if not guild:
-            return
+            raise LookupError(f"guild {data['guild_id']} not available")
 
-        parsed = dateparser.parse(normalize_shorthand_datetime(winner["label"]), settings={
-            'PREFER_DATES_FROM': 'future',
-            'RETURN_AS_TIMEZONE_AWARE': True,
-        })
+        if winner.get("start_time"):
+            # Parsed when the poll was created and rolled forward with each recurrence
+            parsed = datetime.fromisoformat(winner["start_time"])
+        else:
+            # Polls created before option times were stored
+            parsed = dateparser.parse(normalize_shorthand_datetime(winner["label"]), settings={
+                'PREFER_DATES_FROM': 'future',
+                'RETURN_AS_TIMEZONE_AWARE': True,
+            })
 
         if not parsed:
-            post_channel_id = poll.get("post_channel_id", poll["channel_id"])
-            channel = self.bot.get_channel(post_channel_id)
-            if channel:
-                await channel.send(
-                    f"Could not auto-create a server event for **{winner['label']}** "
-                    f"(not parseable as a date/time). You can create it manually!"
-                )
+            channel = await self._fetch_channel(data["channel_id"])
+            await channel.send(
+                f"Could not auto-create a server event for **{winner['label']}** "
+                f"(not parseable as a date/time). You can create it manually!"
+            )
             return
 
-        if parsed <= datetime.now(parsed.tzinfo):
+        if parsed <= current_time(parsed.tzinfo):
             return
 
-        try:
-            await guild.create_scheduled_event(
-                name=poll["question"],
-                description=f"Scheduled via poll. Winning time: {winner['label']}",
-                start_time=parsed,
-                end_time=parsed + timedelta(hours=3),
+        key = event_key(entry["poll_id"], data["cycle"])
+        details = {
+            "name": data["question"],
+            "description": f"Scheduled via poll. Winning time: {winner['label']}\n{event_marker(entry['poll_id'])}",
+            "start_time": parsed,
+            "end_time": parsed + timedelta(hours=EVENT_DURATION_HOURS),
+        }
+        # Rate limits and outages raise here and the outbox retries; the confirmation
+        # is its own effect so a failed send can't touch the event twice.
+        event = await self._existing_event(guild, key, entry["poll_id"], parsed)
+        if event is None:
+            event = await guild.create_scheduled_event(
+                **details,
                 entity_type=discord.EntityType.external,
                 privacy_level=discord.PrivacyLevel.guild_only,
                 location="Discord",
             )
-            post_channel_id = poll.get("post_channel_id", poll["channel_id"])
-            channel = self.bot.get_channel(post_channel_id)
-            if channel:
-                await channel.send(f"A server event has been created for **{winner['label']}**!")
-        except discord.HTTPException as e:
-            print(f"Failed to create scheduled event: {e}")
+            content = f"A server event has been created for **{winner['label']}**!"
+        elif event.start_time == parsed and event.name == data["question"]:
+            print(f"[Polls] Poll {entry['poll_id'][:8]}: server event {event.id} is already up to date")
+            self.events.record(key, event)
+            return
+        elif event.status is not discord.EventStatus.scheduled:
+            print(f"[Polls] Poll {entry['poll_id'][:8]}: server event {event.id} has already started; leaving it")
+            return
+        else:
+            event = await event.edit(**details)
+            content = f"The server event has been moved to **{winner['label']}**."
+        self.events.record(key, event)
+        self.outbox.add(f"{entry['key']}:notice", "notice", entry["poll_id"], {
+            "channel_id": data["channel_id"],
+            "content": content,
+        })
+
+    async def _existing_event(self, guild, key, poll_id, start_time):
+        """The server event already made for this poll posting, if any: the one recorded
+        for it, or else one the bot made for the same poll at the same time that was
+        never recorded (or belongs to an earlier posting)."""
+        cached = self.events.get(key)
+        if cached is not None:
+            event = guild.get_scheduled_event(cached["event_id"])
+            if event is None:
+                try:
+                    event = await guild.fetch_scheduled_event(cached["event_id"])
+                except discord.NotFound:
+                    self.events.forget(cached["event_id"])
+            if event is not None:
+                return event
+        marker = event_marker(poll_id)
+        return next((e for e in guild.scheduled_events
+                     if e.creator_id == self.bot.user.id and e.start_time == start_time
+                     and marker in (e.description or "")), None)
+
+    def _forget_missing_events(self):
+        """Drop recorded events that were deleted while the bot was offline."""
+        if not self.bot.intents.guild_scheduled_events:
+            return
+        gone = [e["event_id"] for e in self.events.entries.values()
+                if (guild := self.bot.get_guild(e["guild_id"])) and not guild.get_scheduled_event(e["event_id"])]
+        for event_id in gone:
+            self.events.forget(event_id, save=False)
+        if gone:
+            self.events.save()
+            print(f"[Polls] Forgot {len(gone)} server event(s) deleted while offline")
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_create(self, event):
+        """Record an event this bot created whose creation wasn't recorded yet (the
+        gateway can beat the API response, or the response may have been lost), using
+        the pending outbox entry it was created for."""
+        if event.creator_id != self.bot.user.id or self.events.key_for(event.id):
+            return
+        match = EVENT_MARKER_RE.search(event.description or "")
+        if not match:
+            return
+        for pending in self.outbox.entries.values():
+            if pending["kind"] == "event" and pending["poll_id"].startswith(match.group(1)) \
+                    and pending["payload"]["guild_id"] == event.guild_id:
+                self.events.record(event_key(pending["poll_id"], pending["payload"]["cycle"]), event)
+                return
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_update(self, before, after):
+        if not self.events.key_for(after.id):
+            return
+        if after.status in (discord.EventStatus.completed, discord.EventStatus.canceled):
+            self.events.forget(after.id)
+        else:
+            self.events.record(self.events.key_for(after.id), after)
+
+    @commands.Cog.listener()
+    async def on_scheduled_event_delete(self, event):
+        self.events.forget(event.id)
 
     # ---- Slash Commands ----
 
     schedule_group = app_commands.Group(name="schedule", description="Schedule polls and events")
 
     @schedule_group.command(name="poll", description="Create a new scheduled poll")
-    async def schedule_poll(self, interaction: discord.Interaction):
-        """Start the multi-step poll creation dialog."""
-        key = (interaction.guild_id, interaction.user.id)
-
-        if key in self.active_creations:
+    @app_commands.describe(suggest="Start with the times most members are free (see /availability)")
+    async def schedule_poll(self, interaction: discord.Interaction, suggest: bool = False):
+        """Open the poll details form; channel, ping and threshold are picked afterwards."""
+        if (interaction.guild_id, interaction.user.id) in self.active_creations:
             await interaction.response.send_message(
                 "You already have a poll creation in progress! Finish or cancel it first.",
                 ephemeral=True,
             )
             return
 
-        self.active_creations[key] = {
-            "step": 1,
-            "channel_id": interaction.channel_id,
-            "guild_id": interaction.guild_id,
-            "creator_id": interaction.user.id,
-            "last_interaction": datetime.now(pytz.utc),
-            "data": {},
-        }
+        data = {}
+        if suggest:
+            slots = self._suggest_slots(self._guild_schedules(interaction.guild), SUGGEST_DAYS, EVENT_DURATION_HOURS)
+            if len(slots) < 2:
+                await interaction.response.send_message(
+                    "Not enough members have shared when they're free to suggest times. "
+                    "Ask them to use `/availability set`, or run `/schedule poll` without suggestions.",
+                    ephemeral=True,
+                )
+                return
+            tz_name = self._member_timezone(interaction.guild_id, interaction.user.id)
+            data["options_raw"] = "\n".join(self._slot_label(start, tz_name) for start, _ in slots)
 
-        await interaction.response.send_message(
-            "Let's create a scheduled poll! I'll ask you a series of questions.\n\n"
-            "**Step 1/9:** What is the poll question?\n"
-            "*(e.g., \"When can everyone play D&D this week?\")*",
-            ephemeral=False,
-        )
+        session = self._new_session(interaction, "create", data)
+        await interaction.response.send_modal(PollDetailsModal(self, session, WIZARD_TITLES["create"]))
 
     @schedule_group.command(name="cancel", description="Cancel poll creation in progress")
     async def schedule_cancel(self, interaction: discord.Interaction):
-        key = (interaction.guild_id, interaction.user.id)
-        if key in self.active_creations:
-            del self.active_creations[key]
+        session = self.active_creations.pop((interaction.guild_id, interaction.user.id))
+        if session:
+            if session.get("view"):
+                session["view"].stop()
             await interaction.response.send_message("Poll creation cancelled.", ephemeral=True)
         else:
             await interaction.response.send_message("No poll creation in progress.", ephemeral=True)
 
+    @schedule_group.command(name="import", description="Create many polls at once from a JSON or CSV file (Manage Server)")
+    @app_commands.describe(file="A .json or .csv file with one poll per row; see the README for the columns")
+    async def schedule_import(self, interaction: discord.Interaction, file: discord.Attachment):
+        if not interaction.user.guild_permissions.manage_guild:
+            await interaction.response.send_message("You need the Manage Server permission to do that.", ephemeral=True)
+            return
+        if file.size > IMPORT_MAX_BYTES:
+            await interaction.response.send_message(
+                f"That file is too big; imports are limited to {IMPORT_MAX_BYTES // 1000} KB.", ephemeral=True)
+            return
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        try:
+            rows = poll_io.read_rows(await file.read(), file.filename)
+        except ValueError as e:
+            await interaction.followup.send(f"I couldn't read that file. {e}", ephemeral=True)
+            return
+        if not rows or len(rows) > IMPORT_MAX_ROWS:
+            await interaction.followup.send(f"Imports need between 1 and {IMPORT_MAX_ROWS} polls; that file has "
+                                            f"{len(rows)}.", ephemeral=True)
+            return
+
+        guild = interaction.guild
+        channel_names = {c.name: c.id for c in guild.text_channels}
+        # Parsing every row's times is the slow part, so it runs off the event loop
+        datas, errors = await asyncio.to_thread(self.validate_import, rows, interaction.channel_id, channel_names)
+        for number, data in enumerate(datas, 1):
+            channel = guild.get_channel(data.get("post_channel_id"))
+            if "post_channel_id" in data and (channel is None or not channel.permissions_for(guild.me).send_messages):
+                errors.append((number, f"I can't send messages in <#{data['post_channel_id']}>."))
+        if errors:
+            errors.sort()
+            await interaction.followup.send(
+                f"Nothing was imported; please fix these rows and try again:\n{self._describe_import_errors(errors)}",
+                ephemeral=True)
+            return
+
+        poll_ids = self.create_imported(datas, interaction.guild_id, interaction.channel_id, interaction.user.id)
+        shown = "\n".join(f"`{pid[:8]}` {self.polls[pid].question}" for pid in poll_ids[:10])
+        more = f"\n...and {len(poll_ids) - 10} more." if len(poll_ids) > 10 else ""
+        await interaction.followup.send(f"Imported and scheduled {len(poll_ids)} polls:\n{shown}{more}", ephemeral=True)
+
     events_group = app_commands.Group(name="events", description="Manage scheduled polls")
 
     @events_group.command(name="list", description="List all active scheduled polls")
     async def events_list(self, interaction: discord.Interaction):
         guild_polls = {pid: p for pid, p in self.polls.items()
-                       if p["guild_id"] == interaction.guild_id and not p.get("is_tiebreaker")}
+                       if p.guild_id == interaction.guild_id and not p.is_tiebreaker}
 
         if not guild_polls:
             await interaction.response.send_message("No scheduled polls found.", ephemeral=True)
             return
 
         embed = discord.Embed(title="Scheduled Polls", color=discord.Color.blue())
+        now = current_time(pytz.utc)
 
         for pid, p in guild_polls.items():
             short_id = pid[:8]
-            status_emoji = {"scheduled": "\U0001f550", "active": "\U0001f7e2", "completed": "\u2705"}.get(p["status"], "\u2753")
-
-            info = f"Status: {status_emoji} {p['status']}"
-            if p.get("recurring"):
-                cron = p.get("schedule_cron", {})
-                day = cron.get("day_of_week", "?")
-                info += f"\nRepeats: Every {day} at {cron.get('hour', '?')}:{cron.get('minute', 0):02d}"
-            if p.get("next_send_time") and p["status"] == "scheduled":
-                try:
-                    send_dt = datetime.fromisoformat(p["next_send_time"])
-                    info += f"\nNext send: {to_discord_timestamp(send_dt, 'F')} ({to_discord_timestamp(send_dt, 'R')})"
-                except (ValueError, TypeError):
-                    info += f"\nNext send: {p['next_send_time']}"
-
-            post_ch = p.get("post_channel_id", p["channel_id"])
-            info += f"\nPosts to: <#{post_ch}>"
-            info += f"\nThreshold: {p.get('vote_threshold', 0)} votes"
-            info += f"\nOptions: {', '.join(o['label'] for o in p['options'])}"
+            status_emoji = {"scheduled": "\U0001f550", "active": "\U0001f7e2", "completed": "\u2705"}.get(p.status, "\u2753")
+
+            info = f"Status: {status_emoji} {p.status}"
+            if p.recurring and p.schedule_cron:
+                info += f"\nRepeats: {describe_recurrence(p.schedule_cron)}"
+            sends = self._upcoming_sends(p, now, 3)
+            if sends:
+                send_dt = sends[0]
+                info += f"\nNext send: {to_discord_timestamp(send_dt, 'F')} ({to_discord_timestamp(send_dt, 'R')})"
+            if len(sends) > 1:
+                info += f"\nThen: {', '.join(to_discord_timestamp(t, 'f') for t in sends[1:])}"
+
+            info += f"\nPosts to: <#{p.target_channel_id}>"
+            info += f"\nThreshold: {p.vote_threshold} votes"
+            info += f"\nOptions: {', '.join(o.label for o in p.options)}"
             info += f"\nID: `{short_id}`"
 
-            embed.add_field(name=p["question"], value=info, inline=False)
+            embed.add_field(name=p.question, value=info, inline=False)
 
         embed.set_footer(text="Use /events delete, /events modify, or /events clone with the poll ID.")
         await interaction.response.send_message(embed=embed)
 
+    @events_group.command(name="history", description="Browse archived polls")
+    @app_commands.describe(page=f"Page number ({HISTORY_PAGE_SIZE} polls per page, oldest first)")
+    async def events_history(self, interaction: discord.Interaction, page: app_commands.Range[int, 1] = 1):
+        # Streams the gzip archive off the event loop, stopping once the page is filled
+        entries, has_more = await asyncio.to_thread(
+            poll_archive.read_page, ARCHIVE_PATH, interaction.guild_id, page, HISTORY_PAGE_SIZE,
+        )
+        if not entries:
+            message = "No archived polls yet." if page == 1 else f"No archived polls on page {page}."
+            await interaction.response.send_message(message, ephemeral=True)
+            return
+
+        embed = discord.Embed(title=f"Poll History — page {page}", color=discord.Color.dark_grey())
+        for p in map(poll_from_dict, entries):
+            info = f"Completed: {to_discord_timestamp(self._completed_at(p), 'D')}"
+            info += f"\nOptions: {', '.join(o.label for o in p.options)}"
+            info += f"\nID: `{p.id[:8]}`"
+            embed.add_field(name=p.question, value=info, inline=False)
+
+        if has_more:
+            embed.set_footer(text=f"Use /events history page:{page + 1} for newer polls.")
+        await interaction.response.send_message(embed=embed)
+
+    @events_group.command(name="search", description="Search poll questions, options and reminders")
+    @app_commands.describe(query="Words to look for; the last one may be the start of a word")
+    async def events_search(self, interaction: discord.Interaction, query: str):
+        indexes = [self.search_index]
+        reminders = self.bot.get_cog("Reminders")
+        if reminders:
+            indexes.append(reminders.search_index)
+        await interaction.response.send_message(
+            format_results(indexes, query, interaction.guild_id, interaction.channel_id), ephemeral=True)
+
+    @events_group.command(name="export", description="Download this server's scheduled polls as a file /schedule import accepts")
+    @app_commands.describe(format="File format")
+    async def events_export(self, interaction: discord.Interaction, format: Literal["json", "csv"] = "json"):
+        rows = self.export_rows(interaction.guild_id)
+        if not rows:
+            await interaction.response.send_message("No scheduled polls to export.", ephemeral=True)
+            return
+        content = poll_io.write_rows(rows, format).encode("utf-8")
+        await interaction.response.send_message(
+            f"Exported {len(rows)} polls.", file=discord.File(io.BytesIO(content), filename=f"polls.{format}"),
+            ephemeral=True)
+
+    @events_group.command(name="stats", description="When this server's polls land, how many vote, and how often sessions fall through")
+    async def events_stats(self, interaction: discord.Interaction):
+        stats = self.analytics.get(interaction.guild_id)
+        if not stats or not stats["postings"]:
+            await interaction.response.send_message("No polls have been resolved here yet.", ephemeral=True)
+            return
+        await interaction.response.send_message(embed=self._stats_embed(stats))
+
+    def _stats_embed(self, stats):
+        """The /events stats embed, from a guild's running aggregates alone."""
+        postings, outcomes, tiebreakers = stats["postings"], stats["outcomes"], stats["tiebreakers"]
+
+        def share(count, total):
+            return f"{count} ({count / total:.0%})" if total else "0"
+
+        embed = discord.Embed(title="Poll Stats", color=discord.Color.blurple())
+        tied = outcomes.get("tie", 0)
+        decided = outcomes.get("winner", 0) + tiebreakers.get("winner", 0)
+        embed.add_field(name="Outcomes", inline=False, value=(
+            f"Polls resolved: **{postings}**\n"
+            f"Session picked: {share(decided, postings)}\n"
+            f"No option reached the threshold: {share(outcomes.get('below_threshold', 0), postings)}\n"
+            f"Went to a tiebreaker: {share(tied, postings)}, "
+            f"of which {tiebreakers.get('unresolved_tie', 0)} stayed tied\n"
+            f"Poll message deleted before counting: {outcomes.get('lost', 0) + tiebreakers.get('lost', 0)}"))
+
+        median = PollAnalytics.median_votes_bucket(stats)
+        spread = "\n".join(f"`{bucket_label(i):>6}` {count}" for i, count in enumerate(stats["votes"]) if count)
+        embed.add_field(name="Votes per poll", inline=False, value=(
+            f"Average {stats['votes_total'] / postings:.1f}, median {bucket_label(median)}\n{spread}"))
+
+        slots = PollAnalytics.top_slots(stats)
+        if slots:
+            embed.add_field(name="Winning times", inline=False, value="\n".join(
+                f"{DAY_NAMES[weekday]} {hour:02d}:00 — {wins} win(s)" for weekday, hour, wins in slots))
+
+        since = datetime.fromisoformat(stats["since"])
+        embed.set_footer(text=f"Counted since {since:%Y-%m-%d}. Times are in the timezone each option was written in.")
+        return embed
+
     @events_group.command(name="delete", description="Delete a scheduled poll")
     @app_commands.describe(poll_id="The poll ID (first 8 characters shown in /events list)")
     async def events_delete(self, interaction: discord.Interaction, poll_id: str):
@@ -621,73 +1594,143 @@ class Polls(commands.Cog):
             return
 
         poll = self.polls[full_id]
-        scheduler = self.bot.scheduler
-        for job_prefix in ["poll_send_", "poll_resolve_"]:
-            try:
-                scheduler.remove_job(f"{job_prefix}{full_id}")
-            except Exception:
-                pass
+        self.scheduler.cancel(full_id)
+        self._stop_tracking(full_id)
 
         del self.polls[full_id]
+        self.timelines.pop(full_id, None)
         self.save_polls()
-        await interaction.response.send_message(f"Deleted poll: **{poll['question']}**")
+        self.search_index.remove(full_id)
+        await interaction.response.send_message(f"Deleted poll: **{poll.question}**")
 
     @events_group.command(name="modify", description="Modify a scheduled poll")
     @app_commands.describe(poll_id="The poll ID (first 8 characters shown in /events list)")
     async def events_modify(self, interaction: discord.Interaction, poll_id: str):
-        full_id = self._find_poll_id(poll_id, interaction.guild_id)
-        if not full_id:
-            await interaction.response.send_message(f"No poll found with ID `{poll_id}`.", ephemeral=True)
+        await self._start_from_existing(interaction, poll_id, "modify")
+
+    @events_group.command(name="clone", description="Clone a scheduled poll")
+    @app_commands.describe(poll_id="The poll ID (first 8 characters shown in /events list)")
+    async def events_clone(self, interaction: discord.Interaction, poll_id: str):
+        await self._start_from_existing(interaction, poll_id, "clone")
+
+    @events_group.command(name="reconcile", description="Check this server's polls are scheduled correctly and fix any that aren't")
+    async def events_reconcile(self, interaction: discord.Interaction):
+        if not interaction.user.guild_permissions.manage_guild:
+            await interaction.response.send_message("You need the Manage Server permission to do that.", ephemeral=True)
             return
 
-        key = (interaction.guild_id, interaction.user.id)
-        if key in self.active_creations:
+        report = self.reconcile_schedule(guild_id=interaction.guild_id)
+        print(f"[Polls] Reconciled {report['checked']} polls for guild {interaction.guild_id}: "
+              f"{self._describe_reconcile(report)}")
+        message = f"Checked {report['checked']} polls: {self._describe_reconcile(report)}."
+        fixes = report["added"] + report["rescheduled"] + report["removed"]
+        if fixes:
+            shown = ", ".join(f"`{fix}`" for fix in fixes[:10])
+            more = f" and {len(fixes) - 10} more" if len(fixes) > 10 else ""
+            message += f"\nFixed: {shown}{more}"
+        await interaction.response.send_message(message, ephemeral=True)
+
+    availability_group = app_commands.Group(name="availability", description="Share when you're free to play")
+
+    @availability_group.command(name="set", description="Set the times you're usually free each week")
+    @app_commands.describe(windows="e.g. \"Fri 7pm-11pm, Sat 12-6pm, weekdays after 8pm EST\"")
+    async def availability_set(self, interaction: discord.Interaction, windows: str):
+        parsed = parse_availability(windows)
+        if parsed is None:
             await interaction.response.send_message(
-                "You already have a poll creation in progress! Finish or cancel it first.",
+                "I couldn't understand those times. Please list days and time ranges, separated by commas "
+                "(e.g., \"Fri 7pm-11pm, Sat 12-6pm, weekdays after 8pm EST\").",
                 ephemeral=True,
             )
             return
-
-        poll = self.polls[full_id]
-        post_ch = poll.get("post_channel_id", poll["channel_id"])
-        self.active_creations[key] = {
-            "step": 1,
-            "channel_id": interaction.channel_id,
-            "guild_id": interaction.guild_id,
-            "creator_id": interaction.user.id,
-            "last_interaction": datetime.now(pytz.utc),
-            "mode": "modify",
-            "modify_id": full_id,
-            "data": {
-                "question": poll["question"],
-                "options_raw": ", ".join(o["label"] for o in poll["options"]),
-                "ping_target": poll.get("ping_target", "@everyone"),
-                "post_channel_id": post_ch,
-                "send_time_raw": poll.get("next_send_time", ""),
-                "repeat_raw": "none",
-                "duration_raw": str(poll.get("poll_duration_hours", 24)),
-                "vote_threshold": poll.get("vote_threshold", 0),
-            },
-        }
-
-        current = self.active_creations[key]["data"]
+        tz_name, parsed_windows = parsed
+        self.availability.set(interaction.guild_id, interaction.user.id, tz_name, parsed_windows)
         await interaction.response.send_message(
-            f"Modifying poll: **{poll['question']}**\n"
-            f"Type your new answer at each step, or type **keep** to keep the current value.\n\n"
-            f"**Step 1/9:** What is the poll question?\n"
-            f"*Current: {current['question']}*",
+            f"Saved! You're free {describe_windows(self.availability.get(interaction.guild_id, interaction.user.id))}.",
+            ephemeral=True,
         )
 
-    @events_group.command(name="clone", description="Clone a scheduled poll")
-    @app_commands.describe(poll_id="The poll ID (first 8 characters shown in /events list)")
-    async def events_clone(self, interaction: discord.Interaction, poll_id: str):
+    @availability_group.command(name="show", description="Show the times you or another member are free")
+    @app_commands.describe(member="Whose availability to show (defaults to you)")
+    async def availability_show(self, interaction: discord.Interaction, member: discord.Member = None):
+        member = member or interaction.user
+        schedule = self.availability.get(interaction.guild_id, member.id)
+        if schedule is None:
+            await interaction.response.send_message(
+                f"{member.display_name} hasn't shared when they're free. (`/availability set`)", ephemeral=True)
+            return
+        await interaction.response.send_message(
+            f"{member.display_name} is free {describe_windows(schedule)}.", ephemeral=True)
+
+    @availability_group.command(name="clear", description="Forget the times you're free")
+    async def availability_clear(self, interaction: discord.Interaction):
+        if self.availability.clear(interaction.guild_id, interaction.user.id):
+            await interaction.response.send_message("Your availability has been cleared.", ephemeral=True)
+        else:
+            await interaction.response.send_message("You haven't shared your availability.", ephemeral=True)
+
+    @availability_group.command(name="suggest", description="Find the times most members are free")
+    @app_commands.describe(days="How many days ahead to look", hours="How long the session is")
+    async def availability_suggest(self, interaction: discord.Interaction,
+                                   days: app_commands.Range[int, 1, 56] = SUGGEST_DAYS,
+                                   hours: app_commands.Range[int, 1, 12] = EVENT_DURATION_HOURS):
+        schedules = self._guild_schedules(interaction.guild)
+        slots = self._suggest_slots(schedules, days, hours)
+        if not slots:
+            await interaction.response.send_message(
+                "No time suits anyone who has shared when they're free. (`/availability set`)", ephemeral=True)
+            return
+        lines = [f"{to_discord_timestamp(start, 'F')} — {free}/{len(schedules)} free"
+                 for start, free in slots]
+        embed = discord.Embed(title=f"Best {hours}-hour slots in the next {days} days",
+                              description="\n".join(lines), color=discord.Color.blue())
+        embed.set_footer(text="Use /schedule poll suggest:True to start a poll with these times.")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    def _guild_schedules(self, guild):
+        """Stored availability of the guild's current members. Without a member cache,
+        members who leave are forgotten as they go (on_raw_member_remove) instead."""
+        schedules = self.availability.schedules(guild.id)
+        if not guild.chunked:
+            return list(schedules.values())
+        return [schedule for user_id, schedule in schedules.items() if guild.get_member(user_id) is not None]
+
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload):
+        self.availability.clear(payload.guild_id, payload.user.id)
+
+    @staticmethod
+    def _suggest_slots(schedules, days, hours):
+        """[(start, members free)] for the best non-overlapping sessions, soonest first."""
+        return best_slots(schedules, current_time(pytz.utc), days=days,
+                          length_minutes=hours * 60, count=SUGGEST_COUNT)
+
+    def _member_timezone(self, guild_id, user_id):
+        schedule = self.availability.get(guild_id, user_id)
+        return schedule["timezone"] if schedule else "US/Eastern"
+
+    @staticmethod
+    def _slot_label(start, tz_name):
+        """An option label for a suggested slot, e.g. "Fri Oct 23 7:00 PM EDT", that
+        parse_option_time reads back as the same time when the poll is sent before it,
+        whatever the poll's own timezone. Zones whose abbreviation it would misread are
+        labelled in UTC instead."""
+        base = start - timedelta(hours=1)
+        for zone in (tz_name, "UTC"):
+            local = start.astimezone(pytz.timezone(zone))
+            label = f"{local:%a %b} {local.day} {local.hour % 12 or 12}:{local:%M %p} {local:%Z}"
+            if all(parse_option_time(label, base, default)[0] == start for default in ("US/Eastern", "UTC")):
+                return label
+        return label
+
+    async def _start_from_existing(self, interaction, poll_id, mode):
+        """Open the details form prefilled from an existing poll, for modify or clone."""
         full_id = self._find_poll_id(poll_id, interaction.guild_id)
         if not full_id:
             await interaction.response.send_message(f"No poll found with ID `{poll_id}`.", ephemeral=True)
             return
 
-        key = (interaction.guild_id, interaction.user.id)
-        if key in self.active_creations:
+        if (interaction.guild_id, interaction.user.id) in self.active_creations:
             await interaction.response.send_message(
                 "You already have a poll creation in progress! Finish or cancel it first.",
                 ephemeral=True,
@@ -695,292 +1738,225 @@ class Polls(commands.Cog):
             return
 
         poll = self.polls[full_id]
-        post_ch = poll.get("post_channel_id", poll["channel_id"])
-        self.active_creations[key] = {
-            "step": 1,
-            "channel_id": interaction.channel_id,
-            "guild_id": interaction.guild_id,
-            "creator_id": interaction.user.id,
-            "last_interaction": datetime.now(pytz.utc),
-            "mode": "clone",
-            "data": {
-                "question": poll["question"],
-                "options_raw": ", ".join(o["label"] for o in poll["options"]),
-                "ping_target": poll.get("ping_target", "@everyone"),
-                "post_channel_id": post_ch,
-                "send_time_raw": "",
-                "repeat_raw": "none",
-                "duration_raw": str(poll.get("poll_duration_hours", 24)),
-                "vote_threshold": poll.get("vote_threshold", 0),
-            },
+        data = {
+            "question": poll.question,
+            "options_raw": "\n".join(o.label for o in poll.options),
+            "ping_target": poll.ping_target,
+            "post_channel_id": poll.target_channel_id,
+            "repeat_raw": "none",
+            "duration_raw": f"{poll.poll_duration_hours:g} hours",
+            "duration_hours": poll.poll_duration_hours,
+            "vote_threshold": poll.vote_threshold,
+            "early_close": bool(poll.early_close),
+            "tally_method": poll.tally_method,
         }
+        if mode == "modify":
+            # Keep the existing send time unless the user changes it
+            data["send_time_raw"] = poll.next_send_time.isoformat()
+            data["send_time_parsed"] = poll.next_send_time.isoformat()
+            data["timezone"] = poll.schedule_timezone
 
-        current = self.active_creations[key]["data"]
-        await interaction.response.send_message(
-            f"Cloning poll: **{poll['question']}**\n"
-            f"Type your new answer at each step, or type **keep** to keep the cloned value.\n\n"
-            f"**Step 1/9:** What is the poll question?\n"
-            f"*Current: {current['question']}*",
-        )
+        session = self._new_session(interaction, mode, data, modify_id=full_id if mode == "modify" else None)
+        await interaction.response.send_modal(PollDetailsModal(self, session, WIZARD_TITLES[mode]))
 
     def _find_poll_id(self, short_id, guild_id):
         """Find a full poll ID from a short prefix, scoped to a guild."""
         short_id = short_id.lower().strip()
         for pid, poll in self.polls.items():
-            if pid.lower().startswith(short_id) and poll["guild_id"] == guild_id:
+            if pid.lower().startswith(short_id) and poll.guild_id == guild_id:
                 return pid
         return None
 
-    # ---- Multi-Step Dialog Listener ----
+    # ---- Poll Setup Sessions ----
 
-    @commands.Cog.listener()
-    async def on_message(self, message):
-        if message.author.bot:
-            return
+    def _new_session(self, interaction, mode, data, modify_id=None):
+        """Build creation state for the details form. It only becomes active once the form validates."""
+        return {
+            "key": (interaction.guild_id, interaction.user.id),
+            "channel_id": interaction.channel_id,
+            "guild_id": interaction.guild_id,
+            "creator_id": interaction.user.id,
+            "mode": mode,
+            "modify_id": modify_id,
+            "data": data,
+        }
 
-        key = (getattr(message.guild, "id", None), message.author.id)
-        if key not in self.active_creations:
-            return
+    def is_current_session(self, session):
+        return self.active_creations.get(session["key"]) is session
 
-        creation = self.active_creations[key]
+    def touch_session(self, session):
+        self.active_creations.touch(session["key"])
 
-        # Check if message is in the same channel
-        if message.channel.id != creation["channel_id"]:
-            return
+    def end_session(self, session, reason="cancelled"):
+        if self.is_current_session(session):
+            self.active_creations.pop(session["key"], reason=reason)
 
-        # Timeout check (5 minutes)
-        elapsed = (datetime.now(pytz.utc) - creation["last_interaction"]).total_seconds()
-        if elapsed > 300:
-            del self.active_creations[key]
-            await message.channel.send("Poll creation timed out (5 minute limit). Use `/schedule poll` to start again.")
+    async def _on_session_expired(self, session):
+        """Tell the user their abandoned setup expired, by editing the summary message in place."""
+        print(f"[Polls] Poll setup for user {session['creator_id']} in guild {session['guild_id']} expired "
+              f"({self.active_creations.stats()})")
+        view = session.get("view")
+        if not view:
             return
-
-        creation["last_interaction"] = datetime.now(pytz.utc)
-        content = message.content.strip()
-        is_modify = creation.get("mode") in ("modify", "clone")
-        data = creation["data"]
-        step = creation["step"]
-
-        try:
-            await self._handle_step(message, key, creation, content, is_modify, data, step)
-        except Exception as e:
-            print(f"Error in poll creation step {step}: {e}")
-            import traceback
-            traceback.print_exc()
-            await message.channel.send(f"Something went wrong: {e}\nPoll creation cancelled.")
-            self.active_creations.pop(key, None)
-
-    async def _handle_step(self, message, key, creation, content, is_modify, data, step):
-
-        if step == 1:
-            # Poll question
-            if is_modify and content.lower() == "keep":
-                pass
-            else:
-                data["question"] = content
-
-            creation["step"] = 2
-            hint = f"\n*Current: {data.get('options_raw', '')}*" if is_modify else ""
-            await message.channel.send(
-                f"**Step 2/9:** List the response options, separated by commas.\n"
-                f"*(e.g., \"Friday Night, Saturday Morning, Saturday Night\")*{hint}"
-            )
-
-        elif step == 2:
-            # Options
-            if is_modify and content.lower() == "keep":
-                pass
-            else:
-                options = [o.strip() for o in content.split(",") if o.strip()]
-                if len(options) < 2:
-                    await message.channel.send("Please provide at least 2 options, separated by commas.")
-                    return
-                if len(options) > len(OPTION_EMOJIS):
-                    await message.channel.send(f"Maximum {len(OPTION_EMOJIS)} options allowed. Please try again.")
-                    return
-                data["options_raw"] = content
-
-            creation["step"] = 3
-            hint = f"\n*Current: {data.get('ping_target', '')}*" if is_modify else ""
-            await message.channel.send(
-                f"**Step 3/9:** Who should be pinged when the poll is posted?\n"
-                f"*(e.g., @everyone, @here, or mention a role)*{hint}"
-            )
-
-        elif step == 3:
-            # Ping target
-            if is_modify and content.lower() == "keep":
-                pass
-            else:
-                data["ping_target"] = content
-
-            # Step 4: Channel selection
-            creation["step"] = 4
-            # List text channels in the guild
-            guild = message.guild
-            if guild:
-                text_channels = [ch for ch in guild.text_channels if ch.permissions_for(guild.me).send_messages]
-                channel_list = "\n".join([f"  - <#{ch.id}>" for ch in text_channels[:20]])
-                current_hint = ""
-                if is_modify and data.get("post_channel_id"):
-                    current_hint = f"\n*Current: <#{data['post_channel_id']}>*"
-                await message.channel.send(
-                    f"**Step 4/9:** Which channel should the poll be posted in?\n"
-                    f"*(Mention a channel like #general, or type \"here\" to post in this channel)*\n\n"
-                    f"Available channels:\n{channel_list}{current_hint}"
+        view.stop()
+        if view.interaction:
+            try:
+                await view.interaction.edit_original_response(
+                    content=f"Poll creation timed out ({WIZARD_TTL_SECONDS // 60} minute limit). "
+                            f"Use `/schedule poll` to start again.",
+                    embed=None, view=None,
                 )
-            else:
-                creation["step"] = 5  # skip if no guild context
-                await self._ask_send_time(message.channel, data, is_modify)
-
-        elif step == 4:
-            # Channel selection
-            if is_modify and content.lower() == "keep":
+            except discord.HTTPException:
                 pass
-            elif content.lower() == "here":
-                data["post_channel_id"] = message.channel.id
-            else:
-                # Try to extract channel ID from mention like <#123456>
-                match = re.match(r"<#(\d+)>", content)
-                if match:
-                    ch_id = int(match.group(1))
-                    ch = message.guild.get_channel(ch_id) if message.guild else None
-                    if ch:
-                        data["post_channel_id"] = ch_id
-                    else:
-                        await message.channel.send("I couldn't find that channel. Please try again (mention it with #).")
-                        return
-                else:
-                    # Try to find by name
-                    if message.guild:
-                        found = discord.utils.get(message.guild.text_channels, name=content.strip("#").lower())
-                        if found:
-                            data["post_channel_id"] = found.id
-                        else:
-                            await message.channel.send("I couldn't find that channel. Please mention it with # or type \"here\".")
-                            return
-                    else:
-                        data["post_channel_id"] = message.channel.id
-
-            creation["step"] = 5
-            await self._ask_send_time(message.channel, data, is_modify)
-
-        elif step == 5:
-            # Send time
-            if is_modify and content.lower() == "keep":
-                if not data.get("send_time_raw"):
-                    await message.channel.send("No existing send time to keep. Please provide one.")
-                    return
-            else:
-                parsed = dateparser.parse(content, settings={
-                    'PREFER_DATES_FROM': 'future',
-                    'RETURN_AS_TIMEZONE_AWARE': True,
-                })
-                if not parsed:
-                    await message.channel.send("I couldn't understand that time. Please try again. (e.g., \"Monday at 9am EST\")")
-                    return
-                data["send_time_raw"] = content
-                data["send_time_parsed"] = parsed.isoformat()
-                tz = parse_timezone(content)
-                data["timezone"] = tz
-                # Show the time using Discord's auto-converting timestamp
-                discord_ts = to_discord_timestamp(parsed, "F")
-                relative_ts = to_discord_timestamp(parsed, "R")
-                await message.channel.send(f"Got it — I'll send the poll at: {discord_ts} ({relative_ts})")
-
-            creation["step"] = 6
-            hint = f"\n*Current: {data.get('repeat_raw', 'none')}*" if is_modify else ""
-            await message.channel.send(
-                f"**Step 6/9:** Should this poll repeat? If so, provide the schedule.\n"
-                f"*(e.g., \"every Monday at 9am EST\" or type \"none\")*{hint}"
+
+    async def submit_details(self, interaction, session, values):
+        """Validate the details form, then show the summary with channel/ping/threshold pickers."""
+        current = self.active_creations.get(session["key"])
+        if current is not None and current is not session:
+            await interaction.response.send_message(
+                "You already have a poll creation in progress! Finish or cancel it first.",
+                ephemeral=True,
             )
+            return
 
-        elif step == 6:
-            # Repeat schedule
-            if is_modify and content.lower() == "keep":
-                pass
+        title = WIZARD_TITLES[session["mode"]]
+        error = self._apply_details(session["data"], values)
+        if error:
+            view = RetryDetailsView(self, session, title)
+            if interaction.message:
+                await interaction.response.edit_message(content=error, embed=None, view=view)
             else:
-                data["repeat_raw"] = content
+                await interaction.response.send_message(error, view=view, ephemeral=True)
+            return
 
-            creation["step"] = 7
-            hint = f"\n*Current: {data.get('duration_raw', '')}*" if is_modify else ""
-            await message.channel.send(
-                f"**Step 7/9:** How long should the poll stay open for voting?\n"
-                f"*(e.g., \"24 hours\", \"2 days\", \"48 hours\")*{hint}"
+        if not self.active_creations.add(session["key"], session):
+            await interaction.response.send_message(
+                "Too many polls are being set up in this server right now. Please try again in a few minutes.",
+                ephemeral=True,
             )
+            return
+        embed = self._build_confirmation_embed(session["data"])
+        view = session.get("view")
+        if view is None or view.is_finished():
+            view = PollSetupView(self, session, title)
+            view.interaction = interaction
+            session["view"] = view
+
+        content = "Pick where to post, who to ping and the vote threshold, then **Confirm**."
+        if interaction.message:
+            await interaction.response.edit_message(content=content, embed=embed, view=view)
+        else:
+            await interaction.response.send_message(content, embed=embed, view=view, ephemeral=True)
+
+    def _apply_details(self, data, values, timezone=None):
+        """Validate the free-text answers into creation data. Returns an error message, or None.
+        The raw answers are kept either way so the retry form comes back prefilled.
+
+        `timezone` is the zone for times that don't name one (an import row's); the
+        setup form leaves the send time to dateparser and the rest to US/Eastern."""
+        send_time_raw = values["send_time_raw"].strip()
+        if send_time_raw != data.get("send_time_raw"):
+            data.pop("send_time_parsed", None)
+        data["question"] = values["question"].strip()
+        data["options_raw"] = values["options_raw"].strip()
+        data["send_time_raw"] = send_time_raw
+        data["repeat_raw"] = values["repeat_raw"].strip() or "none"
+        data["duration_raw"] = values["duration_raw"].strip()
+
+        if not data["question"]:
+            return "Please provide a poll question."
+
+        options = split_options(data["options_raw"])
+        if len(options) < 2:
+            return "Please provide at least 2 options, separated by commas or one per line."
+        if len(options) > len(OPTION_EMOJIS):
+            return f"Maximum {len(OPTION_EMOJIS)} options allowed. Please try again."
+
+        if not data.get("send_time_parsed"):
+            settings = {
+                'PREFER_DATES_FROM': 'future',
+                'RETURN_AS_TIMEZONE_AWARE': True,
+            }
+            if timezone:
+                settings['TIMEZONE'] = timezone
+            parsed = dateparser.parse(send_time_raw, settings=settings)
+            if not parsed:
+                return "I couldn't understand that send time. Please try again. (e.g., \"Monday at 9am EST\")"
+            data["send_time_parsed"] = parsed.isoformat()
+            data["timezone"] = parse_timezone(send_time_raw, timezone or "US/Eastern")
+
+        # An every-N-weeks schedule counts its weeks from the first send
+        send_time = datetime.fromisoformat(data["send_time_parsed"])
+        data["recurrence"] = parse_recurrence(data["repeat_raw"], anchor=send_time,
+                                              default_timezone=timezone or "US/Eastern")
+        if data["repeat_raw"].lower() not in ("none", "no") and data["recurrence"] is None:
+            return ("I couldn't understand that repeat schedule. Please try again. (e.g., \"every Monday at 9am EST\", "
+                    "\"every other Friday at 7pm\", \"first Monday of every month at 9am\" or \"none\")")
+
+        duration_hours = self._parse_duration(data["duration_raw"])
+        if duration_hours is None:
+            return "I couldn't understand that duration. Please try again. (e.g., \"24 hours\", \"2 days\")"
+        data["duration_hours"] = duration_hours
+
+        # Parse each option once, against the send time, so resolution never has to
+        option_times = []
+        for label in options:
+            start_time, tz_name = parse_option_time(label, send_time, data.get("timezone", "US/Eastern"))
+            option_times.append([start_time.isoformat(), tz_name] if start_time else None)
+        data["option_times"] = option_times
+        return None
 
-        elif step == 7:
-            # Duration
-            if is_modify and content.lower() == "keep":
-                pass
-            else:
-                duration_hours = self._parse_duration(content)
-                if duration_hours is None:
-                    await message.channel.send("I couldn't understand that duration. Please try again. (e.g., \"24 hours\", \"2 days\")")
-                    return
-                data["duration_raw"] = content
-                data["duration_hours"] = duration_hours
-
-            creation["step"] = 8
-            hint = f"\n*Current: {data.get('vote_threshold', 0)}*" if is_modify else ""
-            await message.channel.send(
-                f"**Step 8/9:** Minimum votes for an option to count in results?\n"
-                f"*(Enter a number, e.g., \"3\" means options with fewer than 3 votes are excluded. Use \"0\" for no minimum.)*{hint}"
+    async def confirm_session(self, interaction, session):
+        """Schedule the poll from a confirmed setup session."""
+        data = session["data"]
+        post_channel_id = data.get("post_channel_id", session["channel_id"])
+        guild = interaction.guild
+        channel = guild.get_channel(post_channel_id) if guild else None
+        if channel and not channel.permissions_for(guild.me).send_messages:
+            await interaction.response.send_message(
+                f"I can't send messages in <#{post_channel_id}>. Please pick another channel.",
+                ephemeral=True,
             )
+            return
 
-        elif step == 8:
-            # Vote threshold
-            if is_modify and content.lower() == "keep":
-                pass
-            else:
-                try:
-                    threshold = int(content)
-                    if threshold < 0:
-                        raise ValueError
-                    data["vote_threshold"] = threshold
-                except ValueError:
-                    await message.channel.send("Please enter a valid number (0 or higher).")
-                    return
-
-            # Show confirmation
-            creation["step"] = 9
-            await self._show_confirmation(message.channel, data)
-
-        elif step == 9:
-            # Confirmation - strip any unicode whitespace/formatting characters
-            cleaned = re.sub(r'[^\w]', '', content.lower())
-            print(f"[DEBUG] Confirmation input: {repr(message.content)} -> cleaned: {repr(cleaned)}")
-            if cleaned in ("yes", "y", "confirm"):
-                await self._finalize_poll(message, creation)
-                del self.active_creations[key]
-            elif cleaned in ("no", "n", "cancel"):
-                del self.active_creations[key]
-                await message.channel.send("Poll creation cancelled.")
-            else:
-                await message.channel.send("Please type **yes** to confirm or **no** to cancel.")
-
-    async def _ask_send_time(self, channel, data, is_modify):
-        """Helper to ask the send time question."""
-        hint = f"\n*Current: {data.get('send_time_raw', '')}*" if is_modify else ""
-        await channel.send(
-            f"**Step 5/9:** When should the poll be sent?\n"
-            f"*(e.g., \"Monday at 9am EST\", \"tomorrow at 3pm\", \"in 2 hours\")*{hint}"
+        self.end_session(session, reason="completed")
+        if session.get("view"):
+            session["view"].stop()
+        poll_id = self._finalize_poll(session)
+        action = "modified" if session.get("modify_id") else "created"
+        content = (
+            f"Poll {action} and scheduled! ID: `{poll_id[:8]}`\n"
+            f"Poll will be posted in <#{post_channel_id}>.\n"
+            f"Use `/events list` to see all scheduled polls."
+        )
+        for other, when in self._send_conflicts(self.polls[poll_id]):
+            content += (f"\nHeads up: **{other.question}** (`{other.id[:8]}`) also posts in this channel "
+                        f"at {to_discord_timestamp(when, 'f')}.")
+        await interaction.response.edit_message(
+            content=content,
+            embed=self._build_confirmation_embed(data, title="Poll Summary"),
+            view=None,
         )
 
-    async def _show_confirmation(self, channel, data):
-        """Show a summary of the poll for confirmation."""
-        options_list = [o.strip() for o in data.get("options_raw", "").split(",") if o.strip()]
+    def _build_confirmation_embed(self, data, title="Poll Summary — Confirm?"):
+        """Summarize the poll being set up."""
         options_display = ""
-        for i, opt in enumerate(options_list):
-            options_display += f"  {OPTION_EMOJIS[i]} {opt}\n"
-
-        duration = data.get("duration_hours")
-        if not duration:
-            duration = self._parse_duration(data.get("duration_raw", "24 hours"))
-            data["duration_hours"] = duration
+        option_times = data.get("option_times") or []
+        for i, opt in enumerate(split_options(data.get("options_raw", ""))):
+            options_display += f"  {OPTION_EMOJIS[i]} {opt}"
+            if i < len(option_times) and option_times[i]:
+                options_display += f" — {to_discord_timestamp(datetime.fromisoformat(option_times[i][0]), 'f')}"
+            options_display += "\n"
 
         repeat_text = data.get("repeat_raw", "none")
-        if repeat_text.lower() in ("none", "no"):
+        if data.get("recurrence"):
+            repeat_text = describe_recurrence(data["recurrence"])
+            if data.get("send_time_parsed"):
+                first_send = datetime.fromisoformat(data["send_time_parsed"]) + timedelta(microseconds=1)
+                then = compile_recurrence(data["recurrence"]).upcoming(first_send, 2)
+                if then:
+                    repeat_text += f"\nThen: {', '.join(to_discord_timestamp(t, 'f') for t in then)}"
+        elif repeat_text.lower() in ("none", "no"):
             repeat_text = "No (one-time poll)"
 
         # Format send time with Discord timestamp
@@ -995,34 +1971,42 @@ class Polls(commands.Cog):
         post_channel = f"<#{data['post_channel_id']}>" if data.get("post_channel_id") else "This channel"
 
         embed = discord.Embed(
-            title="Poll Summary — Confirm?",
+            title=title,
             color=discord.Color.gold(),
         )
         embed.add_field(name="Question", value=data.get("question", "?"), inline=False)
         embed.add_field(name="Options", value=options_display or "?", inline=False)
-        embed.add_field(name="Ping", value=data.get("ping_target", "?"), inline=True)
+        embed.add_field(name="Ping", value=data.get("ping_target", "@everyone") or "Nobody", inline=True)
         embed.add_field(name="Post In", value=post_channel, inline=True)
         embed.add_field(name="Send Time", value=send_time_display, inline=True)
         embed.add_field(name="Repeat", value=repeat_text, inline=True)
         embed.add_field(name="Duration", value=data.get("duration_raw", "?"), inline=True)
         embed.add_field(name="Vote Threshold", value=str(data.get("vote_threshold", 0)), inline=True)
-
-        await channel.send(embed=embed)
-        await channel.send("Type **yes** to confirm or **no** to cancel.")
-
-    async def _finalize_poll(self, message, creation):
-        """Create the poll from collected data and schedule it."""
+        embed.add_field(name="Counting", value=METHOD_NAMES[data.get("tally_method")], inline=True)
+        if data.get("early_close"):
+            value = f"Once everyone pinged has voted (open at least {EARLY_CLOSE_MIN_OPEN_MINUTES:g} min)"
+            if not self.bot.intents.members:
+                value = ("Off for now: the bot can't see who's pinged without the Server Members intent "
+                         "(`MEMBERS_INTENT`), so the poll stays open its full duration")
+            embed.add_field(name="Close Early", value=value, inline=True)
+        return embed
+
+    def _finalize_poll(self, creation, save=True):
+        """Create the poll from collected data and schedule it. Returns the poll ID.
+        Bulk imports pass save=False and save once after the last poll."""
         data = creation["data"]
 
-        # Build options with emojis
-        options_list = [o.strip() for o in data.get("options_raw", "").split(",") if o.strip()]
+        # Build options with emojis, and the start times parsed while validating the form
         options = []
-        for i, label in enumerate(options_list):
-            options.append({"label": label, "emoji": OPTION_EMOJIS[i]})
-
-        # Parse recurrence
-        repeat_raw = data.get("repeat_raw", "none")
-        recurrence = parse_recurrence(repeat_raw)
+        option_times = data.get("option_times") or []
+        for i, label in enumerate(split_options(data.get("options_raw", ""))):
+            option = {"label": label, "emoji": OPTION_EMOJIS[i]}
+            if i < len(option_times) and option_times[i]:
+                option["start_time"], option["timezone"] = option_times[i]
+            options.append(option)
+
+        # Recurrence, compiled while validating the form
+        recurrence = data.get("recurrence")
         recurring = recurrence is not None
 
         # Parse duration
@@ -1040,15 +2024,11 @@ class Polls(commands.Cog):
         modify_id = creation.get("modify_id")
         if modify_id:
             poll_id = modify_id
-            for prefix in ["poll_send_", "poll_resolve_"]:
-                try:
-                    self.bot.scheduler.remove_job(f"{prefix}{poll_id}")
-                except Exception:
-                    pass
+            self.scheduler.cancel(poll_id)
         else:
             poll_id = str(uuid.uuid4())
 
-        poll = {
+        poll = poll_from_dict({
             "id": poll_id,
             "guild_id": creation["guild_id"],
             "channel_id": creation["channel_id"],
@@ -1060,28 +2040,121 @@ class Polls(commands.Cog):
             "vote_threshold": data.get("vote_threshold", 0),
             "schedule_cron": recurrence,
             "schedule_timezone": tz,
-            "next_send_time": data.get("send_time_parsed", datetime.now(pytz.utc).isoformat()),
+            "next_send_time": data.get("send_time_parsed", current_time(pytz.utc).isoformat()),
             "poll_duration_hours": duration_hours,
             "status": "scheduled",
             "active_message_id": None,
             "recurring": recurring,
-            "created_at": datetime.now(pytz.utc).isoformat(),
-        }
+            "created_at": current_time(pytz.utc).isoformat(),
+            "early_close": data.get("early_close") or None,
+            "tally_method": data.get("tally_method"),
+        })
 
         self.polls[poll_id] = poll
-        self.save_polls()
+        if save:
+            self.save_polls()
+        self._index_poll(poll)
 
         print(f"[Polls] Poll {poll_id[:8]} {('modified' if modify_id else 'created')}: "
               f"question='{data['question']}', send_time={data.get('send_time_parsed')}, "
               f"tz={tz}, recurring={recurring}")
         self._register_send_job(poll_id, poll)
+        return poll_id
+
+    # ---- Bulk import and export ----
+
+    def validate_import(self, rows, default_channel_id, channel_names=None):
+        """Check import rows (see poll_io) the way the setup form and pickers check their
+        answers. Returns (creation data per row, [(row number, error)]); every row is
+        checked so all the errors can be reported at once.
+
+        Runs no Discord calls, so it can run off the event loop or offline. Channel names
+        resolve through `channel_names` (name -> ID) when given."""
+        datas, errors = [], []
+        for number, row in enumerate(rows, 1):
+            data = {}
+            error = self._apply_import_row(data, row, default_channel_id, channel_names or {})
+            if error:
+                errors.append((number, error))
+            datas.append(data)
+        return datas, errors
+
+    def _apply_import_row(self, data, row, default_channel_id, channel_names):
+        options = row.get("options") or ""
+        if isinstance(options, list):
+            options = "\n".join(str(o) for o in options)
+        cron = row.get("schedule_cron")
+        timezone = row.get("timezone") or None
+        if timezone and timezone not in pytz.all_timezones_set:
+            return f"Unknown timezone \"{timezone}\"."
+        error = self._apply_details(data, {
+            "question": str(row.get("question") or ""),
+            "options_raw": str(options),
+            "send_time_raw": str(row.get("send_time") or ""),
+            "repeat_raw": "none" if cron else str(row.get("repeat") or ""),
+            "duration_raw": str(row.get("duration") or "24 hours"),
+        }, timezone)
+        if error:
+            return error
+
+        if cron:
+            try:
+                cron = json.loads(cron) if isinstance(cron, str) else cron
+                if compile_recurrence(cron).next_fire(current_time(pytz.utc)) is None:
+                    return "That schedule_cron never fires again."
+            except (ValueError, KeyError, TypeError, AttributeError):
+                return "schedule_cron isn't a valid schedule."
+            data["recurrence"] = cron
+
+        channel = str(row.get("channel") or default_channel_id).strip()
+        match = re.fullmatch(r"<#(\d+)>|(\d+)", channel)
+        if match:
+            data["post_channel_id"] = int(match.group(1) or match.group(2))
+        elif channel.lstrip("#") in channel_names:
+            data["post_channel_id"] = channel_names[channel.lstrip("#")]
+        else:
+            return f"Unknown channel \"{channel}\"."
 
-        action = "modified" if modify_id else "created"
-        await message.channel.send(
-            f"Poll {action} and scheduled! ID: `{poll_id[:8]}`\n"
-            f"Poll will be posted in <#{post_channel_id}>.\n"
-            f"Use `/events list` to see all scheduled polls."
-        )
+        ping = str(row.get("ping", "@everyone")).strip()
+        ping = "" if ping.lower() in ("none", "no") else ping
+        if ping not in ("", "@everyone", "@here") and not ROLE_MENTION_RE.fullmatch(ping):
+            return "ping must be @everyone, @here, a role mention like <@&123> or empty."
+        data["ping_target"] = ping
+
+        try:
+            data["vote_threshold"] = int(row.get("threshold") or 0)
+        except (TypeError, ValueError):
+            return "threshold must be a whole number."
+        if data["vote_threshold"] < 0:
+            return "threshold can't be negative."
+
+        data["early_close"] = poll_io.truthy(row.get("early_close"))
+        tally_method = row.get("tally_method") or None
+        if tally_method not in (None, *TALLY_METHODS):
+            return f"tally_method must be one of {', '.join(TALLY_METHODS)}, or empty."
+        data["tally_method"] = tally_method
+        return None
+
+    def create_imported(self, datas, guild_id, channel_id, creator_id):
+        """Create and schedule validated import rows, saving the store once. Returns the poll IDs."""
+        poll_ids = [self._finalize_poll({"data": data, "guild_id": guild_id, "channel_id": channel_id,
+                                         "creator_id": creator_id}, save=False)
+                    for data in datas]
+        self.save_polls()
+        print(f"[Polls] Imported {len(poll_ids)} polls into guild {guild_id}")
+        return poll_ids
+
+    def export_rows(self, guild_id):
+        """Import rows recreating every live poll in the guild, tiebreakers and finished polls aside."""
+        return [poll_io.poll_to_row(p) for p in self.polls.values()
+                if p.guild_id == guild_id and not p.is_tiebreaker and p.status != "completed"]
+
+    @staticmethod
+    def _describe_import_errors(errors):
+        lines = [f"Row {number}: {error}" for number, error in errors[:IMPORT_ERRORS_SHOWN]]
+        if len(errors) > IMPORT_ERRORS_SHOWN:
+            lines.append(f"...and {len(errors) - IMPORT_ERRORS_SHOWN} more.")
+        return "\n".join(lines)
 
     def _parse_duration(self, text):
         """Parse a duration string like '24 hours' or '2 days' into hours."""
@@ -0,0 +1,182 @@
+"""Reminders, kept per guild and channel in an append-only journal.
+
+Every add or delete appends one JSON line to the journal, so saving costs the same
+however many reminders there are. Loading replays the journal; once it holds more
+dead lines than live reminders (and at least COMPACT_MIN_DEAD_LINES of them), it is
+rewritten with just the live ones.
+
+Reminders have stable integer IDs that are never reused. Each channel's reminders
+are an insertion-ordered dict of IDs, so deleting is O(1) and listing walks only
+as far as the page asked for.
+
+A reminder may be due at a time (`due`, a UTC timestamp) and repeat on a
+schedule_cron dict like a poll's. Reminders on the same schedule share one dict.
+"""
+import json
+import os
+from dataclasses import asdict, dataclass
+from itertools import chain, islice
+
+from cogs.poll_recurrence import cron_key
+
+COMPACT_MIN_DEAD_LINES = 1000
+
+# Reminders from the single shared list that predates per-channel lists; shown in every channel
+LEGACY_SCOPE = (None, None)
+
+
+@dataclass(slots=True)
+class Reminder:
+    id: int
+    guild_id: int
+    channel_id: int
+    author_id: int
+    text: str
+    created_at: str = None  # ISO timestamp
+    due: float = None  # UTC timestamp of the next delivery; None for a plain list entry
+    repeat: dict = None  # schedule_cron dict for repeating reminders
+
+
+def _record(reminder):
+    return {k: v for k, v in asdict(reminder).items() if v is not None}
+
+
+class ReminderStore:
+    def __init__(self, path, legacy_path=None):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.reminders = {}  # ID -> Reminder
+        self.scopes = {}  # (guild_id, channel_id) -> {ID: None}, oldest first
+        self.next_id = 1
+        self.dead_lines = 0
+        self._repeats = {}  # cron_key -> the schedule_cron dict reminders on it share
+        self.load()
+
+    def __len__(self):
+        return len(self.reminders)
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                for number, line in enumerate(f, 1):
+                    try:
+                        self._replay(json.loads(line))
+                    except (json.JSONDecodeError, KeyError, TypeError) as e:
+                        # Most likely a line cut short by a crash mid-append
+                        print(f"[Reminders] Skipped damaged line {number} of {self.path}: {e}")
+                        self.dead_lines += 1
+        except FileNotFoundError:
+            self._import_legacy()
+            return
+        print(f"[Reminders] Loaded {len(self.reminders)} reminders.")
+        self._maybe_compact()
+
+    def _import_legacy(self):
+        """Carry over the old shared list (a JSON list of {"reminder": text}) the first time."""
+        if not self.legacy_path:
+            return
+        try:
+            with open(self.legacy_path, "r") as f:
+                content = f.read()
+        except FileNotFoundError:
+            return
+        entries = json.loads(content) if content.strip() else []
+        for entry in entries:
+            self._insert(Reminder(self.next_id, None, None, None, entry["reminder"]))
+        if entries:
+            self.compact()
+            print(f"[Reminders] Imported {len(entries)} reminders from {self.legacy_path}.")
+
+    def _replay(self, record):
+        op = record.get("op")
+        if op == "delete":
+            self._remove(record["id"])
+            self.dead_lines += 2  # this line and the reminder's own
+        elif op == "due":
+            if record["id"] in self.reminders:
+                self.reminders[record["id"]].due = record["due"]
+            self.dead_lines += 1
+        else:
+            self._insert(Reminder(**{k: v for k, v in record.items() if k != "op"}))
+
+    def _insert(self, reminder):
+        if reminder.repeat is not None:
+            reminder.repeat = self._repeats.setdefault(cron_key(reminder.repeat), reminder.repeat)
+        self.reminders[reminder.id] = reminder
+        self.scopes.setdefault((reminder.guild_id, reminder.channel_id), {})[reminder.id] = None
+        self.next_id = max(self.next_id, reminder.id + 1)
+
+    def _remove(self, reminder_id):
+        reminder = self.reminders.pop(reminder_id, None)
+        if reminder is None:
+            return None
+        scope = (reminder.guild_id, reminder.channel_id)
+        del self.scopes[scope][reminder_id]
+        if not self.scopes[scope]:
+            del self.scopes[scope]
+        return reminder
+
+    def _append(self, *records):
+        with open(self.path, "a") as f:
+            f.writelines(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+
+    def _maybe_compact(self):
+        if self.dead_lines >= COMPACT_MIN_DEAD_LINES and self.dead_lines > len(self.reminders):
+            self.compact()
+
+    def compact(self):
+        """Rewrite the journal with only the live reminders."""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.writelines(json.dumps(_record(r), separators=(",", ":")) + "\n" for r in self.reminders.values())
+        os.replace(tmp_path, self.path)
+        self.dead_lines = 0
+
+    def add(self, guild_id, channel_id, author_id, text, created_at=None, due=None, repeat=None):
+        reminder = Reminder(self.next_id, guild_id, channel_id, author_id, text, created_at, due, repeat)
+        self._insert(reminder)
+        self._append(_record(reminder))
+        return reminder
+
+    def delete(self, reminder_id, guild_id, channel_id):
+        """Delete a reminder listed in this channel. Returns it, or None if there's no such reminder here."""
+        reminder = self.reminders.get(reminder_id)
+        if reminder is None or (reminder.guild_id, reminder.channel_id) not in ((guild_id, channel_id), LEGACY_SCOPE):
+            return None
+        self._remove(reminder_id)
+        self._append({"op": "delete", "id": reminder_id})
+        self.dead_lines += 2
+        self._maybe_compact()
+        return reminder
+
+    def after_delivery(self, finished, rescheduled):
+        """Record a batch of deliveries in one write: reminders in `finished` are
+        removed, and repeating ones in `rescheduled` ({ID: next due}) move on."""
+        records = []
+        for reminder_id in finished:
+            if self._remove(reminder_id):
+                records.append({"op": "delete", "id": reminder_id})
+                self.dead_lines += 2
+        for reminder_id, due in rescheduled.items():
+            if reminder_id in self.reminders:
+                self.reminders[reminder_id].due = due
+                records.append({"op": "due", "id": reminder_id, "due": due})
+                self.dead_lines += 1
+        if records:
+            self._append(*records)
+            self._maybe_compact()
+
+    def scheduled(self):
+        """Every reminder with a due time."""
+        return [r for r in self.reminders.values() if r.due is not None]
+
+    def count(self, guild_id, channel_id):
+        """Reminders listed in this channel, including the legacy shared ones."""
+        return len(self.scopes.get((guild_id, channel_id), ())) + len(self.scopes.get(LEGACY_SCOPE, ()))
+
+    def page(self, guild_id, channel_id, page, page_size):
+        """Return (reminders, has_more) for a 1-based page of this channel's list, oldest first."""
+        ids = chain(self.scopes.get((guild_id, channel_id), ()), self.scopes.get(LEGACY_SCOPE, ()))
+        start = (page - 1) * page_size
+        chunk = [self.reminders[i] for i in islice(ids, start, start + page_size + 1)]
+        return chunk[:page_size], len(chunk) > page_size
@@ -0,0 +1,113 @@
+import asyncio
+import heapq
+import traceback
+from datetime import datetime
+
+import pytz
+
+# Re-check the wall clock at least this often so a suspended host doesn't oversleep
+MAX_SLEEP_SECONDS = 60
+
+
+def _utc_now():
+    return datetime.now(pytz.utc)
+
+
+class ReminderTimer:
+    """Delivers due reminders from one asyncio task.
+
+    The heap holds plain (due, reminder ID) tuples, so a pending reminder costs one
+    small tuple on top of the reminder itself, and the task only wakes when the
+    earliest one is due. Entries are never removed early: a deleted or rescheduled
+    reminder's old entry is skipped when it's popped, as its ID is gone or its due
+    time no longer matches. Everything due at once is handed to `deliver` in one
+    batch.
+
+    The clock is injectable; a stopped timer can be driven with run_due()."""
+
+    def __init__(self, store, deliver, clock=_utc_now):
+        self.store = store
+        self.deliver = deliver  # async callable taking a list of due Reminders
+        self.clock = clock
+        self._heap = [(r.due, r.id) for r in store.scheduled()]
+        heapq.heapify(self._heap)
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self.delivered = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    def push(self, reminder, due=None):
+        """Arm a reminder at its due time, or at `due` for a retry."""
+        due = reminder.due if due is None else due
+        heapq.heappush(self._heap, (due, reminder.id))
+        if self._heap[0][1] == reminder.id:
+            self._wakeup.set()
+
+    def _is_stale(self, due, reminder_id):
+        reminder = self.store.reminders.get(reminder_id)
+        return reminder is None or reminder.due is None or reminder.due > due
+
+    def next_due(self):
+        """Timestamp of the earliest live entry, or None."""
+        while self._heap and self._is_stale(*self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self):
+        """Remove and return the reminders due now, earliest first."""
+        now_ts = self.clock().timestamp()
+        due = []
+        seen = set()
+        while self._heap and self._heap[0][0] <= now_ts:
+            entry = heapq.heappop(self._heap)
+            if not self._is_stale(*entry) and entry[1] not in seen:
+                seen.add(entry[1])
+                due.append(self.store.reminders[entry[1]])
+        # Stale entries pile up when reminders are deleted before they're due
+        if len(self._heap) > 2 * len(self.store.reminders) + 64:
+            self._heap = [e for e in self._heap if not self._is_stale(*e)]
+            heapq.heapify(self._heap)
+        return due
+
+    async def run_due(self):
+        """Deliver everything due now. Returns how many reminders were delivered."""
+        due = self.pop_due()
+        if due:
+            self.delivered += len(due)
+            try:
+                await self.deliver(due)
+            except Exception as e:
+                print(f"[Reminders] Delivering {len(due)} reminder(s) raised {e!r}")
+                traceback.print_exc()
+        return len(due)
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            next_due = self.next_due()
+            if next_due is None:
+                await self._wakeup.wait()
+                continue
+            delay = next_due - self.clock().timestamp()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), min(delay, MAX_SLEEP_SECONDS))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self.run_due()
@@ -1,67 +1,216 @@
 import discord
 from discord.ext import commands
-import json
-import os
+from datetime import datetime
+import dateparser
+import pytz
+import re
+from cogs.polls import normalize_shorthand_datetime, parse_recurrence, parse_timezone, to_discord_timestamp
+from cogs.poll_recurrence import compile_recurrence, describe_recurrence
+from cogs.reminder_store import ReminderStore
+from cogs.reminder_timer import ReminderTimer
+from cogs.search_index import SearchIndex, format_results
 
-DATA_PATH = "data/reminder_list.json"
+DATA_PATH = "data/reminders.jsonl"
+# The single shared list used before reminders were kept per channel; imported once
+LEGACY_PATH = "data/reminder_list.json"
+# Words in reminders, for $search
+SEARCH_INDEX_PATH = "data/reminders_index.jsonl"
+
+PAGE_SIZE = 10
+# Long reminders are cut short in $list so a full page fits in one message
+LIST_TEXT_LIMIT = 150
+
+# Where the time starts in "$remind <text> at <time>"; the earliest one that parses wins
+TIME_START_RE = re.compile(r"\s+(?=(?:at|on|in|every|today|tonight|tomorrow|next)\b)", re.IGNORECASE)
+
+# A failed delivery (other than a missing channel or permission) is retried this much later
+RETRY_SECONDS = 60
+MESSAGE_LIMIT = 2000
+# Each $list line, due time included, is cut to this, leaving room on a full page
+# for the header and footer
+LIST_LINE_LIMIT = (MESSAGE_LIMIT - 100) // PAGE_SIZE - 1
+
+
+def current_time(tz=pytz.utc):
+    """Return the current time in the given timezone. Reminder code reads the clock through here."""
+    return datetime.now(tz)
+
+
+def _shorten(text, limit):
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+def parse_reminder(text, now):
+    """Split "$remind" text into (text, due, repeat): 'bring snacks at Friday 7pm EST'
+    is due once, 'bring snacks every Friday at 6pm' repeats on a schedule_cron dict.
+    due and repeat are None for a plain list entry, including when the time has passed."""
+    for match in TIME_START_RE.finditer(text):
+        head, tail = text[:match.start()].strip(), text[match.end():].strip()
+        if not head:
+            continue
+        if tail.lower().startswith("every "):
+            repeat = parse_recurrence(tail, anchor=now)
+            if repeat:
+                due = compile_recurrence(repeat).next_fire(now)
+                if due is not None:
+                    return head, due, repeat
+            continue
+        when = re.sub(r"^(?:at|on)\s+", "", tail, flags=re.IGNORECASE)
+        tz_name = parse_timezone(when)
+        parsed = dateparser.parse(normalize_shorthand_datetime(when), settings={
+            'PREFER_DATES_FROM': 'future',
+            'RELATIVE_BASE': now.astimezone(pytz.timezone(tz_name)).replace(tzinfo=None),
+            'TIMEZONE': tz_name,
+            'RETURN_AS_TIMEZONE_AWARE': True,
+        })
+        if parsed and parsed > now:
+            return head, parsed, None
+    return text, None, None
 
 
 class Reminders(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.reminder_list = []
-        self.load_list()
-
-    def save_list(self):
-        with open(DATA_PATH, "w") as f:
-            json.dump(self.reminder_list, f)
-        print("List Saved!")
-
-    def load_list(self):
-        try:
-            with open(DATA_PATH, "r") as f:
-                content = f.read()
-                if content:
-                    self.reminder_list = json.loads(content)
-                    print("List Loaded!")
-                else:
-                    print("Empty file, starting fresh")
-        except FileNotFoundError:
-            print("No saved list found, starting fresh")
-
-    def format_list(self):
-        if not self.reminder_list:
-            return "\nNo reminders yet! You're all caught up."
-        output = "\nYour reminders:"
-        for i, reminder in enumerate(self.reminder_list, 1):
-            output += f"\n{i}. {reminder['reminder']}"
+        self.store = ReminderStore(DATA_PATH, LEGACY_PATH)
+        self.timer = ReminderTimer(self.store, self.deliver, clock=lambda: current_time(pytz.utc))
+        self.search_index = SearchIndex(SEARCH_INDEX_PATH, "Reminders")
+        if not self.search_index.loaded:
+            self.search_index.rebuild(map(self._search_document, self.store.reminders.values()))
+
+    async def cog_load(self):
+        self.timer.start()
+
+    async def cog_unload(self):
+        self.timer.stop()
+
+    @staticmethod
+    def _scope(ctx):
+        return (ctx.guild.id if ctx.guild else None, ctx.channel.id)
+
+    @staticmethod
+    def _search_document(reminder):
+        """(doc ID, guild ID, channel ID, result line, text) for the search index."""
+        text = _shorten(reminder.text, LIST_TEXT_LIMIT)
+        return reminder.id, reminder.guild_id, reminder.channel_id, f"`#{reminder.id}` {text}", reminder.text
+
+    @staticmethod
+    def _describe_due(reminder):
+        due = datetime.fromtimestamp(reminder.due, pytz.utc)
+        if reminder.repeat:
+            return f"{describe_recurrence(reminder.repeat)}, next {to_discord_timestamp(due, 'f')}"
+        return f"{to_discord_timestamp(due, 'f')} ({to_discord_timestamp(due, 'R')})"
+
+    def _list_line(self, reminder):
+        """One $list line, at most LIST_LINE_LIMIT long: the text gives way to the due
+        time first, then a very long schedule is cut short too."""
+        head = f"`#{reminder.id}` "
+        due = f" — {self._describe_due(reminder)}" if reminder.due is not None else ""
+        room = LIST_LINE_LIMIT - len(head) - len(due)
+        text = _shorten(reminder.text, max(min(LIST_TEXT_LIMIT, room), 20))
+        return _shorten(head + text + due, LIST_LINE_LIMIT)
+
+    def format_page(self, ctx, page):
+        reminders, has_more = self.store.page(*self._scope(ctx), page, PAGE_SIZE)
+        if not reminders:
+            if page == 1:
+                return "No reminders yet! You're all caught up."
+            return f"No reminders on page {page}."
+        total = self.store.count(*self._scope(ctx))
+        pages = -(-total // PAGE_SIZE)
+        output = f"Your reminders (page {page} of {pages}):"
+        for reminder in reminders:
+            output += f"\n{self._list_line(reminder)}"
+        if has_more:
+            output += f"\nUse `$list {page + 1}` for more."
         return output
 
+    async def deliver(self, due):
+        """Post a batch of due reminders, one message per channel where they fit, then
+        drop the one-off ones and move repeating ones to their next time. Reminders for
+        a channel that's gone or closed to the bot are all dropped, repeating or not."""
+        now = current_time(pytz.utc)
+        by_channel = {}
+        for reminder in due:
+            by_channel.setdefault(reminder.channel_id, []).append(reminder)
+
+        finished, rescheduled = [], {}
+        for channel_id, reminders in by_channel.items():
+            try:
+                await self._send_batch(channel_id, reminders)
+            except (discord.Forbidden, discord.NotFound) as e:
+                print(f"[Reminders] Dropped {len(reminders)} reminder(s) for channel {channel_id}: {e}")
+                finished.extend(reminder.id for reminder in reminders)
+                continue
+            except discord.HTTPException as e:
+                print(f"[Reminders] Couldn't deliver to channel {channel_id} ({e}); retrying in {RETRY_SECONDS}s")
+                for reminder in reminders:
+                    self.timer.push(reminder, due=now.timestamp() + RETRY_SECONDS)
+                continue
+            for reminder in reminders:
+                next_due = compile_recurrence(reminder.repeat).next_fire(now) if reminder.repeat else None
+                if next_due is None:
+                    finished.append(reminder.id)
+                else:
+                    rescheduled[reminder.id] = next_due.timestamp()
+        self.store.after_delivery(finished, rescheduled)
+        for reminder_id in finished:
+            self.search_index.remove(reminder_id)
+        for reminder_id in rescheduled:
+            self.timer.push(self.store.reminders[reminder_id])
+
+    async def _send_batch(self, channel_id, reminders):
+        channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+        message = ""
+        for reminder in reminders:
+            line = f"⏰ <@{reminder.author_id}> {reminder.text}"[:MESSAGE_LIMIT]
+            if message and len(message) + 1 + len(line) > MESSAGE_LIMIT:
+                await channel.send(message, allowed_mentions=discord.AllowedMentions(users=True))
+                message = ""
+            message = f"{message}\n{line}" if message else line
+        await channel.send(message, allowed_mentions=discord.AllowedMentions(users=True))
+
     @commands.command(name="remind")
     async def remind(self, ctx, *, text: str):
-        await ctx.send(f'Reminder set: {text}')
-        self.reminder_list.append({"reminder": text})
-        self.save_list()
+        now = current_time(pytz.utc)
+        text, due, repeat = parse_reminder(text, now)
+        reminder = self.store.add(*self._scope(ctx), ctx.author.id, text, created_at=now.isoformat(),
+                                  due=due.timestamp() if due else None, repeat=repeat)
+        self.search_index.upsert(*self._search_document(reminder))
+        if due is None:
+            await ctx.send(f'Reminder set: {text} (`#{reminder.id}`)')
+            return
+        self.timer.push(reminder)
+        await ctx.send(f'Reminder set: {text} (`#{reminder.id}`) — {self._describe_due(reminder)}')
 
     @commands.command(name="list")
-    async def list_reminders(self, ctx):
-        await ctx.send('Here are your reminders:')
-        await ctx.send(self.format_list())
+    async def list_reminders(self, ctx, page: int = 1):
+        await ctx.send(self.format_page(ctx, max(page, 1)))
 
     @commands.command(name="delete")
-    async def delete_reminder(self, ctx, index: int):
-        idx = index - 1
-        if 0 <= idx < len(self.reminder_list):
-            del self.reminder_list[idx]
-            self.save_list()
-            await ctx.send('Reminder deleted.')
+    async def delete_reminder(self, ctx, reminder_id: int):
+        if self.store.delete(reminder_id, *self._scope(ctx)):
+            self.search_index.remove(reminder_id)
+            await ctx.send(f'Reminder `#{reminder_id}` deleted.')
         else:
-            await ctx.send('Invalid index. Please provide a valid reminder number to delete.')
+            await ctx.send('No such reminder here. Use `$list` to see reminder numbers.')
+
+    @commands.command(name="search")
+    async def search(self, ctx, *, query: str):
+        indexes = [self.search_index]
+        polls = self.bot.get_cog("Polls")
+        if polls:
+            indexes.append(polls.search_index)
+        await ctx.send(format_results(indexes, query, *self._scope(ctx)), allowed_mentions=discord.AllowedMentions.none())
 
     @delete_reminder.error
     async def delete_error(self, ctx, error):
         if isinstance(error, (commands.MissingRequiredArgument, commands.BadArgument)):
-            await ctx.send('Invalid index. Please provide a valid reminder number to delete.')
+            await ctx.send('Please provide the number of the reminder to delete, as shown in `$list`.')
+
+    @list_reminders.error
+    async def list_error(self, ctx, error):
+        if isinstance(error, commands.BadArgument):
+            await ctx.send('Please provide a page number, e.g. `$list 2`.')
 
 
 async def setup(bot):
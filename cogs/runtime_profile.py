@@ -0,0 +1,64 @@
+"""How much of Discord the bot subscribes to and keeps in memory.
+
+The "full" profile is what the bot has always run with: discord.py's default
+intents plus message content, and its default caches, including the last 1000
+messages. With MEMBERS_INTENT on, it also receives the members intent, so
+discord.py requests every guild's members at startup and caches them all. The
+bot's own state is polls, reminders and scheduled events, so the "lean" profile
+keeps less:
+
+- only the intents the loaded extensions declare in EXTENSION_INTENTS
+- no member cache and no chunking; an early-closing poll (MEMBERS_INTENT) fetches
+  the pinged role's members once, when it posts
+- no message cache; votes come from raw reaction events, and poll messages are
+  fetched when they're counted
+
+Without the members intent the saving is mostly the message cache, about 12% at
+1k guilds. With it, lean skips the member cache, which is most of the full
+profile's memory. `scripts/bench_runtime_profile.py` measures both.
+"""
+import discord
+
+PROFILES = ("full", "lean")
+
+# Gateway intents each extension needs in the lean profile, on top of guilds.
+# A new extension must be listed here before the lean profile will load it.
+EXTENSION_INTENTS = {
+    "cogs.watchdog": (),
+    # The $ commands are read from messages, in servers and DMs
+    "cogs.reminders": ("guild_messages", "dm_messages", "message_content"),
+    # Votes are reactions. Early close also needs the members intent, which is opt-in (see client_options)
+    "cogs.polls": ("guild_reactions", "guild_scheduled_events"),
+    "cogs.http_api": (),
+}
+
+
+def client_options(profile, extensions, members=False):
+    """Keyword arguments for the bot's constructor under `profile`, given the
+    extensions it will load. Raises ValueError for an unknown profile or extension.
+
+    `members` adds the privileged Server Members intent, which early-closing polls
+    need to know who they're waiting for. It must also be switched on for the bot in
+    the Developer Portal, or Discord refuses the connection, so it's off unless asked for."""
+    if profile == "full":
+        intents = discord.Intents.default()
+        intents.message_content = True
+        intents.members = members
+        return {"intents": intents}
+    if profile != "lean":
+        raise ValueError(f"Unknown RUNTIME_PROFILE {profile!r}; expected one of {', '.join(PROFILES)}")
+
+    intents = discord.Intents.none()
+    intents.guilds = True
+    for extension in extensions:
+        if extension not in EXTENSION_INTENTS:
+            raise ValueError(f"{extension} doesn't declare its intents in EXTENSION_INTENTS")
+        for name in EXTENSION_INTENTS[extension]:
+            setattr(intents, name, True)
+    intents.members = members
+    return {
+        "intents": intents,
+        "member_cache_flags": discord.MemberCacheFlags.none(),
+        "chunk_guilds_at_startup": False,
+        "max_messages": None,
+    }
@@ -0,0 +1,199 @@
+"""Full-text search over reminders and polls.
+
+An inverted index maps each word to the IDs of the documents containing it. A
+document is a reminder or a poll: where it's visible (guild, and channel for
+reminders), the line shown when it matches, and its distinct words. Every change
+appends one line to a journal, compacted like the reminder journal, so startup
+reads the saved words back instead of re-reading and re-tokenizing every reminder
+and archived poll.
+
+Queries intersect the posting sets of their words, smallest first, and the last
+word also matches as a prefix ("drag" finds "dragon"), so they touch only
+documents that contain every word.
+"""
+import bisect
+import heapq
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass
+
+TOKEN_RE = re.compile(r"\w+")
+COMPACT_MIN_DEAD_LINES = 1000
+SEARCH_LIMIT = 10
+
+# Most prefixes don't need more than this many words to find the matches worth showing
+MAX_PREFIX_WORDS = 200
+
+
+def tokenize(text):
+    """Distinct lowercase words, interned so documents and postings share them."""
+    return {sys.intern(word) for word in TOKEN_RE.findall(text.lower())}
+
+
+@dataclass(slots=True)
+class SearchDoc:
+    guild_id: int
+    channel_id: int  # None when visible in every channel of the guild
+    line: str  # shown in results
+    seq: int  # results are newest first
+    words: tuple
+
+
+class SearchIndex:
+    def __init__(self, path, name):
+        self.path = path
+        self.name = name  # heading for this index's results, e.g. "Polls"
+        self.docs = {}  # doc ID -> SearchDoc
+        self.postings = {}  # word -> {doc ID}
+        self.next_seq = 1
+        self.dead_lines = 0
+        self.loaded = False  # False when there was no journal and the owner should rebuild()
+        self._vocabulary = None  # sorted words, rebuilt after words are added or dropped
+        self.load()
+
+    def __len__(self):
+        return len(self.docs)
+
+    def load(self):
+        try:
+            with open(self.path, "r") as f:
+                for number, line in enumerate(f, 1):
+                    try:
+                        record = json.loads(line)
+                        if record.get("op") == "delete":
+                            self._remove(record["id"])
+                            self.dead_lines += 2
+                        else:
+                            self._insert(record["id"], record["g"], record["c"], record["l"], record["s"],
+                                         record["w"].split())
+                    except (json.JSONDecodeError, KeyError, TypeError) as e:
+                        print(f"[Search] Skipped damaged line {number} of {self.path}: {e}")
+                        self.dead_lines += 1
+        except FileNotFoundError:
+            return
+        self.loaded = True
+        print(f"[Search] Loaded {len(self.docs)} {self.name.lower()} into the search index.")
+        self._maybe_compact()
+
+    def _insert(self, doc_id, guild_id, channel_id, line, seq, words):
+        if doc_id in self.docs:
+            self._remove(doc_id)
+            self.dead_lines += 1
+        words = tuple(sys.intern(w) for w in words)
+        self.docs[doc_id] = SearchDoc(guild_id, channel_id, line, seq, words)
+        for word in words:
+            posting = self.postings.get(word)
+            if posting is None:
+                posting = self.postings[word] = set()
+                self._vocabulary = None
+            posting.add(doc_id)
+        self.next_seq = max(self.next_seq, seq + 1)
+
+    def _remove(self, doc_id):
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return None
+        for word in doc.words:
+            posting = self.postings[word]
+            posting.discard(doc_id)
+            if not posting:
+                del self.postings[word]
+                self._vocabulary = None
+        return doc
+
+    @staticmethod
+    def _record(doc_id, doc):
+        return {"id": doc_id, "g": doc.guild_id, "c": doc.channel_id, "l": doc.line, "s": doc.seq,
+                "w": " ".join(doc.words)}
+
+    def _append(self, record):
+        with open(self.path, "a") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def _maybe_compact(self):
+        if self.dead_lines >= COMPACT_MIN_DEAD_LINES and self.dead_lines > len(self.docs):
+            self.compact()
+
+    def compact(self):
+        """Rewrite the journal with only the current documents."""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.writelines(json.dumps(self._record(doc_id, doc), separators=(",", ":")) + "\n"
+                         for doc_id, doc in self.docs.items())
+        os.replace(tmp_path, self.path)
+        self.dead_lines = 0
+        self.loaded = True
+
+    def upsert(self, doc_id, guild_id, channel_id, line, text):
+        """Index a new document, or re-index a changed one. Unchanged documents aren't rewritten."""
+        words = tuple(sorted(tokenize(text)))
+        doc = self.docs.get(doc_id)
+        if doc is not None and (doc.guild_id, doc.channel_id, doc.line, doc.words) == (guild_id, channel_id, line, words):
+            return
+        seq = doc.seq if doc is not None else self.next_seq
+        self._insert(doc_id, guild_id, channel_id, line, seq, words)
+        self._append(self._record(doc_id, self.docs[doc_id]))
+        self._maybe_compact()
+
+    def remove(self, doc_id):
+        if self._remove(doc_id) is None:
+            return
+        self._append({"op": "delete", "id": doc_id})
+        self.dead_lines += 2
+        self._maybe_compact()
+
+    def rebuild(self, documents):
+        """Replace the index with (doc ID, guild ID, channel ID, line, text) tuples, in
+        oldest-first order, and save it in one write."""
+        self.docs, self.postings, self.next_seq, self._vocabulary = {}, {}, 1, None
+        for doc_id, guild_id, channel_id, line, text in documents:
+            self._insert(doc_id, guild_id, channel_id, line, self.next_seq, sorted(tokenize(text)))
+        self.compact()
+        print(f"[Search] Indexed {len(self.docs)} {self.name.lower()}.")
+
+    def _prefixed(self, prefix):
+        """Doc IDs containing a word that starts with `prefix`."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        found = set()
+        for word in self._vocabulary[start:start + MAX_PREFIX_WORDS]:
+            if not word.startswith(prefix):
+                break
+            found |= self.postings[word]
+        return found
+
+    def search(self, query, guild_id, channel_id, limit=SEARCH_LIMIT):
+        """Return (matching docs, newest first and at most `limit`; how many matched in
+        all) for documents containing every word of `query` that are visible from the channel."""
+        words = TOKEN_RE.findall(query.lower())
+        if not words:
+            return [], 0
+        sets = [self.postings.get(w, set()) for w in words[:-1]]
+        sets.append(self._prefixed(words[-1]))
+        sets.sort(key=len)
+        matches = set(sets[0])
+        for other in sets[1:]:
+            if not matches:
+                break
+            matches &= other
+        visible = [doc for doc in map(self.docs.__getitem__, matches)
+                   if (doc.guild_id, doc.channel_id) == (None, None)
+                   or (doc.guild_id == guild_id and doc.channel_id in (None, channel_id))]
+        return heapq.nlargest(limit, visible, key=lambda d: d.seq), len(visible)
+
+
+def format_results(indexes, query, guild_id, channel_id, limit=SEARCH_LIMIT):
+    """Search several indexes and describe the results as one message, a section per index."""
+    sections = []
+    for index in indexes:
+        docs, total = index.search(query, guild_id, channel_id, limit)
+        if not docs:
+            continue
+        section = f"**{index.name}**" + (f" (newest {len(docs)} of {total})" if total > len(docs) else "")
+        sections.append(section + "".join(f"\n{doc.line}" for doc in docs))
+    if not sections:
+        return f"Nothing matches \"{query}\"."
+    return "\n\n".join(sections)[:2000]
@@ -0,0 +1,123 @@
+import asyncio
+import heapq
+import itertools
+import time
+
+
+class SessionStore:
+    """Poll setup sessions keyed by (guild_id, user_id), expired proactively.
+
+    A single background task sleeps until the earliest deadline in a heap and
+    evicts sessions as they lapse, so abandoned setups never block a user and
+    memory stays bounded by the per-guild cap. Touching a session only moves
+    its deadline; the stale heap entry is re-pushed when it surfaces instead of
+    on every touch, so the heap never holds more than one entry per live
+    session plus recently removed ones.
+    """
+
+    def __init__(self, ttl_seconds, max_per_guild, on_expire=None, clock=time.monotonic):
+        self.ttl_seconds = ttl_seconds
+        self.max_per_guild = max_per_guild
+        self.on_expire = on_expire
+        self.clock = clock
+        self._sessions = {}  # key -> session
+        self._deadlines = {}  # key -> monotonic expiry time
+        self._per_guild = {}  # guild_id -> live session count
+        self._heap = []  # (deadline, seq, key)
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self.counters = {"created": 0, "completed": 0, "cancelled": 0, "expired": 0, "rejected_full": 0}
+
+    def __contains__(self, key):
+        return key in self._sessions
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def get(self, key, default=None):
+        return self._sessions.get(key, default)
+
+    def add(self, key, session):
+        """Store a session. Returns False if its guild is already at the cap."""
+        if key in self._sessions:
+            self._sessions[key] = session
+            self.touch(key)
+            return True
+        guild_id = key[0]
+        if self._per_guild.get(guild_id, 0) >= self.max_per_guild:
+            self.counters["rejected_full"] += 1
+            return False
+        self._per_guild[guild_id] = self._per_guild.get(guild_id, 0) + 1
+        self.counters["created"] += 1
+        self._sessions[key] = session
+        deadline = self.clock() + self.ttl_seconds
+        self._deadlines[key] = deadline
+        if not self._heap or deadline < self._heap[0][0]:
+            self._wakeup.set()
+        heapq.heappush(self._heap, (deadline, next(self._seq), key))
+        return True
+
+    def touch(self, key):
+        if key in self._sessions:
+            self._deadlines[key] = self.clock() + self.ttl_seconds
+
+    def pop(self, key, reason="cancelled"):
+        """Remove a session, counting why it ended ('completed' or 'cancelled')."""
+        session = self._sessions.pop(key, None)
+        if session is None:
+            return None
+        del self._deadlines[key]
+        remaining = self._per_guild[key[0]] - 1
+        if remaining:
+            self._per_guild[key[0]] = remaining
+        else:
+            del self._per_guild[key[0]]
+        self.counters[reason] += 1
+        return session
+
+    def stats(self):
+        return {**self.counters, "active": len(self._sessions), "heap": len(self._heap)}
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def expire_due(self):
+        """Evict every session whose deadline has passed. Returns the expired sessions."""
+        expired = []
+        now = self.clock()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, key = heapq.heappop(self._heap)
+            deadline = self._deadlines.get(key)
+            if deadline is None:
+                continue  # already removed
+            if deadline > now:
+                # Touched since this entry was pushed; requeue at the new deadline
+                heapq.heappush(self._heap, (deadline, next(self._seq), key))
+                continue
+            expired.append(self.pop(key, reason="expired"))
+        return expired
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            if self._heap:
+                timeout = max(0.0, self._heap[0][0] - self.clock())
+            else:
+                timeout = None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            for session in self.expire_due():
+                if self.on_expire:
+                    try:
+                        await self.on_expire(session)
+                    except Exception as e:
+                        print(f"[Sessions] Expiry callback failed: {e}")
@@ -0,0 +1,170 @@
+import discord
+from discord.ext import commands
+from discord import app_commands
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from datetime import datetime
+
+import pytz
+
+# The event loop counts as stalled once a callback holds it this long; 0 turns the watchdog off
+STALL_THRESHOLD_MS = float(os.getenv("WATCHDOG_STALL_MS", "250"))
+RECENT_STALLS_KEPT = 20
+TOP_OFFENDERS_SHOWN = 10
+
+# Frames from files under here are the bot's own code; the rest is the library call it blocked in
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _short_path(filename):
+    if filename.startswith(PROJECT_ROOT + os.sep):
+        return os.path.relpath(filename, PROJECT_ROOT)
+    return os.path.join(os.path.basename(os.path.dirname(filename)), os.path.basename(filename))
+
+
+def _is_own_code(filename):
+    return filename.startswith(PROJECT_ROOT + os.sep) and os.sep + "site-packages" + os.sep not in filename
+
+
+def describe_stack(frame):
+    """"cogs/polls.py:355 save_polls -> json/encoder.py iterencode": the innermost
+    frame of the bot's own code, then the library function it's blocked in, if any.
+    Library frames leave out the line number so samples anywhere in one function
+    count together."""
+    stack = traceback.extract_stack(frame)
+    leaf = stack[-1]
+    own = next((f for f in reversed(stack) if _is_own_code(f.filename)), None)
+    leaf_text = f"{_short_path(leaf.filename)} {leaf.name}"
+    if own is None:
+        return leaf_text
+    own_text = f"{_short_path(own.filename)}:{own.lineno} {own.name}"
+    return own_text if own is leaf else f"{own_text} -> {leaf_text}"
+
+
+class StallWatchdog:
+    """Finds blocking calls on the event loop.
+
+    A callback on the loop records a heartbeat every `interval` seconds. A separate
+    thread checks it just as often; when the heartbeat is more than `threshold`
+    seconds late, the loop is stuck in something synchronous, so the thread samples
+    the loop thread's current stack. Each sample counts once for the offending
+    frames, so `offenders` ranks code by how long it has held the loop, and each
+    stall is logged with its worst-sampled frames once the loop frees up."""
+
+    def __init__(self, loop, threshold, interval=None, clock=time.monotonic):
+        self.loop = loop
+        self.threshold = threshold
+        self.interval = interval or threshold / 4
+        self.clock = clock
+        self.loop_thread_id = None
+        self.offenders = Counter()  # stack description -> samples taken while stalled
+        self.recent = deque(maxlen=RECENT_STALLS_KEPT)  # (when, seconds, top stack)
+        self.stalls = 0
+        self.worst = 0.0
+        self._beat = clock()
+        self._handle = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start watching. Must be called from the event loop's thread."""
+        if self.running:
+            return
+        self.loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._heartbeat()
+        self._thread = threading.Thread(target=self._watch, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._handle:
+            self._handle.cancel()
+            self._handle = None
+
+    def _heartbeat(self):
+        self._beat = self.clock()
+        if not self._stop.is_set():
+            self._handle = self.loop.call_later(self.interval, self._heartbeat)
+
+    def lag(self):
+        """How far behind the heartbeat is, in seconds."""
+        return max(0.0, self.clock() - self._beat - self.interval)
+
+    def _watch(self):
+        started = longest = stacks = None  # the stall in progress, if any
+        while not self._stop.wait(self.interval):
+            lag = self.lag()
+            if lag >= self.threshold:
+                frame = sys._current_frames().get(self.loop_thread_id)
+                stack = describe_stack(frame) if frame is not None else "unknown"
+                del frame
+                if started is None:
+                    started, longest, stacks = datetime.now(pytz.utc), lag, Counter()
+                    self.stalls += 1
+                longest = max(longest, lag)
+                stacks[stack] += 1
+                self.offenders[stack] += 1
+            elif started is not None:
+                self._record(started, longest, stacks)
+                started = longest = stacks = None
+
+    def _record(self, started, seconds, stacks):
+        self.worst = max(self.worst, seconds)
+        top = stacks.most_common(1)[0][0]
+        self.recent.append((started, seconds, top))
+        others = f" (+{len(stacks) - 1} other stack(s))" if len(stacks) > 1 else ""
+        print(f"[Watchdog] Event loop blocked for {seconds:.2f}s at {top}{others}")
+
+
+class Watchdog(commands.Cog):
+    def __init__(self, bot):
+        self.bot = bot
+        self.watchdog = None
+
+    async def cog_load(self):
+        if STALL_THRESHOLD_MS > 0:
+            self.watchdog = StallWatchdog(asyncio.get_running_loop(), STALL_THRESHOLD_MS / 1000)
+            self.watchdog.start()
+            print(f"[Watchdog] Watching for event loop stalls over {STALL_THRESHOLD_MS:g}ms")
+
+    async def cog_unload(self):
+        if self.watchdog:
+            self.watchdog.stop()
+
+    @app_commands.command(name="stalls", description="Show what has blocked the bot recently (Manage Server)")
+    async def stalls(self, interaction: discord.Interaction):
+        if not interaction.user.guild_permissions.manage_guild:
+            await interaction.response.send_message("You need the Manage Server permission to do that.", ephemeral=True)
+            return
+        watchdog = self.watchdog
+        if watchdog is None:
+            await interaction.response.send_message("The stall watchdog is turned off (WATCHDOG_STALL_MS=0).",
+                                                    ephemeral=True)
+            return
+
+        embed = discord.Embed(title="Event loop stalls", color=discord.Color.orange())
+        embed.description = (f"{watchdog.stalls} stall(s) over {watchdog.threshold * 1000:g}ms since startup, "
+                             f"longest {watchdog.worst:.2f}s. Samples are taken every "
+                             f"{watchdog.interval * 1000:g}ms while the loop is blocked.")
+        if watchdog.offenders:
+            lines = [f"`{samples:>4}` {stack}" for stack, samples in watchdog.offenders.most_common(TOP_OFFENDERS_SHOWN)]
+            embed.add_field(name="Top offenders (samples)", value="\n".join(lines)[:1024], inline=False)
+        if watchdog.recent:
+            lines = [f"<t:{int(when.timestamp())}:R> {seconds:.2f}s at {stack}"
+                     for when, seconds, stack in reversed(watchdog.recent)]
+            embed.add_field(name="Recent stalls", value="\n".join(lines[:5])[:1024], inline=False)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+async def setup(bot):
+    await bot.add_cog(Watchdog(bot))
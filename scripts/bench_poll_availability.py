@@ -0,0 +1,86 @@
+"""Time finding the best session slots for a large server's availability.
+
+Every member gets a few weekly windows in one of several timezones, evenings and
+weekends weighted the way real groups are, and best_slots() looks for the sessions
+that suit the most of them. The first run fills the local-time cache; later runs
+show what `/availability suggest` and `/schedule poll suggest:True` cost inline.
+The session counts are then timed with and without NumPy (optional).
+
+Usage:
+    python scripts/bench_poll_availability.py --members 500 --days 28
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+import pytz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs import poll_availability  # noqa: E402
+from cogs.poll_availability import best_slots, session_counts  # noqa: E402
+
+TIMEZONES = ["US/Eastern", "US/Central", "US/Mountain", "US/Pacific", "Europe/Stockholm", "UTC"]
+
+
+def make_schedules(members, seed):
+    rng = random.Random(seed)
+    schedules = []
+    for _ in range(members):
+        windows = []
+        for weekday in rng.sample(range(7), rng.randint(2, 5)):
+            if weekday >= 5 and rng.random() < 0.5:
+                start = rng.choice(range(9, 16)) * 60
+            else:
+                start = rng.choice(range(17, 22)) * 60 + rng.choice((0, 30))
+            windows.append([weekday, start, start + rng.choice((120, 180, 240, 300))])
+        schedules.append({"timezone": rng.choice(TIMEZONES), "windows": windows})
+    return schedules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--days", type=int, default=28)
+    parser.add_argument("--hours", type=int, default=3)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    schedules = make_schedules(args.members, args.seed)
+    windows = sum(len(s["windows"]) for s in schedules)
+    start = pytz.utc.localize(datetime(2026, 10, 19, 12))
+    print(f"{args.members} members, {windows} weekly windows, {args.days} days ahead, {args.hours}-hour sessions")
+
+    timings = []
+    for _ in range(args.runs):
+        began = time.perf_counter()
+        slots = best_slots(schedules, start, days=args.days, length_minutes=args.hours * 60)
+        timings.append(time.perf_counter() - began)
+    print(f"first run {timings[0] * 1000:.1f} ms, best of the rest {min(timings[1:] or timings) * 1000:.1f} ms")
+    for slot_start, free in slots:
+        print(f"  {slot_start:%a %b %d %H:%M} UTC  {free}/{args.members} free")
+
+    def timed():
+        began = time.perf_counter()
+        counts = session_counts(schedules, start, args.days, args.hours * 60)
+        return counts, time.perf_counter() - began
+
+    numpy_module = poll_availability.numpy
+    poll_availability.numpy = None
+    pure, pure_secs = timed()
+    print(f"session counts, pure Python: {pure_secs * 1000:.1f} ms")
+    if numpy_module is not None:
+        poll_availability.numpy = numpy_module
+        fast, numpy_secs = timed()
+        assert fast == pure, "NumPy and pure Python session counts differ"
+        print(f"session counts, NumPy:       {numpy_secs * 1000:.1f} ms")
+    else:
+        print("session counts, NumPy:       not installed")
+
+
+if __name__ == "__main__":
+    main()
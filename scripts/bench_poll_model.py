@@ -0,0 +1,116 @@
+"""Compare the memory cost of storing polls as JSON dicts vs. slotted Poll models.
+
+Builds the same population of polls both ways, decoded from JSON exactly as
+load_polls() would, and reports traced allocations per representation. Also
+times rendering every poll's next send time as a Discord timestamp when it
+has to be re-parsed from an ISO string vs. read from a pre-parsed datetime.
+
+Usage:
+    python scripts/bench_poll_model.py --polls 100000
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+import pytz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs.poll_model import poll_from_dict, poll_to_dict  # noqa: E402
+from cogs.polls import OPTION_EMOJIS  # noqa: E402
+
+LABELS = ["Fri 7pm EST", "Sat 2pm EST", "Sat 7pm EST", "Sun 1pm EST", "Sun 6pm EST", "Mon 8pm EST"]
+TIMEZONES = ["US/Eastern", "US/Pacific", "Europe/Stockholm", "UTC"]
+
+
+def make_snapshot(count, seed):
+    """Serialize a poll population to the polls.json text format."""
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 5, tzinfo=pytz.utc)
+    polls = {}
+    for _ in range(count):
+        poll_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        tz = rng.choice(TIMEZONES)
+        sent = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 365))
+        labels = rng.sample(LABELS, k=rng.randrange(2, len(LABELS) + 1))
+        polls[poll_id] = {
+            "id": poll_id,
+            "guild_id": rng.randrange(10**17, 10**18),
+            "channel_id": rng.randrange(10**17, 10**18),
+            "post_channel_id": rng.randrange(10**17, 10**18),
+            "creator_id": rng.randrange(10**17, 10**18),
+            "question": "When can everyone play D&D this week?",
+            "options": [{"label": label, "emoji": OPTION_EMOJIS[i]} for i, label in enumerate(labels)],
+            "ping_target": "@everyone",
+            "vote_threshold": rng.choice((0, 1, 2)),
+            "schedule_cron": {"day_of_week": "mon", "hour": 9, "minute": 0, "timezone": tz},
+            "schedule_timezone": tz,
+            "next_send_time": sent.astimezone(pytz.timezone(tz)).isoformat(),
+            "poll_duration_hours": 24,
+            "status": rng.choice(("scheduled", "active", "completed")),
+            "active_message_id": None,
+            "recurring": True,
+            "created_at": base.isoformat(),
+        }
+    return json.dumps({"polls": polls})
+
+
+def measure(build):
+    """Return (result, bytes retained, seconds). Timed separately since tracing slows allocation."""
+    gc.collect()
+    start = time.perf_counter()
+    warmup = build()
+    elapsed = time.perf_counter() - start
+    del warmup
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    text = make_snapshot(args.polls, args.seed)
+
+    dicts, dict_bytes, dict_secs = measure(lambda: json.loads(text)["polls"])
+    del dicts
+    models, model_bytes, model_secs = measure(
+        lambda: {pid: poll_from_dict(p) for pid, p in json.loads(text)["polls"].items()})
+
+    raw = json.loads(text)["polls"]
+    assert all(poll_to_dict(models[pid]) == raw[pid] for pid in raw), "codec is not lossless"
+
+    start = time.perf_counter()
+    for p in raw.values():
+        datetime.fromisoformat(p["next_send_time"]).timestamp()
+    reparse_secs = time.perf_counter() - start
+    start = time.perf_counter()
+    for p in models.values():
+        p.next_send_time.timestamp()
+    preparsed_secs = time.perf_counter() - start
+
+    print(f"{args.polls} polls, {len(text) / 1024 / 1024:.1f} MiB of JSON")
+    print(f"{'representation':<16} {'MiB':>8} {'bytes/poll':>11} {'load s':>8}")
+    print(f"{'dicts':<16} {dict_bytes / 2**20:>8.1f} {dict_bytes / args.polls:>11.0f} {dict_secs:>8.2f}")
+    print(f"{'Poll models':<16} {model_bytes / 2**20:>8.1f} {model_bytes / args.polls:>11.0f} {model_secs:>8.2f}")
+    print(f"Memory saved: {100 * (1 - model_bytes / dict_bytes):.0f}%")
+    print(f"Next-send scan: {reparse_secs * 1000:.1f} ms re-parsing ISO strings, "
+          f"{preparsed_secs * 1000:.1f} ms with pre-parsed datetimes")
+    print("Codec round-trip: lossless")
+
+
+if __name__ == "__main__":
+    main()
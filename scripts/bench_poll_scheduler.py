@@ -0,0 +1,127 @@
+"""Compare the per-poll cost of scheduling sends on APScheduler vs. PollScheduler.
+
+Registers one send per poll the way _register_send_job does (a mix of one-shot
+and recurring cron sends), then reports traced memory per pending job and the
+time taken to register, replace every job once, and cancel them all.
+
+Usage:
+    python scripts/bench_poll_scheduler.py --polls 100000
+"""
+import argparse
+import asyncio
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+import pytz
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.date import DateTrigger
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs.poll_scheduler import PollScheduler  # noqa: E402
+
+TIMEZONES = ["US/Eastern", "US/Pacific", "Europe/Stockholm", "UTC"]
+DAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+
+def make_jobs(count, seed):
+    """[(poll_id, send_time or None, cron or None)], roughly half of them recurring."""
+    rng = random.Random(seed)
+    now = datetime.now(pytz.utc)
+    jobs = []
+    for _ in range(count):
+        poll_id = str(uuid.UUID(int=rng.getrandbits(128)))
+        if rng.random() < 0.5:
+            jobs.append((poll_id, now + timedelta(minutes=rng.randrange(1, 60 * 24 * 30)), None))
+        else:
+            cron = {"day_of_week": rng.choice(DAYS), "hour": rng.randrange(7, 22),
+                    "minute": rng.choice((0, 15, 30, 45)), "timezone": rng.choice(TIMEZONES)}
+            jobs.append((poll_id, None, cron))
+    return jobs
+
+
+async def noop(poll_id):
+    pass
+
+
+def register_apscheduler(scheduler, jobs):
+    for poll_id, send_time, cron in jobs:
+        if cron:
+            trigger = CronTrigger(day_of_week=cron["day_of_week"], hour=cron["hour"],
+                                  minute=cron["minute"], timezone=cron["timezone"])
+        else:
+            trigger = DateTrigger(run_date=send_time)
+        scheduler.add_job(noop, trigger, args=[poll_id], id=f"poll_send_{poll_id}", replace_existing=True)
+
+
+def register_poll_scheduler(scheduler, jobs):
+    for poll_id, send_time, cron in jobs:
+        if cron:
+            scheduler.schedule_cron(poll_id, "send", cron)
+        else:
+            scheduler.schedule(poll_id, "send", send_time)
+
+
+def measure(make, register, cancel, jobs):
+    """Return (bytes per job, register s, replace s, cancel s). Memory is traced on a
+    separate run since tracing slows allocation."""
+    gc.collect()
+    tracemalloc.start()
+    traced = make()
+    register(traced, jobs)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del traced
+
+    scheduler = make()
+    start = time.perf_counter()
+    register(scheduler, jobs)
+    register_secs = time.perf_counter() - start
+    start = time.perf_counter()
+    register(scheduler, jobs)
+    replace_secs = time.perf_counter() - start
+    start = time.perf_counter()
+    for poll_id, _, _ in jobs:
+        cancel(scheduler, poll_id)
+    cancel_secs = time.perf_counter() - start
+    return size / len(jobs), register_secs, replace_secs, cancel_secs
+
+
+async def run(args):
+    jobs = make_jobs(args.polls, args.seed)
+
+    def make_apscheduler():
+        scheduler = AsyncIOScheduler(job_defaults={"misfire_grace_time": 300})
+        scheduler.start(paused=True)
+        return scheduler
+
+    results = {
+        "APScheduler": measure(make_apscheduler, register_apscheduler,
+                               lambda s, pid: s.remove_job(f"poll_send_{pid}"), jobs),
+        "PollScheduler": measure(lambda: PollScheduler({"send": noop}), register_poll_scheduler,
+                                 lambda s, pid: s.cancel(pid, "send"), jobs),
+    }
+
+    print(f"{args.polls} poll sends, half of them recurring")
+    print(f"{'scheduler':<14} {'bytes/job':>10} {'register s':>11} {'replace s':>10} {'cancel s':>9}")
+    for name, (per_job, register_secs, replace_secs, cancel_secs) in results.items():
+        print(f"{name:<14} {per_job:>10.0f} {register_secs:>11.2f} {replace_secs:>10.2f} {cancel_secs:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
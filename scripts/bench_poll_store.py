@@ -0,0 +1,77 @@
+"""Benchmark poll snapshot load/save time and size for each on-disk format.
+
+Compares the legacy indented JSON snapshot (schema v1, saved and loaded the
+way the cog used to) with the compact JSON and msgpack encodings of schema v2.
+Loading includes decoding, validation and building Poll models, i.e. everything Polls.load_polls() does at cold start.
+
+Usage:
+    python scripts/bench_poll_store.py --polls 100000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_poll_model import make_snapshot  # noqa: E402
+from cogs import poll_store  # noqa: E402
+from cogs.poll_model import poll_from_dict, poll_to_dict  # noqa: E402
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="vanvalor-bench-")
+    legacy_polls = json.loads(make_snapshot(args.polls, args.seed))["polls"]
+    rows = []
+
+    # Legacy v1: what save_polls()/load_polls() did before versioned snapshots
+    base = os.path.join(tmp, "legacy", "polls.json")
+    os.makedirs(os.path.dirname(base))
+
+    def legacy_save():
+        with open(base, "w") as f:
+            json.dump({"polls": {pid: poll_to_dict(p) for pid, p in polls.items()}}, f, indent=2, default=str)
+
+    def legacy_load():
+        with open(base, "r") as f:
+            return {pid: poll_from_dict(p) for pid, p in json.loads(f.read())["polls"].items()}
+
+    polls = {pid: poll_from_dict(p) for pid, p in legacy_polls.items()}
+    _, save_secs = timed(legacy_save)
+    _, load_secs = timed(legacy_load)
+    rows.append(("json v1 (indent=2)", os.path.getsize(base), save_secs, load_secs))
+    assert poll_store.load_snapshot(base, "json") == polls, "v1 snapshot didn't upgrade cleanly"
+
+    formats = ["json"] + (["msgpack"] if poll_store.msgpack else [])
+    for fmt in formats:
+        base = os.path.join(tmp, fmt, "polls.json")
+        os.makedirs(os.path.dirname(base))
+        _, save_secs = timed(lambda: poll_store.save_snapshot(base, fmt, polls))
+        loaded, load_secs = timed(lambda: poll_store.load_snapshot(base, fmt))
+        assert loaded == polls, f"{fmt} round-trip changed the polls"
+        rows.append((f"{fmt} v{poll_store.SCHEMA_VERSION}", os.path.getsize(poll_store.snapshot_path(base, fmt)),
+                     save_secs, load_secs))
+
+    print(f"{args.polls} polls")
+    print(f"{'format':<20} {'size MiB':>9} {'save s':>8} {'load s':>8}")
+    for name, size, save_secs, load_secs in rows:
+        print(f"{name:<20} {size / 2**20:>9.1f} {save_secs:>8.2f} {load_secs:>8.2f}")
+    if not poll_store.msgpack:
+        print("(install msgpack to include the binary format)")
+
+
+if __name__ == "__main__":
+    main()
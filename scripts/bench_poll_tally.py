@@ -0,0 +1,94 @@
+"""Time each tally method on a large synthetic poll.
+
+Every voter ranks a few options, favouring some options over others the way real
+groups do, and the ballots are counted by approval, instant runoff and Schulze.
+Pairwise counts are timed with and without NumPy when it's installed. Also
+reports the memory the BallotMatrix takes next to per-voter lists of emojis.
+
+Usage:
+    python scripts/bench_poll_tally.py --options 20 --voters 10000
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs import poll_tally  # noqa: E402
+from cogs.poll_tally import BallotMatrix, rank_options  # noqa: E402
+
+
+def make_rankings(options, voters, seed):
+    rng = random.Random(seed)
+    weights = [rng.random() ** 2 for _ in range(options)]
+    rankings = []
+    for _ in range(voters):
+        picks = []
+        for _ in range(rng.choice((1, 2, 2, 3, 3, 4, 5))):
+            choice = rng.choices(range(options), weights)[0]
+            if choice not in picks:
+                picks.append(choice)
+        rankings.append(picks)
+    return rankings
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def traced_bytes(build):
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--options", type=int, default=20)
+    parser.add_argument("--voters", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rankings = make_rankings(args.options, args.voters, args.seed)
+    emojis = [f"option-{i}" for i in range(args.options)]
+    candidates = range(args.options)
+
+    ballots, build_secs = timed(BallotMatrix.from_rankings, args.options, rankings)
+    matrix_bytes = traced_bytes(lambda: BallotMatrix.from_rankings(args.options, rankings))
+    lists_bytes = traced_bytes(lambda: {voter: [emojis[i] for i in ranking] for voter, ranking in enumerate(rankings)})
+    distinct = len(ballots.rankings())
+
+    print(f"{args.voters} voters ranking {args.options} options ({distinct} distinct ballots)")
+    print(f"BallotMatrix: {matrix_bytes / 1024:.0f} KB (per-voter emoji lists: {lists_bytes / 1024:.0f} KB), "
+          f"built in {build_secs * 1000:.1f} ms")
+
+    print(f"{'method':<10} {'ms':>8}  winner")
+    for method in poll_tally.TALLY_METHODS:
+        (groups, detail), secs = timed(rank_options, method, ballots, candidates)
+        print(f"{method:<10} {secs * 1000:>8.1f}  {groups[0]} {detail}")
+
+    numpy_module = poll_tally.numpy
+    poll_tally.numpy = None
+    pure, pure_secs = timed(ballots.pairwise)
+    print(f"pairwise counts, pure Python: {pure_secs * 1000:.1f} ms")
+    if numpy_module is not None:
+        poll_tally.numpy = numpy_module
+        fast, numpy_secs = timed(ballots.pairwise)
+        assert fast == pure, "NumPy and pure Python pairwise counts differ"
+        print(f"pairwise counts, NumPy:       {numpy_secs * 1000:.1f} ms")
+    else:
+        print("pairwise counts, NumPy:       not installed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Measure the bot's resident memory per 1k guilds under each runtime profile.
+
+Each profile runs in its own process. It builds the bot's client exactly as
+vanvalor-bot.py does, then feeds discord.py's connection state the guilds the
+gateway would send: every guild's channels and roles, and its member list only if
+the Server Members intent is on (--members-intent, as with MEMBERS_INTENT=on; the
+full profile then holds them all once chunking at startup has finished). Then a
+stream of messages goes through the message cache. RSS is read before and after, so
+the difference is what the gateway cache costs, without a real connection.
+
+Usage:
+    python scripts/bench_runtime_profile.py --guilds 1000 --members 200
+    python scripts/bench_runtime_profile.py --guilds 1000 --members 200 --members-intent
+    python scripts/bench_runtime_profile.py --guilds 5000 --members 50 --channels 10
+"""
+import argparse
+import asyncio
+import gc
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs.runtime_profile import PROFILES, client_options  # noqa: E402
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+EXTENSIONS = ("cogs.watchdog", "cogs.reminders", "cogs.polls", "cogs.http_api")
+BOT_USER_ID = 10**17
+
+
+def rss_bytes():
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    # Linux without psutil
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def user(user_id):
+    return {"id": str(user_id), "username": f"player{user_id}", "discriminator": "0",
+            "global_name": f"Player {user_id}", "avatar": "a" * 32, "bot": False}
+
+
+def guild_payload(guild_id, args, members_intent):
+    """A GUILD_CREATE payload. Without the members intent Discord sends only the bot's
+    own member; with it, the full list stands in for what chunking fetches."""
+    base = guild_id * 10**6
+    roles = [{"id": str(guild_id), "name": "@everyone", "permissions": "104324673", "position": 0,
+              "color": 0, "hoist": False, "managed": False, "mentionable": False}]
+    roles += [{"id": str(base + r), "name": f"role-{r}", "permissions": "0", "position": r, "color": 0,
+               "hoist": False, "managed": False, "mentionable": True} for r in range(1, args.roles)]
+    channels = [{"id": str(base + 1000 + c), "type": 0, "name": f"channel-{c}", "position": c,
+                 "permission_overwrites": [], "topic": None, "nsfw": False, "rate_limit_per_user": 0}
+                for c in range(args.channels)]
+    member_ids = [BOT_USER_ID] + [base + 100000 + m for m in range(args.members - 1)] if members_intent else [BOT_USER_ID]
+    members = [{"user": user(member_id), "roles": [str(base + 1 + m % (args.roles - 1))] if args.roles > 1 else [],
+                "joined_at": "2025-01-01T00:00:00+00:00", "deaf": False, "mute": False, "flags": 0}
+               for m, member_id in enumerate(member_ids)]
+    return {"id": str(guild_id), "name": f"guild-{guild_id}", "owner_id": str(base + 100000),
+            "member_count": args.members, "large": args.members > 250, "features": [], "emojis": [],
+            "stickers": [], "roles": roles, "channels": channels, "threads": [], "members": members,
+            "voice_states": [], "presences": [], "premium_tier": 0, "preferred_locale": "en-US"}
+
+
+def message_payload(message_id, guild_id, args):
+    base = guild_id * 10**6
+    author = base + 100000
+    return {"id": str(message_id), "channel_id": str(base + 1000), "guild_id": str(guild_id),
+            "author": user(author), "member": {"roles": [], "joined_at": "2025-01-01T00:00:00+00:00",
+                                               "deaf": False, "mute": False, "flags": 0},
+            "content": "$remind bring snacks at Friday 7pm EST", "timestamp": "2026-01-01T00:00:00+00:00",
+            "edited_timestamp": None, "tts": False, "mention_everyone": False, "mentions": [],
+            "mention_roles": [], "attachments": [], "embeds": [], "pinned": False, "type": 0}
+
+
+async def measure(profile, args):
+    """RSS added by the gateway cache, in bytes, and how many members ended up cached."""
+    import discord
+
+    client = discord.Client(**client_options(profile, EXTENSIONS, args.members_intent))
+    state = client._connection
+    state.user = discord.ClientUser(state=state, data=user(BOT_USER_ID))
+    gc.collect()
+    before = rss_bytes()
+    for i in range(args.guilds):
+        state._add_guild_from_data(guild_payload(1000 + i, args, args.members_intent))
+    for i in range(args.messages):
+        state.parse_message_create(message_payload(10**15 + i, 1000 + i % args.guilds, args))
+    gc.collect()
+    after = rss_bytes()
+    cached = sum(len(g._members) for g in client.guilds)
+    return after - before, cached, len(state._messages or ())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--guilds", type=int, default=1000)
+    parser.add_argument("--members", type=int, default=200, help="members per guild")
+    parser.add_argument("--channels", type=int, default=20, help="text channels per guild")
+    parser.add_argument("--roles", type=int, default=10, help="roles per guild, @everyone included")
+    parser.add_argument("--messages", type=int, default=5000, help="messages received in all")
+    parser.add_argument("--members-intent", action="store_true", help="as with MEMBERS_INTENT=on")
+    parser.add_argument("--profile", choices=PROFILES, help=argparse.SUPPRESS)  # set in each child process
+    args = parser.parse_args()
+
+    if args.profile:
+        grown, members, messages = asyncio.run(measure(args.profile, args))
+        print(grown, members, messages)
+        return
+
+    print(f"{args.guilds} guilds, {args.members} members, {args.channels} channels and {args.roles} roles each; "
+          f"{args.messages} messages received; Server Members intent {'on' if args.members_intent else 'off'}")
+    results = {}
+    for profile in PROFILES:
+        out = subprocess.run([sys.executable, __file__, *sys.argv[1:], "--profile", profile],
+                             capture_output=True, text=True, check=True).stdout.split()
+        grown, members, messages = map(int, out)
+        results[profile] = grown
+        print(f"{profile:>5}: {grown / 2**20:8.1f} MB RSS, {grown / args.guilds * 1000 / 2**20:7.1f} MB per 1k guilds "
+              f"({members} members and {messages} messages cached)")
+    print(f"lean uses {1 - results['lean'] / results['full']:.0%} less")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Time the search index on a large synthetic poll archive.
+
+Builds an index of poll questions and options the way /events search sees them,
+then times loading it back from its journal, single-word, multi-word and prefix
+queries, and incremental updates.
+
+Usage:
+    python scripts/bench_search_index.py --polls 100000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs.search_index import SearchIndex  # noqa: E402
+
+WORDS = ("session campaign dragon tavern dungeon oneshot finale prep character build downtime heist "
+         "crypt siege festival market council voyage ruins forest swamp keep tower guild").split()
+DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+
+
+def make_documents(polls, guilds, seed):
+    rng = random.Random(seed)
+    for i in range(polls):
+        question = f"When can everyone play {' '.join(rng.sample(WORDS, 3))} #{i}?"
+        options = [f"{rng.choice(DAYS)} {rng.randint(1, 12)}pm EST" for _ in range(rng.randint(2, 6))]
+        yield f"poll-{i}", rng.randrange(guilds), None, question, " ".join([question, *options])
+
+
+def timed(fn, *args, repeat=1):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=100_000)
+    parser.add_argument("--guilds", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="vanvalor-search-"), "index.jsonl")
+    index = SearchIndex(path, "Polls")
+    _, build_secs = timed(index.rebuild, make_documents(args.polls, args.guilds, args.seed))
+    print(f"{args.polls} polls, {len(index.postings)} distinct words; built and saved in {build_secs:.2f} s, "
+          f"journal {os.path.getsize(path) / 1024 / 1024:.1f} MB")
+    _, load_secs = timed(SearchIndex, path, "Polls")
+    print(f"loaded from the journal in {load_secs:.2f} s")
+
+    for query in ("dragon", "dragon tavern", "dragon tavern heist", "drag", "saturday 7pm", "nothingmatches"):
+        (docs, total), secs = timed(index.search, query, 0, None, repeat=5)
+        print(f"  {query!r:<24} {secs * 1000:>7.2f} ms  {total} matches in guild 0")
+
+    _, upsert_secs = timed(lambda: [index.upsert(f"new-{i}", 0, None, "x", f"dragon heist {i}")
+                                    for i in range(1000)])
+    _, remove_secs = timed(lambda: [index.remove(f"new-{i}") for i in range(1000)])
+    print(f"upsert {upsert_secs * 1000:.1f} µs, remove {remove_secs * 1000:.1f} µs per document")
+
+
+if __name__ == "__main__":
+    main()
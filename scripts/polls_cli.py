@@ -0,0 +1,103 @@
+"""Import and export polls from the command line, with the bot stopped, and see
+when votes come in.
+
+Rows are validated exactly as `/schedule import` validates them (see cogs/poll_io.py
+for the columns) and every poll is written to the store in one save, so the bot
+schedules them all when it next starts. Channel names can't be looked up offline;
+use channel IDs or <#mentions> in the `channel` column, or pass --channel.
+
+Usage:
+    python scripts/polls_cli.py import polls.csv --guild 123 --channel 456 --creator 789
+    python scripts/polls_cli.py import polls.json --guild 123 --channel 456 --creator 789 --dry-run
+    python scripts/polls_cli.py export --guild 123 --format csv -o polls.csv
+    python scripts/polls_cli.py timing --guild 123 --hours 1 4 12 24
+"""
+import argparse
+import contextlib
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs import poll_io, poll_timeline, polls  # noqa: E402
+
+
+def run_import(cog, args):
+    with open(args.file, "rb") as f:
+        raw = f.read()
+    try:
+        rows = poll_io.read_rows(raw, args.file)
+    except ValueError as e:
+        sys.exit(f"{args.file}: {e}")
+    if not rows:
+        sys.exit(f"{args.file}: no polls to import.")
+
+    datas, errors = cog.validate_import(rows, args.channel)
+    if errors:
+        for number, error in errors:
+            print(f"Row {number}: {error}", file=sys.stderr)
+        sys.exit(f"Nothing imported: {len(errors)} of {len(rows)} row(s) have errors.")
+    if args.dry_run:
+        print(f"All {len(rows)} row(s) are valid.")
+        return
+    poll_ids = cog.create_imported(datas, args.guild, args.channel, args.creator)
+    for poll_id in poll_ids:
+        poll = cog.polls[poll_id]
+        print(f"{poll_id}  {poll.next_send_time.isoformat()}  {poll.question}")
+
+
+def run_export(cog, args):
+    text = poll_io.write_rows(cog.export_rows(args.guild), args.format)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        print(f"Wrote {args.output}")
+    else:
+        sys.stdout.write(text)
+
+
+def run_timing(args):
+    postings, shares = poll_timeline.votes_by_hour(polls.TIMELINES_PATH, args.hours, args.guild)
+    if not postings:
+        sys.exit("No complete vote timelines archived yet.")
+    print(f"{postings} resolved posting(s)")
+    for hours, share in zip(args.hours, shares):
+        print(f"after {hours:>3}h: {share:6.1%} of votes in")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    importer = commands.add_parser("import", help="create polls from a JSON or CSV file")
+    importer.add_argument("file")
+    importer.add_argument("--guild", type=int, required=True, help="guild the polls belong to")
+    importer.add_argument("--channel", type=int, required=True,
+                          help="channel for rows without one; also where polls count as set up")
+    importer.add_argument("--creator", type=int, required=True, help="user ID recorded as each poll's creator")
+    importer.add_argument("--dry-run", action="store_true", help="only check the rows")
+
+    exporter = commands.add_parser("export", help="write a guild's live polls as an import file")
+    exporter.add_argument("--guild", type=int, required=True)
+    exporter.add_argument("--format", choices=("json", "csv"), default="json")
+    exporter.add_argument("-o", "--output", help="file to write; stdout by default")
+
+    timing = commands.add_parser("timing", help="share of votes in after each number of hours, from archived timelines")
+    timing.add_argument("--guild", type=int, help="one guild's polls; all by default")
+    timing.add_argument("--hours", type=int, nargs="+", default=[1, 2, 4, 8, 12, 24])
+
+    args = parser.parse_args()
+    if args.command == "timing":
+        run_timing(args)
+        return
+    # The cog logs as it loads; keep that out of an export written to stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        cog = polls.Polls(None)
+    if args.command == "import":
+        run_import(cog, args)
+    else:
+        run_export(cog, args)
+
+
+if __name__ == "__main__":
+    main()
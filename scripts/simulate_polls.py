@@ -0,0 +1,466 @@
+"""Replay months of recurring polls in seconds on a virtual clock.
+
+Runs the real Polls cog against a fake Discord gateway, driving its
+PollScheduler straight to the next due call instead of waiting. Synthetic voters react
+to every poll that gets posted, so resolution, tiebreakers and recurrence all
+run exactly as they would in production.
+
+Usage:
+    python scripts/simulate_polls.py --polls 50 --weeks 26
+    python scripts/simulate_polls.py --start 2026-03-01 --weeks 12 --seed 7 --verbose
+    python scripts/simulate_polls.py --polls 500 --schedules 10
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta
+
+import discord
+import pytz
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cogs import poll_archive, polls  # noqa: E402
+from cogs.poll_model import poll_from_dict  # noqa: E402
+from cogs.poll_recurrence import compile_recurrence  # noqa: E402
+
+TIMEZONES = ["US/Eastern", "US/Pacific", "Europe/Stockholm", "UTC"]
+DAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+OPTION_LABELS = ["Fri 7pm EST", "Sat 2pm EST", "Sat 7pm EST", "Sun 1pm EST", "Sun 6pm EST"]
+
+
+class VirtualClock:
+    """A clock that only moves when the simulator advances it."""
+
+    def __init__(self, start):
+        self.utc = start
+
+    def now(self, tz=pytz.utc):
+        return self.utc.astimezone(tz)
+
+
+class FakeReaction:
+    def __init__(self, emoji):
+        self.emoji = emoji
+        self.count = 0
+
+
+class FakeMessage:
+    _ids = itertools.count(1)
+
+    def __init__(self, channel, content, embed):
+        self.id = next(self._ids)
+        self.channel = channel
+        self.content = content
+        self.embed = embed
+        self.reactions = []
+
+    async def add_reaction(self, emoji):
+        for reaction in self.reactions:
+            if reaction.emoji == emoji:
+                reaction.count += 1
+                return
+        reaction = FakeReaction(emoji)
+        reaction.count = 1
+        self.reactions.append(reaction)
+
+
+class FakeChannel:
+    def __init__(self, gateway, channel_id, guild):
+        self.gateway = gateway
+        self.id = channel_id
+        self.guild = guild
+        self.messages = {}
+
+    async def send(self, content=None, embed=None):
+        self.gateway.maybe_fail()
+        msg = FakeMessage(self, content, embed)
+        self.messages[msg.id] = msg
+        self.gateway.sent += 1
+        return msg
+
+    async def fetch_message(self, message_id):
+        self.gateway.maybe_fail()
+        return self.messages[message_id]
+
+    def permissions_for(self, member):
+        return FakePermissions()
+
+
+class FakePermissions:
+    read_messages = True
+
+
+class FakeMember:
+    def __init__(self, member_id, bot=False):
+        self.id = member_id
+        self.bot = bot
+
+
+class FakeRole:
+    def __init__(self, members):
+        self.members = members
+
+
+class FakeReactionEvent:
+    """The parts of a discord.RawReactionActionEvent the cog reads."""
+
+    def __init__(self, message_id, user_id, emoji):
+        self.message_id = message_id
+        self.user_id = user_id
+        self.emoji = emoji
+
+
+class FakeScheduledEvent:
+    """The parts of a discord.ScheduledEvent the cog reads and edits."""
+
+    def __init__(self, guild, event_id, creator_id, name, description, start_time, end_time):
+        self.guild_id = guild.id
+        self.id = event_id
+        self.creator_id = creator_id
+        self.name = name
+        self.description = description
+        self.start_time = start_time
+        self.end_time = end_time
+        self.status = discord.EventStatus.scheduled
+
+    async def edit(self, **kwargs):
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+        return self
+
+
+class FakeGuild:
+    def __init__(self, gateway, guild_id):
+        self.gateway = gateway
+        self.id = guild_id
+        self.name = f"sim-guild-{guild_id}"
+        # Every synthetic voter is a member; @everyone polls wait for all of them
+        self.default_role = FakeRole([FakeMember(i) for i in range(1, gateway.voters + 1)])
+        self.chunked = True  # all of them cached, as under the full runtime profile
+        self.events = {}  # event ID -> FakeScheduledEvent
+
+    @property
+    def scheduled_events(self):
+        return list(self.events.values())
+
+    def get_scheduled_event(self, event_id):
+        return self.events.get(event_id)
+
+    def get_role(self, role_id):
+        return None
+
+    async def create_scheduled_event(self, name, description, start_time, end_time, **kwargs):
+        self.gateway.maybe_fail()
+        self.gateway.events_created += 1
+        event_id = 10**12 + self.gateway.events_created
+        event = self.events[event_id] = FakeScheduledEvent(self, event_id, 0, name, description, start_time, end_time)
+        # The event exists now, but the response can still be lost on the way back
+        self.gateway.maybe_fail()
+        return event
+
+
+class SimOutage(ConnectionError):
+    """A transient Discord failure injected by --fail-rate; the outbox retries these
+    for as long as they last."""
+
+
+class FakeGateway:
+    """Stands in for the Discord connection: channels, guilds and voters."""
+
+    def __init__(self, rng, voters, fail_rate=0.0):
+        self.rng = rng
+        self.voters = voters
+        self.fail_rate = fail_rate
+        # Failures are only injected into resolution traffic, not while posting polls
+        self.posting = False
+        self.failures = 0
+        self.guilds = {}
+        self.channels = {}
+        self.sent = 0
+        self.events_created = 0
+
+    def maybe_fail(self):
+        if not self.posting and self.fail_rate and self.rng.random() < self.fail_rate:
+            self.failures += 1
+            raise SimOutage("injected outage")
+
+    def add_guild(self, guild_id):
+        guild = FakeGuild(self, guild_id)
+        self.guilds[guild_id] = guild
+        self.channels[guild_id] = FakeChannel(self, guild_id, guild)
+        return guild
+
+    def cast_votes(self, message, abstain=0.0):
+        """Have every synthetic voter (bar the `abstain` share) react to one or two options.
+        Returns the (voter ID, emoji) reactions cast."""
+        reactions = list(message.reactions)
+        votes = []
+        for voter in range(1, self.voters + 1):
+            if abstain and self.rng.random() < abstain:
+                continue
+            for reaction in self.rng.sample(reactions, k=min(len(reactions), self.rng.choice((1, 1, 2)))):
+                reaction.count += 1
+                votes.append((voter, reaction.emoji))
+        return votes
+
+
+class FakeBot:
+    def __init__(self, gateway):
+        self.gateway = gateway
+        self.user = FakeMember(0, bot=True)
+        self.intents = discord.Intents.default()
+        self.intents.members = True  # as with MEMBERS_INTENT=on, so --early-close can close early
+
+    def get_channel(self, channel_id):
+        return self.gateway.channels.get(channel_id)
+
+    def get_guild(self, guild_id):
+        return self.gateway.guilds.get(guild_id)
+
+
+def random_cron(rng):
+    tz = rng.choice(TIMEZONES)
+    return {
+        "day_of_week": rng.choice(DAYS),
+        "hour": rng.randrange(7, 22),
+        "minute": rng.choice((0, 15, 30, 45)),
+        "timezone": tz,
+    }
+
+
+def sim_option(label, emoji, send_time, tz):
+    """An option with its start time parsed the way the setup form does."""
+    option = {"label": label, "emoji": emoji}
+    start_time, tz_name = polls.parse_option_time(label, send_time, tz)
+    if start_time:
+        option["start_time"], option["timezone"] = start_time.isoformat(), tz_name
+    return option
+
+
+def make_recurring_poll(rng, guild_id, clock, schedules=None, early_close=False, tally_method=None):
+    """Build a recurring poll from the same JSON shape _finalize_poll stores, on one of
+    `schedules` if given or on a schedule of its own."""
+    cron = dict(rng.choice(schedules)) if schedules else random_cron(rng)
+    tz = cron["timezone"]
+    first_send = compile_recurrence(cron).next_fire(clock.now())
+    poll_id = str(uuid.UUID(int=rng.getrandbits(128)))
+    labels = rng.sample(OPTION_LABELS, k=rng.randrange(2, len(OPTION_LABELS) + 1))
+    return poll_id, poll_from_dict({
+        "id": poll_id,
+        "guild_id": guild_id,
+        "channel_id": guild_id,
+        "post_channel_id": guild_id,
+        "creator_id": 1,
+        "question": f"Sim poll {poll_id[:8]}",
+        "options": [sim_option(label, polls.OPTION_EMOJIS[i], first_send, tz) for i, label in enumerate(labels)],
+        "ping_target": "@everyone",
+        "vote_threshold": rng.choice((0, 1, 2)),
+        "schedule_cron": cron,
+        "schedule_timezone": tz,
+        "next_send_time": first_send.isoformat(),
+        "poll_duration_hours": rng.choice((12, 24, 48)),
+        "status": "scheduled",
+        "active_message_id": None,
+        "recurring": True,
+        "created_at": clock.now().isoformat(),
+        "early_close": early_close or None,
+        "tally_method": tally_method,
+    })
+
+
+def wall_clock_drift_minutes(poll, posted_at):
+    """Minutes between when a recurring poll posted and its intended local wall-clock slot."""
+    cron = poll.schedule_cron
+    if not cron:
+        return 0.0
+    local = posted_at.astimezone(pytz.timezone(cron.get("timezone", "US/Eastern")))
+    intended = local.hour * 60 + local.minute - (cron["hour"] * 60 + cron.get("minute", 0))
+    # Fold into [-12h, 12h) so a post just past midnight isn't reported as a day off
+    return float((intended + 720) % 1440 - 720)
+
+
+class WeekStats:
+    def __init__(self, index, start):
+        self.index = index
+        self.start = start
+        self.fired = 0
+        self.posts = 0
+        self.tiebreakers = 0
+        self.max_drift = 0.0
+        self.cpu = 0.0
+        self.jobs = 0
+        self.store = 0
+        self.store_bytes = 0
+        self.archive_bytes = 0
+        self.hours_open = []
+
+
+async def simulate(args):
+    rng = random.Random(args.seed)
+    start = pytz.utc.localize(datetime.fromisoformat(args.start))
+    clock = VirtualClock(start)
+    gateway = FakeGateway(rng, args.voters, args.fail_rate)
+    bot = FakeBot(gateway)
+
+    tmp = tempfile.mkdtemp(prefix="vanvalor-sim-")
+    polls.DATA_PATH = os.path.join(tmp, "polls.json")
+    polls.ARCHIVE_PATH = os.path.join(tmp, "polls_archive.jsonl.gz")
+    polls.OUTBOX_PATH = os.path.join(tmp, "poll_outbox.json")
+    polls.AVAILABILITY_PATH = os.path.join(tmp, "availability.json")
+    polls.SEARCH_INDEX_PATH = os.path.join(tmp, "polls_index.jsonl")
+    polls.EVENTS_PATH = os.path.join(tmp, "poll_events.json")
+    polls.TIMELINES_PATH = os.path.join(tmp, "poll_timelines.jsonl.gz")
+    polls.REACTION_DELAY_SECONDS = 0
+    polls.current_time = clock.now
+
+    cog = polls.Polls(bot)
+    scheduler = cog.scheduler
+    schedules = [random_cron(rng) for _ in range(args.schedules)] if args.schedules else None
+    for i in range(args.polls):
+        guild_id = 1000 + i % args.guilds
+        if guild_id not in gateway.guilds:
+            gateway.add_guild(guild_id)
+        poll_id, poll = make_recurring_poll(rng, guild_id, clock, schedules, args.early_close, args.tally_method)
+        cog.polls[poll_id] = poll
+    cog.save_polls()
+
+    # Cast synthetic votes as soon as each poll message is posted
+    original_post = cog.post_poll
+
+    async def post_and_vote(poll_id):
+        gateway.posting = True
+        try:
+            await original_post(poll_id)
+        finally:
+            gateway.posting = False
+        poll = cog.polls.get(poll_id)
+        if not poll or poll.status != "active":
+            return
+        channel = bot.get_channel(poll.target_channel_id)
+        message = channel.messages[poll.active_message_id]
+        votes = gateway.cast_votes(message, args.abstain if args.early_close else 0.0)
+        # Deliver them as the gateway would, one raw reaction event each
+        for voter, emoji in votes:
+            await cog.on_raw_reaction_add(FakeReactionEvent(message.id, voter, emoji))
+        week.posts += 1
+        if poll.is_tiebreaker:
+            week.tiebreakers += 1
+        else:
+            week.max_drift = max(week.max_drift, abs(wall_clock_drift_minutes(poll, clock.now())))
+
+    original_resolve = cog.resolve_poll
+
+    async def timed_resolve(poll_id):
+        poll = cog.polls.get(poll_id)
+        if poll and not poll.is_tiebreaker:
+            hours = (clock.now() - poll.next_send_time).total_seconds() / 3600
+            week.hours_open.append((hours, hours < poll.poll_duration_hours - 0.01))
+        await original_resolve(poll_id)
+
+    cog.post_poll = post_and_vote
+    scheduler.handlers["send"] = post_and_vote
+    scheduler.handlers["resolve"] = timed_resolve
+
+    end = start + timedelta(weeks=args.weeks)
+    weeks = []
+    week = WeekStats(0, start)
+    cpu_mark = time.process_time()
+    await cog.on_ready()
+
+    def close_week():
+        week.cpu = time.process_time() - cpu_mark
+        week.jobs = len(scheduler)
+        week.store = len(cog.polls)
+        week.store_bytes = os.path.getsize(polls.DATA_PATH) if os.path.exists(polls.DATA_PATH) else 0
+        week.archive_bytes = os.path.getsize(polls.ARCHIVE_PATH) if os.path.exists(polls.ARCHIVE_PATH) else 0
+        weeks.append(week)
+
+    while True:
+        fire_at = scheduler.next_fire_time() or end
+        while fire_at >= week.start + timedelta(weeks=1) and week.start + timedelta(weeks=1) <= end:
+            clock.utc = week.start + timedelta(weeks=1)
+            close_week()
+            cpu_mark = time.process_time()
+            week = WeekStats(week.index + 1, clock.utc)
+        if fire_at >= end:
+            break
+        clock.utc = max(clock.utc, fire_at)
+        week.fired += await scheduler.run_due()
+
+    return weeks, cog, gateway
+
+
+def print_report(args, weeks, cog, gateway):
+    scheduler = cog.scheduler
+    print(f"Simulated {args.polls} recurring polls across {args.guilds} guild(s) "
+          f"for {args.weeks} weeks from {args.start} (seed {args.seed})")
+    print(f"{'week':>4}  {'starting':<10}  {'fired':>5}  {'posts':>5}  {'tiebrk':>6}  "
+          f"{'jobs':>5}  {'store':>6}  {'store KB':>8}  {'arch KB':>7}  {'drift min':>9}  {'cpu ms':>7}")
+    for w in weeks:
+        print(f"{w.index + 1:>4}  {w.start.date().isoformat():<10}  {w.fired:>5}  {w.posts:>5}  "
+              f"{w.tiebreakers:>6}  {w.jobs:>5}  {w.store:>6}  {w.store_bytes / 1024:>8.1f}  {w.archive_bytes / 1024:>7.1f}  "
+              f"{w.max_drift:>9.0f}  {w.cpu * 1000:>7.1f}")
+    total_cpu = sum(w.cpu for w in weeks)
+    print(f"Jobs added: {scheduler.added}, fired: {scheduler.fired}, messages sent: {gateway.sent}, "
+          f"events created: {gateway.events_created}, shared cron schedules: {scheduler.stats()['cron_groups']}, "
+          f"CPU: {total_cpu:.2f}s")
+    guild_stats = cog.analytics.guilds.values()
+    print(f"Postings counted in /events stats: {sum(g['postings'] for g in guild_stats)}, "
+          f"went to a tiebreaker: {sum(g['outcomes'].get('tie', 0) for g in guild_stats)}, "
+          f"tiebreakers counted: {sum(sum(g['tiebreakers'].values()) for g in guild_stats)}")
+    timelines = list(poll_archive.iter_archive(polls.TIMELINES_PATH))
+    print(f"Vote timelines archived: {len(timelines)}, "
+          f"{os.path.getsize(polls.TIMELINES_PATH) / len(timelines) if timelines else 0:.0f} bytes each on disk, "
+          f"votes logged: {sum(t['hourly'][-1] for t in timelines)}, "
+          f"still in memory: {len(cog.timelines)}")
+    if args.early_close:
+        hours_open = [entry for w in weeks for entry in w.hours_open]
+        early = sum(1 for _, closed_early in hours_open if closed_early)
+        print(f"Polls resolved: {len(hours_open)}, closed early: {early}, "
+              f"mean hours open: {sum(h for h, _ in hours_open) / max(len(hours_open), 1):.1f}")
+    if args.fail_rate:
+        print(f"Injected failures: {gateway.failures}, outbox retries: {cog.outbox.retried}, "
+              f"given up: {len(cog.outbox.failed)}, still pending: {len(cog.outbox)}")
+        events = Counter((e.description, e.start_time) for g in gateway.guilds.values() for e in g.events.values())
+        print(f"Duplicate server events: {sum(n - 1 for n in events.values())}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=50, help="number of recurring polls")
+    parser.add_argument("--guilds", type=int, default=5, help="number of guilds to spread polls over")
+    parser.add_argument("--schedules", type=int, default=0,
+                        help="draw every poll's schedule from this many shared ones (default: one each)")
+    parser.add_argument("--voters", type=int, default=5, help="synthetic voters per poll")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="chance each Discord call made while resolving a poll fails transiently")
+    parser.add_argument("--early-close", action="store_true",
+                        help="make every poll close early once all its voters have voted")
+    parser.add_argument("--abstain", type=float, default=0.2,
+                        help="with --early-close, the chance each voter sits a poll out")
+    parser.add_argument("--tally-method", choices=polls.TALLY_METHODS,
+                        help="count every poll this way instead of by raw reaction counts")
+    parser.add_argument("--weeks", type=int, default=26, help="number of weeks to simulate")
+    parser.add_argument("--start", default="2026-01-05", help="UTC start date (spans both DST transitions by default)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--verbose", action="store_true", help="show the cog's own log output")
+    args = parser.parse_args()
+
+    sink = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    with sink:
+        weeks, cog, gateway = asyncio.run(simulate(args))
+    print_report(args, weeks, cog, gateway)
+
+
+if __name__ == "__main__":
+    main()
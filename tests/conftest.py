@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The cogs import each other as `cogs.<module>`, so run from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,33 @@
+from cogs import poll_archive
+
+
+def _polls(start, count, guild_id=1):
+    return [{"id": str(i), "guild_id": guild_id} for i in range(start, start + count)]
+
+
+def test_truncated_member_hides_nothing_after_it(tmp_path, capsys):
+    path = str(tmp_path / "archive.jsonl.gz")
+    poll_archive.append_polls(path, _polls(0, 3))
+    poll_archive.append_polls(path, _polls(3, 50))
+    with open(path, "rb+") as f:  # a crash part-way through the second append
+        f.truncate(f.seek(0, 2) - 40)
+    poll_archive.append_polls(path, _polls(53, 2))
+    poll_archive.append_polls(path, _polls(55, 2, guild_id=2))
+
+    assert [p["id"] for p in poll_archive.iter_archive(path)] == ["0", "1", "2", "53", "54", "55", "56"]
+    assert "[Archive] Skipped" in capsys.readouterr().out
+    assert poll_archive.read_page(path, 1, 2, 2) == ([{"id": "2", "guild_id": 1}, {"id": "53", "guild_id": 1}], True)
+    assert [p["id"] for p in poll_archive.iter_archive(path, guild_id=2)] == ["55", "56"]
+
+
+def test_partial_member_at_the_end(tmp_path, capsys):
+    path = str(tmp_path / "archive.jsonl.gz")
+    poll_archive.append_polls(path, _polls(0, 2))
+    with open(path, "ab") as f:
+        f.write(b"\x1f\x8b\x08\x00")
+    assert [p["id"] for p in poll_archive.iter_archive(path)] == ["0", "1"]
+    assert "Skipped 4 damaged bytes" in capsys.readouterr().out
+
+
+def test_missing_archive(tmp_path):
+    assert list(poll_archive.iter_archive(str(tmp_path / "none.gz"))) == []
@@ -0,0 +1,41 @@
+from datetime import datetime
+
+import pytest
+
+from cogs import polls
+
+
+@pytest.fixture
+def cog(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    return polls.Polls(None)
+
+
+def _row(**fields):
+    return {"question": "Game night?", "options": "Sat 7pm, Sun 7pm", "channel": "456", **fields}
+
+
+def test_row_timezone_applies_to_send_time_options_and_repeat(cog):
+    rows = [_row(send_time="2026-11-02 09:00", timezone="Europe/Stockholm", repeat="every Monday at 9am")]
+    (data,), errors = cog.validate_import(rows, 456)
+    assert not errors
+    assert data["timezone"] == "Europe/Stockholm"
+    assert data["send_time_parsed"] == "2026-11-02T09:00:00+01:00"
+    assert data["recurrence"]["timezone"] == "Europe/Stockholm"
+    for start_time, tz_name in data["option_times"]:
+        assert tz_name == "Europe/Stockholm"
+        assert datetime.fromisoformat(start_time).hour == 19
+
+
+def test_zone_named_in_send_time_wins(cog):
+    (data,), errors = cog.validate_import([_row(send_time="2026-11-02 09:00 EST", timezone="Europe/Stockholm")], 456)
+    assert not errors
+    assert data["timezone"] == "US/Eastern"
+    assert datetime.fromisoformat(data["send_time_parsed"]).utcoffset().total_seconds() == 3600
+    assert datetime.fromisoformat(data["send_time_parsed"]).hour == 15
+
+
+def test_unknown_row_timezone(cog):
+    _, errors = cog.validate_import([_row(send_time="2026-11-02 09:00", timezone="Mars/Olympus")], 456)
+    assert errors == [(1, "Unknown timezone \"Mars/Olympus\".")]
@@ -0,0 +1,25 @@
+import asyncio
+from datetime import datetime
+
+import pytz
+
+from cogs.poll_outbox import Outbox
+
+
+def test_overlapping_drains_run_each_entry_once(tmp_path):
+    calls = []
+
+    async def post(entry):
+        calls.append(entry["key"])
+        await asyncio.sleep(0.01)  # waiting on Discord
+
+    async def main():
+        outbox = Outbox(str(tmp_path / "outbox.json"), {"results": post}, lambda: datetime.now(pytz.utc))
+        outbox.add("poll:0:results", "results", "poll")
+        outbox.add("other:0:results", "results", "other")
+        return outbox, await asyncio.gather(outbox.drain(), outbox.drain())
+
+    outbox, results = asyncio.run(main())
+    assert sorted(calls) == ["other:0:results", "poll:0:results"]
+    assert results == [(2, 0, 0), (0, 0, 0)]
+    assert not outbox.entries and set(outbox.done) == set(calls)
@@ -0,0 +1,27 @@
+from types import SimpleNamespace
+
+import pytest
+
+from cogs import reminders
+
+GUILD, CHANNEL = 1, 5
+WEEKLY = {"day_of_week": "mon,tue,wed,thu,fri", "hour": 18, "minute": 0, "timezone": "America/Argentina/Buenos_Aires",
+          "interval_weeks": 3, "exclude": [f"2027-{m:02d}-{d:02d}" for m in range(1, 13) for d in (1, 15)]}
+
+
+@pytest.fixture
+def cog(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data").mkdir()
+    return reminders.Reminders(None)
+
+
+@pytest.mark.parametrize("due, repeat", [(None, None), (4102444800, None), (4102444800, WEEKLY)])
+def test_full_page_of_longest_reminders_fits_one_message(cog, due, repeat):
+    for _ in range(reminders.PAGE_SIZE * 1000 + 1):
+        cog.store.add(GUILD, CHANNEL, 9, "x" * 1900, due=due, repeat=repeat)
+    ctx = SimpleNamespace(guild=SimpleNamespace(id=GUILD), channel=SimpleNamespace(id=CHANNEL))
+    for page in (1, 1000):
+        output = cog.format_page(ctx, page)
+        assert output.count("\n`#") == reminders.PAGE_SIZE
+        assert len(output) <= reminders.MESSAGE_LIMIT
@@ -1,33 +1,32 @@
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
 import os
 
+from cogs import runtime_profile
+
 load_dotenv()
 BOT_TOKEN = os.getenv("DISCORD_BOT_TOKEN")
+# "lean" trims intents and turns off the member and message caches; see cogs/runtime_profile.py
+RUNTIME_PROFILE = os.getenv("RUNTIME_PROFILE", "full").lower()
+# The privileged Server Members intent, for polls that close early; enable it in the Developer Portal first
+MEMBERS_INTENT = os.getenv("MEMBERS_INTENT", "off").lower() in ("1", "true", "yes", "on")
 
-# Set up discord intents
-intents = discord.Intents.default()
-intents.message_content = True
-intents.reactions = True
-intents.guild_scheduled_events = True
+# Loaded in this order; the watchdog first, so stalls while the others load their data are caught too
+EXTENSIONS = ("cogs.watchdog", "cogs.reminders", "cogs.polls", "cogs.http_api")
 
 # Set up bot with command prefix (kept for legacy reminder commands)
-bot = commands.Bot(command_prefix='$', intents=intents)
-
-# Set up scheduler with generous misfire grace time so jobs that fire
-# slightly late (e.g. during bot startup) still run instead of being skipped
-scheduler = AsyncIOScheduler(job_defaults={'misfire_grace_time': 300})
-bot.scheduler = scheduler
+bot = commands.Bot(command_prefix='$', **runtime_profile.client_options(RUNTIME_PROFILE, EXTENSIONS, MEMBERS_INTENT))
+print(f"Using the {RUNTIME_PROFILE} runtime profile"
+      f"{' with the Server Members intent' if MEMBERS_INTENT else ''}.")
 
 # Ensure data directory exists
 os.makedirs("data", exist_ok=True)
 
 
 async def load_extensions():
-    await bot.load_extension("cogs.reminders")
-    await bot.load_extension("cogs.polls")
+    for extension in EXTENSIONS:
+        await bot.load_extension(extension)
 
 
 @bot.tree.command(name="help", description="Show how to use the Vanvalor bot")
@@ -41,18 +40,14 @@ async def help_command(interaction: discord.Interaction):
     embed.add_field(
         name="Scheduled Polls",
         value=(
-            "`/schedule poll` - Create a new scheduled poll\n"
-            "`/schedule cancel` - Cancel poll creation in progress\n\n"
-            "The bot will walk you through 9 steps:\n"
-            "1. Poll question\n"
-            "2. Response options (comma-separated)\n"
-            "3. Who to ping\n"
-            "4. Which channel to post in\n"
-            "5. When to send the poll\n"
-            "6. Repeat schedule (or none)\n"
-            "7. How long voting stays open\n"
-            "8. Minimum votes per option\n"
-            "9. Confirm and schedule"
+            "`/schedule poll` - Create a new scheduled poll (`suggest:True` starts with the times most members are free)\n"
+            "`/schedule cancel` - Cancel poll creation in progress\n"
+            "`/schedule import <file>` - Create many polls from a JSON or CSV file (Manage Server)\n\n"
+            "Setup takes two steps:\n"
+            "1. Fill in the form: question, options, send time, repeat schedule and voting duration\n"
+            "2. Pick the channel, who to ping and the minimum votes per option, then press **Confirm**\n"
+            "Turn on **Close early** to resolve as soon as everyone pinged has voted, "
+            "or change **Count** to rank voters' choices by the order they react in"
         ),
         inline=False,
     )
@@ -75,9 +70,26 @@ async def help_command(interaction: discord.Interaction):
         name="Manage Polls",
         value=(
             "`/events list` - View all scheduled polls\n"
+            "`/events history` - Browse archived polls\n"
+            "`/events search <query>` - Find polls (and this channel's reminders) by question or option\n"
+            "`/events export` - Download this server's polls as a file `/schedule import` accepts\n"
+            "`/events stats` - See when polls land, how many vote, and how often sessions fall through\n"
             "`/events delete <id>` - Delete a poll\n"
-            "`/events modify <id>` - Edit a poll (type \"keep\" to skip a step)\n"
-            "`/events clone <id>` - Copy a poll as a starting point for a new one"
+            "`/events modify <id>` - Edit a poll (the form opens with its current values)\n"
+            "`/events clone <id>` - Copy a poll as a starting point for a new one\n"
+            "`/events reconcile` - Fix polls that aren't queued to post or close (Manage Server)\n"
+            "`/stalls` - Show what has recently frozen the bot, if anything (Manage Server)"
+        ),
+        inline=False,
+    )
+
+    embed.add_field(
+        name="Availability",
+        value=(
+            "`/availability set <times>` - Share when you're usually free (e.g., \"Fri 7pm-11pm, Sat 12-6pm EST\")\n"
+            "`/availability show [member]` - See when you or someone else is free\n"
+            "`/availability clear` - Forget your availability\n"
+            "`/availability suggest` - Find the times that suit the most members"
         ),
         inline=False,
     )
@@ -86,8 +98,11 @@ async def help_command(interaction: discord.Interaction):
         name="Reminders",
         value=(
             "`$remind <text>` - Add a reminder\n"
-            "`$list` - View all reminders\n"
-            "`$delete <number>` - Delete a reminder by number"
+            "`$remind <text> at <time>` - Get pinged at a time (e.g., \"at Friday 7pm EST\", \"in 2 hours\")\n"
+            "`$remind <text> every <schedule>` - Get pinged on a repeat (e.g., \"every Friday at 6pm\")\n"
+            "`$list [page]` - View this channel's reminders\n"
+            "`$delete <number>` - Delete a reminder by the number shown in `$list`\n"
+            "`$search <words>` - Find reminders and polls containing those words"
         ),
         inline=False,
     )
@@ -97,6 +112,8 @@ async def help_command(interaction: discord.Interaction):
         value=(
             "- All times are shown in your local timezone automatically\n"
             "- Use natural language for times (e.g., \"Monday at 9am EST\", \"in 2 hours\")\n"
+            "- Repeats can span several days, skip weeks or dates, or run monthly "
+            "(e.g., \"every other Friday at 7pm\", \"first Monday of every month at 9am except Jan 5\")\n"
             "- You can run multiple polls at once\n"
             "- Poll IDs are shown as 8-character codes in `/events list`"
         ),
@@ -114,10 +131,6 @@ async def on_ready():
         bot.tree.copy_global_to(guild=guild)
         await bot.tree.sync(guild=guild)
         print(f"Slash commands synced to {guild.name}.")
-    # Start scheduler
-    if not scheduler.running:
-        scheduler.start()
-        print("Scheduler started.")
 
 
 import asyncio